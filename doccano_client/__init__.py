@@ -1,3 +1,6 @@
 from doccano_client.client import DoccanoClient
+from doccano_client.utils.cache import DiskCache, MemoryCache
+from doccano_client.utils.instrumentation import RequestHook, StatsCollector
+from doccano_client.utils.retry import RetryPolicy
 
-__all__ = ["DoccanoClient"]
+__all__ = ["DoccanoClient", "DiskCache", "MemoryCache", "RequestHook", "RetryPolicy", "StatsCollector"]
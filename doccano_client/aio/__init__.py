@@ -0,0 +1,3 @@
+from doccano_client.aio.client import AsyncDoccanoClient
+
+__all__ = ["AsyncDoccanoClient"]
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import secrets
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+import httpx
+
+from doccano_client.exceptions import DoccanoAPIError
+from doccano_client.repositories.base import get_next_url
+from doccano_client.utils.concurrency import async_ordered_map
+from doccano_client.utils.instrumentation import RequestEvent, RequestHook
+from doccano_client.utils.retry import RetryPolicy
+
+
+def verbose_raise_for_status(response: httpx.Response) -> httpx.Response:
+    """Output a bad response's text before raising for verbosity, return response otherwise.
+
+    Args:
+        response (httpx.Response): The response to raise for status
+
+    Returns:
+        httpx.Response: The response
+
+    Raises:
+        DoccanoAPIError: if request raises HTTPStatusError.
+    """
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as err:
+        # the error only reads the status, the text and the JSON body, which httpx responses provide too
+        raise DoccanoAPIError(str(err), err.response)  # type: ignore[arg-type]
+    return response
+
+
+def multipart_headers() -> Dict[str, str]:
+    """Return headers that override the session's json content type for a multipart upload.
+
+    httpx only derives the multipart boundary from an explicit content type,
+    so a fresh boundary is generated here.
+
+    Returns:
+        Dict[str, str]: The headers to pass with the upload request
+    """
+    return {"Content-Type": f"multipart/form-data; boundary={secrets.token_hex(16)}"}
+
+
+class AsyncBaseRepository:
+    """Base repository for interacting with the Doccano API asynchronously"""
+
+    def __init__(
+        self,
+        base_url: str,
+        verify: Optional[str | bool] = None,
+        max_connections: int = 100,
+        retry_policy: Optional[RetryPolicy] = None,
+        page_size: Optional[int] = None,
+        hooks: Optional[Iterable[RequestHook]] = None,
+    ) -> None:
+        """Initialize the repository with the base url
+
+        Args:
+            base_url (str): The base url of the Doccano instance
+            verify (str | bool): Either a boolean, in which case it controls whether we verify
+                the server's TLS certificate, or a string, in which case it must be a path
+                to a CA bundle to use. Defaults to ``True``.
+            max_connections (int): The maximum number of concurrent connections to the server.
+                Requests beyond this limit wait for a free connection. Defaults to 100.
+            retry_policy (RetryPolicy, optional): The policy for retrying requests rejected by an
+                overloaded server. Defaults to None, which retries idempotent requests up to 3 times
+                on 429, 502 and 503.
+            page_size (int, optional): The default number of items requested per page by list
+                endpoints. Defaults to None, which uses the server's page size.
+            hooks (Iterable[RequestHook], optional): The hooks called before each request and after its
+                response or error, e.g. a StatsCollector. More can be appended to the hooks attribute.
+                Defaults to None.
+        """
+        self._base_url = base_url.rstrip("/")
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.page_size = page_size
+        self.hooks: List[RequestHook] = list(hooks or [])
+        headers = {
+            "content-type": "application/json",
+            "accept": "application/json",
+            "referer": base_url,
+        }
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self._session = httpx.AsyncClient(
+            headers=headers,
+            verify=verify if verify is not None else True,
+            limits=limits,
+            timeout=None,
+        )
+
+    @property
+    def login_url(self) -> str:
+        """Retrieve an API login url based on the base_url
+
+        Returns:
+            str: The login url
+        """
+        return f"{self.api_url}/auth/login/"
+
+    @property
+    def api_url(self) -> str:
+        """Retrieve an API url based on the base_url
+
+        Returns:
+            str: The API url
+        """
+        return f"{self._base_url}/v1"
+
+    def _build_url(self, resource: str) -> str:
+        """Build an absolute url for the resource
+
+        Args:
+            resource (str): The resource relative to the API url, or an absolute url
+
+        Returns:
+            str: The absolute url
+        """
+        if resource.startswith(self.api_url):
+            resource = resource[len(self.api_url) + 1 :]
+        elif resource.startswith(("http://", "https://")):
+            return resource
+        return f"{self.api_url}/{resource}"
+
+    async def login(self, username: str, password: str) -> None:
+        """Login to a session with the Doccano instance related to the base url
+
+        Args:
+            username (str): The username of the user
+            password (str): The password of the user
+        """
+        response = await self._session.post(self.login_url, json={"username": username, "password": password})
+        verbose_raise_for_status(response)
+        self._session.headers.update({"X-CSRFToken": self._session.cookies.get("csrftoken") or ""})
+
+    async def logout(self) -> None:
+        """Logout of the session"""
+        url = f"{self.api_url}/auth/logout/"
+        response = await self._session.post(url)
+        verbose_raise_for_status(response)
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying connection pool"""
+        await self._session.aclose()
+
+    async def request(self, method: str, resource: str, **kwargs) -> httpx.Response:
+        """Make a request to the Doccano API, retrying it according to the retry policy
+
+        Args:
+            method (str): The HTTP method
+            resource (str): The resource to request. Absolute urls under the API url are accepted.
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            httpx.Response: The response from the API
+        """
+        url = self._build_url(resource)
+        if not self.hooks:
+            return verbose_raise_for_status(await self._send(method, url, **kwargs))
+        event = RequestEvent(method, url[len(self.api_url) + 1 :])
+        for hook in self.hooks:
+            hook.before_request(event)
+        try:
+            response = verbose_raise_for_status(await self._send(method, url, **kwargs))
+        except Exception as err:
+            error_response = getattr(err, "response", None)
+            event.finish(getattr(error_response, "status_code", None), error=err)
+            for hook in self.hooks:
+                hook.on_error(event)
+            raise
+        event.finish(response.status_code, len(response.content))
+        for hook in self.hooks:
+            hook.after_response(event)
+        return response
+
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request, retrying it according to the retry policy
+
+        Args:
+            method (str): The HTTP method
+            url (str): The absolute url
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            httpx.Response: The last response, whatever its status
+        """
+        attempt = 1
+        while True:
+            response = await self._session.request(method, url, **kwargs)
+            if not self.retry_policy.should_retry(method, response, attempt):
+                return response
+            await asyncio.sleep(self.retry_policy.delay(response, attempt))
+            attempt += 1
+
+    @contextlib.asynccontextmanager
+    async def stream(self, method: str, resource: str, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Make a request to the Doccano API without reading the response body up front
+
+        Args:
+            method (str): The HTTP method
+            resource (str): The resource to request
+            kwargs: Additional arguments to pass to the request
+
+        Yields:
+            httpx.Response: The response from the API, whose body can be iterated
+        """
+        async with self._session.stream(method, self._build_url(resource), **kwargs) as response:
+            if response.is_error:
+                await response.aread()
+            verbose_raise_for_status(response)
+            yield response
+
+    async def get(self, resource: str, **kwargs) -> httpx.Response:
+        """Make a get request to the Doccano API
+
+        Args:
+            resource (str): The resource to get
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            httpx.Response: The response from the API
+        """
+        return await self.request("GET", resource, **kwargs)
+
+    async def paginate(
+        self,
+        resource: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_workers: int = 1,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over the results of a paginated list endpoint
+
+        With a single worker the "next" links are followed one page at a time. With more
+        workers the total count is read from the first page, and the remaining pages are
+        fetched concurrently by limit/offset while still being yielded in order.
+
+        Args:
+            resource (str): The list resource to get
+            params (Dict[str, Any], optional): The query parameters of the request. Defaults to None.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the page size of the repository.
+
+        Yields:
+            Dict[str, Any]: The next item of the results.
+        """
+        params = dict(params or {})
+        page_size = page_size or self.page_size
+        if page_size:
+            params["limit"] = page_size
+        response = await self.get(resource, params=params)
+        page = response.json()
+        for item in page["results"]:
+            yield item
+        if page["next"] is None:
+            return
+
+        if max_workers <= 1:
+            # the url without the query string, so that the next url can be rebased onto it
+            initial_url = str(response.url.copy_with(query=None))
+            while True:
+                next_url = get_next_url(self.api_url, initial_url, page)
+                if next_url is None:
+                    break
+                page = (await self.get(next_url)).json()
+                for item in page["results"]:
+                    yield item
+            return
+
+        # the server may cap the requested limit, so the first page tells the actual page size
+        limit = len(page["results"])
+
+        async def fetch(offset: int) -> Dict[str, Any]:
+            return (await self.get(resource, params={**params, "limit": limit, "offset": offset})).json()
+
+        async for page in async_ordered_map(fetch, range(limit, page["count"], limit), max_workers):
+            for item in page["results"]:
+                yield item
+
+    async def post(self, resource: str, **kwargs) -> httpx.Response:
+        """Make a post request to the Doccano API
+
+        Args:
+            resource (str): The resource to post
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            httpx.Response: The response from the API
+        """
+        return await self.request("POST", resource, **kwargs)
+
+    async def put(self, resource: str, **kwargs) -> httpx.Response:
+        """Make a put request to the Doccano API
+
+        Args:
+            resource (str): The resource to put
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            httpx.Response: The response from the API
+        """
+        return await self.request("PUT", resource, **kwargs)
+
+    async def patch(self, resource: str, **kwargs) -> httpx.Response:
+        """Make a patch request to the Doccano API
+
+        Args:
+            resource (str): The resource to patch
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            httpx.Response: The response from the API
+        """
+        return await self.request("PATCH", resource, **kwargs)
+
+    async def delete(self, resource: str, **kwargs) -> httpx.Response:
+        """Make a delete request to the Doccano API
+
+        Args:
+            resource (str): The resource to delete
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            httpx.Response: The response from the API
+        """
+        return await self.request("DELETE", resource, **kwargs)
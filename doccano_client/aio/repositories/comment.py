@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import AsyncIterator, List, Optional
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.models.comment import Comment
+from doccano_client.repositories.comment import CommentCalls
+
+
+class CommentRepository:
+    """Repository for interacting with the Doccano comment API asynchronously"""
+
+    resource_type = CommentCalls.resource_type
+
+    def __init__(self, client: AsyncBaseRepository, trusted: bool = False):
+        """Initialize the repository
+
+        Args:
+            client (AsyncBaseRepository): The client sending the requests
+            trusted (bool): Whether to build comments from responses without validating them. Defaults to False.
+        """
+        self._client = client
+        self._calls = CommentCalls(trusted)
+
+    async def find_by_id(self, project_id: int, comment_id: int) -> Comment:
+        """Find a comment by id
+
+        Args:
+            project_id (int): The id of the project
+            comment_id (int): The id of the comment to find
+
+        Returns:
+            Comment: The found comment
+        """
+        return await self._calls.find_by_id(project_id, comment_id).asend(self._client)
+
+    async def list(
+        self,
+        project_id: int,
+        example_id: Optional[int] = None,
+        query: str = "",
+        max_workers: int = 1,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[Comment]:
+        """Return all comments in which you are a member
+
+        Args:
+            project_id (int): The id of the project
+            example_id (Optional[int], optional): The id of the example. Defaults to None.
+            query (str): The query to search. Defaults to None.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
+
+        Yields:
+            Comment: The list of the comments.
+        """
+        call = self._calls.list(project_id, example_id, query)
+        async for comment in call.asend(self._client, max_workers, page_size):
+            yield comment
+
+    async def create(self, project_id: int, comment: Comment) -> Comment:
+        """Create a new comment
+
+        Args:
+            project_id (int): The id of the project
+            comment (Comment): The comment to create
+
+        Returns:
+            Comment: The created comment
+        """
+        return await self._calls.create(project_id, comment).asend(self._client)
+
+    async def update(self, project_id: int, comment: Comment) -> Comment:
+        """Update a comment
+
+        Args:
+            project_id (int): The id of the project
+            comment (Comment): The comment to update
+
+        Returns:
+            Comment: The updated comment
+        """
+        return await self._calls.update(project_id, comment).asend(self._client)
+
+    async def delete(self, project_id: int, comment: Comment | int):
+        """Delete a comment
+
+        Args:
+            project_id (int): The id of the project
+            comment (Comment | int): The comment to delete
+        """
+        await self._calls.delete(project_id, comment).asend(self._client)
+
+    async def bulk_delete(self, project_id: int, comments: List[int] | List[Comment]):
+        """Bulk delete comments
+
+        Args:
+            project_id (int): The id of the project
+            comments (List[int] | List[Comment]): The list of comment ids to delete
+        """
+        await self._calls.bulk_delete(project_id, comments).asend(self._client)
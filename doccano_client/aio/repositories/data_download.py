@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pathlib
+from typing import List
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.models.data_download import Option
+from doccano_client.repositories.data_download import DataDownloadCalls, file_name
+
+
+class DataDownloadRepository:
+    """Repository for interacting with the Doccano data download API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository):
+        self._client = client
+        self._calls = DataDownloadCalls()
+
+    async def list_options(self, project_id: int) -> List[Option]:
+        """Return all download options
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            List[Option]: The list of the download options.
+        """
+        return await self._calls.list_options(project_id).asend(self._client)
+
+    async def find_option_by_name(self, project_id: int, name: str) -> Option:
+        """Find a download option by name
+
+        Args:
+            project_id (int): The id of the project
+            name (str): The name of the download option to find
+
+        Returns:
+            Option: The found download option
+
+        Raises:
+            ValueError: If the download option is not found
+        """
+        return await self._calls.find_option_by_name(project_id, name).asend(self._client)
+
+    async def schedule_download(self, project_id: int, option: Option, only_approved=False) -> str:
+        """Schedule a download
+
+        Args:
+            project_id (int): The id of the project
+            option (Option): The download option
+            only_approved (bool): Whether to download approved data only
+
+        Returns:
+            str: The celery task id
+        """
+        return await self._calls.schedule_download(project_id, option, only_approved).asend(self._client)
+
+    async def download(self, project_id: int, task_id: str, dir_name=".") -> pathlib.Path:
+        """Download a file from the server
+
+        Args:
+            project_id (int): The id of the project
+            task_id (str): The celery task id
+            dir_name (str): The directory to save the file
+
+        Returns:
+            pathlib.Path: The path to the downloaded file
+        """
+        resource = f"projects/{project_id}/download"
+        params = {"taskId": task_id}
+        async with self._client.stream("GET", resource, params=params) as response:
+            dir_path = pathlib.Path(dir_name)
+            dir_path.mkdir(parents=True, exist_ok=True)
+            file_path = dir_path / file_name(response.headers)
+            with file_path.open("wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size=8192):
+                    f.write(chunk)
+        return file_path
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pathlib
+from typing import List
+
+from doccano_client.aio.repositories.base import (
+    AsyncBaseRepository,
+    multipart_headers,
+)
+from doccano_client.models.data_upload import Option, Task
+from doccano_client.repositories.data_upload import DataUploadCalls
+
+
+class DataUploadRepository:
+    """Repository for interacting with the Doccano data upload API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository):
+        self._client = client
+        self._calls = DataUploadCalls()
+
+    async def list_options(self, project_id: int) -> List[Option]:
+        """Return all upload options
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            List[Option]: The list of the upload options.
+        """
+        return await self._calls.list_options(project_id).asend(self._client)
+
+    async def upload(self, file_path: str) -> str:
+        """Upload a file to the server
+
+        Args:
+            file_path (str): The path to the file to upload
+
+        Returns:
+            str: The id of the uploaded file
+        """
+        resource = "fp/process/"
+        path = pathlib.Path(file_path)
+        with path.open("rb") as f:
+            headers = {**multipart_headers(), "Accept": "*/*"}
+            response = await self._client.post(resource, files={"filepond": (path.name, f)}, headers=headers)
+            return response.content.decode()
+
+    async def delete(self, upload_id: str):
+        """Delete the uploaded file from the server
+
+        Args:
+            upload_id (str): The id of the uploaded file
+        """
+        resource = "fp/revert/"
+        headers = {"Content-Type": "text/plain", "Accept": "*/*"}
+        await self._client.delete(resource, content=upload_id, headers=headers)
+
+    async def ingest(self, project_id: int, upload_ids: List[str], task: Task, format: str, **kwargs) -> str:
+        """Ingest the uploaded files into the project
+
+        Args:
+            project_id (int): The id of the project
+            upload_ids (List[str]): The ids of the uploaded files
+            task (Task): The project's task name
+            format (str): The format of the uploaded files
+            **kwargs: Additional keyword arguments like column_data and column_label
+
+        Returns:
+            str: The celery task id
+        """
+        return await self._calls.ingest(project_id, upload_ids, task, format, **kwargs).asend(self._client)
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from pydantic import ValidationError
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.exceptions import DoccanoAPIError
+from doccano_client.models.bulk import BulkItemResult
+from doccano_client.models.example import Example
+from doccano_client.repositories.example import ExampleCalls
+from doccano_client.utils.concurrency import async_ordered_map
+
+
+class ExampleRepository:
+    """Repository for interacting with the Doccano example API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository, trusted: bool = False):
+        """Initialize the repository
+
+        Args:
+            client (AsyncBaseRepository): The client sending the requests
+            trusted (bool): Whether to build examples from responses without validating them. Defaults to False.
+        """
+        self._client = client
+        self._calls = ExampleCalls(trusted)
+
+    async def find_by_id(self, project_id: int, example_id: int) -> Example:
+        """Find a example by id
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example to find
+
+        Returns:
+            Example: The found example
+        """
+        return await self._calls.find_by_id(project_id, example_id).asend(self._client)
+
+    async def count(self, project_id: int) -> int:
+        """Count the number of examples
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            int: The number of examples
+        """
+        return await self._calls.count(project_id).asend(self._client)
+
+    async def find_latest(self, project_id: int) -> Optional[Example]:
+        """Find the most recently created example
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            Optional[Example]: The latest example, or None if the project has no example
+        """
+        return await self._calls.find_latest(project_id).asend(self._client)
+
+    async def list(
+        self,
+        project_id: int,
+        is_confirmed: Optional[bool] = None,
+        max_workers: int = 1,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[Example]:
+        """Return all examples in which you are a member
+
+        Args:
+            project_id (int): The id of the project
+            is_confirmed (bool, optional): Filter by confirmed state. Defaults to None.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
+
+        Yields:
+            Example: The next example.
+        """
+        async for example in self._calls.list(project_id, is_confirmed).asend(self._client, max_workers, page_size):
+            yield example
+
+    async def create(self, project_id: int, example: Example) -> Example:
+        """Create a new example
+
+        Args:
+            project_id (int): The id of the project
+            example (Example): The example to create
+
+        Returns:
+            Example: The created example
+        """
+        return await self._calls.create(project_id, example).asend(self._client)
+
+    async def update(self, project_id: int, example: Example) -> Example:
+        """Update a example
+
+        Args:
+            project_id (int): The id of the project
+            example (Example): The example to update
+
+        Returns:
+            Example: The updated example
+        """
+        return await self._calls.update(project_id, example).asend(self._client)
+
+    async def partial_update(self, project_id: int, example_id: int, fields: Dict[str, Any]) -> Example:
+        """Update some fields of a example without sending the others
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example to update
+            fields (Dict[str, Any]): The new values by field name
+
+        Returns:
+            Example: The updated example
+        """
+        return await self._calls.partial_update(project_id, example_id, fields).asend(self._client)
+
+    async def bulk_partial_update(
+        self, project_id: int, updates: Iterable[Tuple[int, Dict[str, Any]]], max_workers: int = 8
+    ) -> AsyncIterator[BulkItemResult]:
+        """Update some fields of many examples with concurrent requests
+
+        The examples are updated lazily as the results are consumed, with at most
+        max_workers requests in flight. An invalid update or a failed request does not stop the others.
+
+        Args:
+            project_id (int): The id of the project
+            updates (Iterable[Tuple[int, Dict[str, Any]]]): Pairs of an example id and its new values by field name
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each update, in input order. The item is the pair of the
+                update. On success, result holds the updated example. On failure, error holds the
+                raised exception.
+        """
+
+        async def update(item: Tuple[int, Dict[str, Any]]) -> BulkItemResult:
+            example_id, fields = item
+            try:
+                return BulkItemResult(item=item, result=await self.partial_update(project_id, example_id, fields))
+            except (DoccanoAPIError, httpx.HTTPError, ValidationError, KeyError) as err:
+                return BulkItemResult(item=item, error=err)
+
+        async for result in async_ordered_map(update, updates, max_workers):
+            yield result
+
+    async def delete(self, project_id: int, example: Example | int):
+        """Delete a example
+
+        Args:
+            project_id (int): The id of the project
+            example (Example | int): The example to delete
+        """
+        await self._calls.delete(project_id, example).asend(self._client)
+
+    async def delete_all(self, project_id: int):
+        """Delete all examples
+
+        Args:
+            project_id (int): The id of the project
+        """
+        examples: List[int] = []
+        await self.bulk_delete(project_id, examples)
+
+    async def bulk_delete(self, project_id: int, examples: List[int] | List[Example]):
+        """Bulk delete examples
+
+        Args:
+            project_id (int): The id of the project
+            examples (List[int] | List[Example]): The list of example ids to delete
+        """
+        await self._calls.bulk_delete(project_id, examples).asend(self._client)
+
+    async def update_state(self, project_id: int, example: Example | int):
+        """Update completed state of example
+
+        Args:
+            project_id (int): The id of the project
+            example (Example | int): The example to confirm
+        """
+        await self._calls.update_state(project_id, example).asend(self._client)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import functools
+from typing import Any, AsyncIterator, Dict, Generic, Iterable, List, Type, TypeVar
+
+import httpx
+from pydantic import ValidationError
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.exceptions import DoccanoAPIError
+from doccano_client.models.bulk import BulkItemResult
+from doccano_client.models.label import (
+    BoundingBox,
+    Category,
+    Label,
+    Relation,
+    Segment,
+    Span,
+    Text,
+)
+from doccano_client.repositories.label import LabelCalls
+from doccano_client.utils.concurrency import async_ordered_map
+
+T = TypeVar("T", bound=Label)
+
+
+class LabelRepository(Generic[T]):
+    """Repository for interacting with the Doccano label API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository, label_class: Type[T], resource_type: str, trusted: bool = False):
+        """Initialize the repository
+
+        Args:
+            client (AsyncBaseRepository): The client sending the requests
+            label_class (Type[T]): The label model
+            resource_type (str): The name of the label resource, e.g. "spans"
+            trusted (bool): Whether to build labels from responses without validating them. Defaults to False.
+        """
+        self._client = client
+        self._calls = LabelCalls(label_class, resource_type, trusted)
+
+    async def find_by_id(self, project_id: int, example_id: int, label_id: int) -> T:
+        """Find a label by id
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label to find
+
+        Returns:
+            T: The found label
+        """
+        return await self._calls.find_by_id(project_id, example_id, label_id).asend(self._client)
+
+    async def list(self, project_id: int, example_id: int) -> List[T]:
+        """Return all label in which you are a member
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+
+        Returns:
+            T: The list of the label.
+        """
+        return await self._calls.list(project_id, example_id).asend(self._client)
+
+    async def create(self, project_id: int, label: T) -> T:
+        """Create a new label
+
+        Args:
+            project_id (int): The id of the project
+            label (T): The label to create
+
+        Returns:
+            T: The created label
+        """
+        return await self._calls.create(project_id, label).asend(self._client)
+
+    async def bulk_create(
+        self, project_id: int, labels: Iterable[T | Dict[str, Any]], max_workers: int = 8
+    ) -> AsyncIterator[BulkItemResult]:
+        """Create many labels, possibly for many examples, with concurrent requests
+
+        The labels are created lazily as the results are consumed, with at most
+        max_workers requests in flight. An invalid label or a failed request does not
+        stop the others.
+
+        Args:
+            project_id (int): The id of the project
+            labels (Iterable[T | Dict[str, Any]]): The labels to create. A dict is validated
+                into a label before it is sent.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each label, in input order. On success, result holds the
+                created label. On failure, error holds the raised exception.
+        """
+
+        async def create(item: T | Dict[str, Any]) -> BulkItemResult:
+            try:
+                return BulkItemResult(item=item, result=await self.create(project_id, self._calls.to_label(item)))
+            except (DoccanoAPIError, httpx.HTTPError, ValidationError) as err:
+                return BulkItemResult(item=item, error=err)
+
+        async for result in async_ordered_map(create, labels, max_workers):
+            yield result
+
+    async def update(self, project_id: int, label: T) -> T:
+        """Update a label
+
+        Args:
+            project_id (int): The id of the project
+            label (T): The label to update
+
+        Returns:
+            T: The updated label
+
+        Raises:
+            ValueError: If the label id is not set
+        """
+        return await self._calls.update(project_id, label).asend(self._client)
+
+    async def partial_update(self, project_id: int, example_id: int, label_id: int, fields: Dict[str, Any]) -> T:
+        """Update some fields of a label without sending the others
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label to update
+            fields (Dict[str, Any]): The new values by field name
+
+        Returns:
+            T: The updated label
+        """
+        return await self._calls.partial_update(project_id, example_id, label_id, fields).asend(self._client)
+
+    async def delete(self, project_id: int, label: T):
+        """Delete a label
+
+        Args:
+            project_id (int): The id of the project
+            label (T): The label to delete
+
+        Raises:
+            ValueError: If the label id is not set
+        """
+        await self._calls.delete(project_id, label).asend(self._client)
+
+    async def delete_by_id(self, project_id: int, example_id: int, label_id: int):
+        """Delete a label by id
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label to delete
+        """
+        await self._calls.delete_by_id(project_id, example_id, label_id).asend(self._client)
+
+    async def delete_all(self, project_id: int, example_id: int):
+        """Delete all labels
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+        """
+        await self._calls.delete_all(project_id, example_id).asend(self._client)
+
+
+CategoryRepository = functools.partial(LabelRepository[Category], label_class=Category, resource_type="categories")
+SpanRepository = functools.partial(LabelRepository[Span], label_class=Span, resource_type="spans")
+RelationRepository = functools.partial(LabelRepository[Relation], label_class=Relation, resource_type="relations")
+SegmentRepository = functools.partial(LabelRepository[Segment], label_class=Segment, resource_type="segments")
+TextRepository = functools.partial(LabelRepository[Text], label_class=Text, resource_type="texts")
+BoundingBoxRepository = functools.partial(LabelRepository[BoundingBox], label_class=BoundingBox, resource_type="bboxes")
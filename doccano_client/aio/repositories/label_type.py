@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import functools
+import pathlib
+from typing import List
+
+from doccano_client.aio.repositories.base import (
+    AsyncBaseRepository,
+    multipart_headers,
+)
+from doccano_client.models.label_type import LabelType
+from doccano_client.repositories.label_type import LabelTypeCalls
+
+
+class LabelTypeRepository:
+    """Repository for interacting with the Doccano label type API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository, resource_type="label-type", cache_ttl: float = 60.0):
+        """Initialize the repository
+
+        Args:
+            client (AsyncBaseRepository): The client to send requests with
+            resource_type (str): The label type resource of the API. Defaults to "label-type".
+            cache_ttl (float): The number of seconds the name index of a project is reused by
+                find_by_name before it is fetched again. 0 disables the cache. Defaults to 60.
+        """
+        self._client = client
+        self._calls = LabelTypeCalls(resource_type, cache_ttl)
+
+    def invalidate(self, project_id: int | None = None):
+        """Drop the cached name index of a project
+
+        Args:
+            project_id (int | None): The id of the project. Defaults to None, which drops every project.
+        """
+        self._calls.invalidate(project_id)
+
+    async def find_by_name(self, project_id: int, name: str) -> LabelType:
+        """Find a label type by name
+
+        When the name is missing from the cached index, the label types are fetched again once.
+
+        Args:
+            project_id (int): The id of the project
+            name (str): The name of the label type to find
+
+        Returns:
+            LabelType: The found label type
+
+        Raises:
+            ValueError: If the label type is not found
+        """
+        index = self._calls.cached_index(project_id)
+        if index is None or name not in index:
+            # the label type may have been created elsewhere since the index was cached
+            index = self._calls.index(project_id, await self.list(project_id))
+        if name in index:
+            return index[name]
+        raise ValueError(f"Label type with name {name} not found")
+
+    async def find_by_id(self, project_id: int, label_type_id: int) -> LabelType:
+        """Find a label type by id
+
+        Args:
+            project_id (int): The id of the project
+            label_type_id (int): The id of the label type to find
+
+        Returns:
+            LabelType: The found label type
+        """
+        return await self._calls.find_by_id(project_id, label_type_id).asend(self._client)
+
+    async def list(self, project_id: int) -> List[LabelType]:
+        """Return all label types in which you are a member
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            LabelType: The list of the label types.
+        """
+        return await self._calls.list(project_id).asend(self._client)
+
+    async def create(self, project_id: int, label_type: LabelType) -> LabelType:
+        """Create a new label type
+
+        Args:
+            project_id (int): The id of the project
+            label_type (LabelType): The label type to create
+
+        Returns:
+            LabelType: The created label type
+        """
+        return await self._calls.create(project_id, label_type).asend(self._client)
+
+    async def update(self, project_id: int, label_type: LabelType) -> LabelType:
+        """Update a label type
+
+        Args:
+            project_id (int): The id of the project
+            label_type (LabelType): The label type to update
+
+        Returns:
+            LabelType: The updated label type
+
+        Raises:
+            ValueError: If the label_type id is not set
+        """
+        return await self._calls.update(project_id, label_type).asend(self._client)
+
+    async def delete(self, project_id: int, label_type: LabelType | int):
+        """Delete a label type
+
+        Args:
+            project_id (int): The id of the project
+            label_type (LabelType | int): The label type to delete
+
+        Raises:
+            ValueError: If the label_type id is not set
+        """
+        await self._calls.delete(project_id, label_type).asend(self._client)
+
+    async def bulk_delete(self, project_id: int, label_types: List[int] | List[LabelType]):
+        """Bulk delete label types
+
+        Args:
+            project_id (int): The id of the project
+            label_types (List[int | LabelType]): The list of label type ids to delete
+        """
+        await self._calls.bulk_delete(project_id, label_types).asend(self._client)
+
+    async def upload(self, project_id: int, file_path: str):
+        """Upload a label type
+
+        Args:
+            project_id (int): The id of the project
+            file_path (str): The path to the file to upload
+        """
+        resource = self._calls.upload_resource(project_id)
+        path = pathlib.Path(file_path)
+        with path.open("rb") as f:
+            files = {"file": (path.name, f, "application/json")}
+            await self._client.post(resource, files=files, headers=multipart_headers())
+        self.invalidate(project_id)
+
+
+CategoryTypeRepository = functools.partial(LabelTypeRepository, resource_type="category-type")
+SpanTypeRepository = functools.partial(LabelTypeRepository, resource_type="span-type")
+RelationTypeRepository = functools.partial(LabelTypeRepository, resource_type="relation-type")
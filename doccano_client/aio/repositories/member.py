@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import List
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.models.member import Member
+from doccano_client.repositories.member import MemberCalls
+
+
+class MemberRepository:
+    """Repository for interacting with the Doccano member API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository, trusted: bool = False):
+        """Initialize the repository
+
+        Args:
+            client (AsyncBaseRepository): The client sending the requests
+            trusted (bool): Whether to build members from responses without validating them. Defaults to False.
+        """
+        self._client = client
+        self._calls = MemberCalls(trusted)
+
+    async def find_by_id(self, project_id: int, member_id: int) -> Member:
+        """Find a member by id
+
+        Args:
+            project_id (int): The id of the project
+            member_id (int): The id of the member to find
+
+        Returns:
+            Member: The found member
+        """
+        return await self._calls.find_by_id(project_id, member_id).asend(self._client)
+
+    async def list(self, project_id: int) -> List[Member]:
+        """Return all member in which you are a member
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            Member: The list of the member.
+        """
+        return await self._calls.list(project_id).asend(self._client)
+
+    async def create(self, project_id: int, member: Member) -> Member:
+        """Create a new member
+
+        Args:
+            project_id (int): The id of the project
+            member (Member): The member to create
+
+        Returns:
+            Member: The created member
+        """
+        return await self._calls.create(project_id, member).asend(self._client)
+
+    async def update(self, project_id: int, member: Member) -> Member:
+        """Update a member
+
+        Args:
+            project_id (int): The id of the project
+            member (Member): The member to update
+
+        Returns:
+            Member: The updated member
+
+        Raises:
+            ValueError: If the member id is not set
+        """
+        return await self._calls.update(project_id, member).asend(self._client)
+
+    async def delete(self, project_id: int, member: Member | int):
+        """Delete a member
+
+        Args:
+            project_id (int): The id of the project
+            member (Member | int): The member to delete
+
+        Raises:
+            ValueError: If the member id is not set
+        """
+        await self._calls.delete(project_id, member).asend(self._client)
+
+    async def bulk_delete(self, project_id: int, members: List[int] | List[Member]):
+        """Bulk delete members
+
+        Args:
+            project_id (int): The id of the project
+            members (List[int] | List[Member]): The list of member ids to delete
+        """
+        await self._calls.bulk_delete(project_id, members).asend(self._client)
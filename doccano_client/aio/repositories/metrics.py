@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import List
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.models.metrics import LabelDistribution, MemberProgress, Progress
+from doccano_client.repositories.metrics import MetricsCalls
+
+
+class MetricsRepository:
+    """Repository for interacting with the Doccano metrics API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository):
+        self._client = client
+        self._calls = MetricsCalls()
+
+    async def get_progress(self, project_id: int) -> Progress:
+        """Get my progress
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            Progress: Your progress
+        """
+        return await self._calls.get_progress(project_id).asend(self._client)
+
+    async def get_members_progress(self, project_id: int) -> List[MemberProgress]:
+        """Return all metricss in which you are a member
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            List[MemberProgress]: The list of the member progress.
+        """
+        return await self._calls.get_members_progress(project_id).asend(self._client)
+
+    async def get_category_distribution(self, project_id: int) -> List[LabelDistribution]:
+        """Return category distribution
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            LabelDistribution: The category distribution.
+        """
+        return await self._calls.get_category_distribution(project_id).asend(self._client)
+
+    async def get_span_distribution(self, project_id: int) -> List[LabelDistribution]:
+        """Return span distribution
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            LabelDistribution: The span distribution.
+        """
+        return await self._calls.get_span_distribution(project_id).asend(self._client)
+
+    async def get_relation_distribution(self, project_id: int) -> List[LabelDistribution]:
+        """Return relation distribution
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            LabelDistribution: The relation distribution.
+        """
+        return await self._calls.get_relation_distribution(project_id).asend(self._client)
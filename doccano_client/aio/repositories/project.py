@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import AsyncIterator, Optional
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.models.project import Project
+from doccano_client.repositories.project import ProjectCalls
+
+
+class ProjectRepository:
+    """Repository for interacting with the Doccano project API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository):
+        self._client = client
+        self._calls = ProjectCalls()
+
+    async def find_by_id(self, project_id: int) -> Project:
+        """Find a project by id
+
+        Args:
+            project_id (int): The id of the project to find
+
+        Returns:
+            Project: The found project
+        """
+        return await self._calls.find_by_id(project_id).asend(self._client)
+
+    async def list(self, max_workers: int = 1, page_size: Optional[int] = None) -> AsyncIterator[Project]:
+        """Return all projects in which you are a member
+
+        Args:
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
+
+        Yields:
+            Project: The next project.
+        """
+        async for project in self._calls.list().asend(self._client, max_workers, page_size):
+            yield project
+
+    async def create(self, project: Project) -> Project:
+        """Create a new project
+
+        Args:
+            project (Project): The project to create
+
+        Returns:
+            Project: The created project
+        """
+        return await self._calls.create(project).asend(self._client)
+
+    async def update(self, project: Project) -> Project:
+        """Update a project
+
+        Args:
+            project (Project): The project to update
+
+        Returns:
+            Project: The updated project
+        """
+        return await self._calls.update(project).asend(self._client)
+
+    async def delete(self, project: Project | int):
+        """Delete a project
+
+        Args:
+            project (Project | int): The project to delete
+        """
+        await self._calls.delete(project).asend(self._client)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import List
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.models.role import Role
+from doccano_client.repositories.role import RoleCalls
+
+
+class RoleRepository:
+    """Repository for interacting with the Doccano role API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository):
+        self._client = client
+        self._calls = RoleCalls()
+
+    async def list(self) -> List[Role]:
+        """Return all roles
+
+        Returns:
+            Role: The list of the roles.
+        """
+        return await self._calls.list().asend(self._client)
+
+    async def find_by_name(self, name: str) -> Role:
+        """Find a role by name
+
+        Args:
+            name (str): The name of the role to find
+
+        Returns:
+            Role: The found role
+
+        Raises:
+            ValueError: If the role is not found
+        """
+        return await self._calls.find_by_name(name).asend(self._client)
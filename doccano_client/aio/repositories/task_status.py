@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Dict, List
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.models.task_status import TaskStatus
+from doccano_client.repositories.task_status import TaskStatusCalls
+from doccano_client.utils.backoff import exponential_backoff
+
+
+class TaskStatusRepository:
+    """Repository for interacting with the Doccano task status API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository):
+        self._client = client
+        self._calls = TaskStatusCalls()
+
+    async def get(self, task_id: str) -> TaskStatus:
+        """Return the specified task_status
+
+        Args:
+            task_id (str): The celery task id
+
+        Returns:
+            TaskStatus: The task_status.
+        """
+        return await self._calls.get(task_id).asend(self._client)
+
+    async def wait(
+        self,
+        task_id: str,
+        timeout: float = 3600,
+        interval: float = 0.5,
+        backoff: float = 1.5,
+        max_interval: float = 10.0,
+    ) -> TaskStatus:
+        """Wait for the specified task id
+
+        The status is polled at once, then at exponentially growing intervals
+        until the task is ready or the deadline passes.
+
+        Args:
+            task_id (str): The celery task id
+            timeout (float): The maximum number of seconds to wait. Defaults to 3600.
+            interval (float): The seconds to wait before the first re-poll. Defaults to 0.5.
+            backoff (float): The factor applied to the interval after each poll. Defaults to 1.5.
+            max_interval (float): The maximum seconds between polls. Defaults to 10.
+
+        Returns:
+            TaskStatus: The task_status.
+
+        Raises:
+            TimeoutError: If the task does not complete within the timeout
+        """
+        statuses = await self.wait_all([task_id], timeout, interval, backoff, max_interval)
+        return statuses[0]
+
+    async def wait_all(
+        self,
+        task_ids: List[str],
+        timeout: float = 3600,
+        interval: float = 0.5,
+        backoff: float = 1.5,
+        max_interval: float = 10.0,
+    ) -> List[TaskStatus]:
+        """Wait for all the specified task ids
+
+        Every pending task is polled on each round, and the rounds share
+        one backoff schedule and one deadline.
+
+        Args:
+            task_ids (List[str]): The celery task ids
+            timeout (float): The maximum number of seconds to wait. Defaults to 3600.
+            interval (float): The seconds to wait before the first re-poll. Defaults to 0.5.
+            backoff (float): The factor applied to the interval after each poll. Defaults to 1.5.
+            max_interval (float): The maximum seconds between polls. Defaults to 10.
+
+        Returns:
+            List[TaskStatus]: The task_status of each task, in the order of task_ids.
+
+        Raises:
+            TimeoutError: If any task does not complete within the timeout
+        """
+        statuses: Dict[str, TaskStatus] = {}
+        pending = list(dict.fromkeys(task_ids))
+        deadline = time.monotonic() + timeout
+        for delay in exponential_backoff(interval, backoff, max_interval):
+            results = await asyncio.gather(*(self.get(task_id) for task_id in pending))
+            for task_id, status in zip(pending, results):
+                if status.ready:
+                    statuses[task_id] = status
+            pending = [task_id for task_id in pending if task_id not in statuses]
+            if not pending:
+                return [statuses[task_id] for task_id in task_ids]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+        raise TimeoutError(f"Timeout waiting for tasks {', '.join(pending)}")
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import List
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.models.user import User
+from doccano_client.repositories.user import UserCalls
+
+
+class UserRepository:
+    """Repository for interacting with the Doccano user API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository):
+        self._client = client
+        self._calls = UserCalls()
+
+    async def get_profile(self) -> User:
+        """Get a profile
+
+        Returns:
+            User: The user.
+        """
+        return await self._calls.get_profile().asend(self._client)
+
+    async def list(self, name: str = "") -> List[User]:
+        """Return users
+
+        Args:
+            name (str): The name of the user to search for
+
+        Returns:
+            User: The list of the users.
+        """
+        return await self._calls.list(name).asend(self._client)
+
+    async def find_by_name(self, name: str) -> User:
+        """Find a user by name
+
+        Args:
+            name (str): The name of the user to find
+
+        Returns:
+            User: The found user
+
+        Raises:
+            ValueError: If the user is not found
+        """
+        return await self._calls.find_by_name(name).asend(self._client)
+
+    async def create_user(self, username: str, password: str) -> User:
+        """Create new user.
+
+        Args:
+            username (str): the username of the user to be created
+            password (str): the password to set for the new user
+
+        Returns:
+            User: the newly created user info
+        """
+        return await self._calls.create_user(username, password).asend(self._client)
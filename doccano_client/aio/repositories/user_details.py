@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.models.user_details import (
+    PasswordChange,
+    PasswordUpdated,
+    UserDetails,
+)
+from doccano_client.repositories.user_details import UserDetailsCalls
+
+
+class UserDetailsRepository:
+    """Repository for interacting with the Doccano UserDetails API asynchronously"""
+
+    def __init__(self, client: AsyncBaseRepository):
+        self._client = client
+        self._calls = UserDetailsCalls()
+
+    async def get_current_user_details(self) -> UserDetails:
+        """Get the Current User Details
+
+        Returns:
+            UserDetails: The user login info.
+        """
+        return await self._calls.get_current_user_details().asend(self._client)
+
+    async def update_current_user_details(self, user_details: UserDetails) -> UserDetails:
+        """Update either username, first name or last name of the current user.
+           If any args are left as None the current info will be kept
+
+        Args:
+            user_details (UserDetails): The user details.
+
+        Returns:
+            UserDetails: the updated user login info
+        """
+        return await self._calls.update_current_user_details(user_details).asend(self._client)
+
+    async def change_current_user_password(self, password_change: PasswordChange) -> PasswordUpdated:
+        """Change the password of the Current User
+
+        Args:
+            password_change (PasswordChange): the new password to set for the current user
+
+        Returns:
+            PasswordUpdated: Message confirming password change.
+        """
+        return await self._calls.change_current_user_password(password_change).asend(self._client)
@@ -0,0 +1,97 @@
+from typing import AsyncIterator, List, Optional
+
+from doccano_client.aio.repositories.comment import CommentRepository
+from doccano_client.models.comment import Comment
+
+
+class CommentUseCase:
+    def __init__(self, repository: CommentRepository):
+        self._repository = repository
+
+    async def find_by_id(self, project_id: int, comment_id: int) -> Comment:
+        """Find a comment by id
+
+        Args:
+            project_id (int): The id of the project to find
+            comment_id (int): The id of the comment to find
+
+        Returns:
+            Comment: The found comment
+        """
+        return await self._repository.find_by_id(project_id, comment_id)
+
+    async def list(
+        self, project_id: int, example_id: int, query: str = "", max_workers: int = 1, page_size: Optional[int] = None
+    ) -> AsyncIterator[Comment]:
+        """Return all comments
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            query (str): The query string to filter comments
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
+
+        Yields:
+            Comment: The comments in the project.
+        """
+        async for comment in self._repository.list(project_id, example_id, query, max_workers, page_size):
+            yield comment
+
+    async def create(
+        self,
+        project_id: int,
+        example_id: int,
+        text: str,
+    ) -> Comment:
+        """Create a new comment
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            text (str): The text of the comment
+
+        Returns:
+            Comment: The created comment
+        """
+        comment = Comment(text=text, example=example_id)
+        return await self._repository.create(project_id, comment)
+
+    async def update(
+        self,
+        project_id: int,
+        comment_id: int,
+        text: str,
+    ) -> Comment:
+        """Update a comment
+
+        Args:
+            project_id (int): The id of the project
+            comment_id (int): The id of the comment
+            text (str): The text of the comment
+
+        Returns:
+            Comment: The updated comment
+        """
+        comment = await self.find_by_id(project_id, comment_id)
+        comment = Comment(id=comment.id, text=text, example=comment.example)
+        return await self._repository.update(project_id, comment)
+
+    async def delete(self, project_id: int, comment_id: int):
+        """Delete a comment.
+
+        Args:
+            project_id (int): The project id.
+            comment_id (int): The comment id.
+        """
+        await self._repository.delete(project_id, comment_id)
+
+    async def bulk_delete(self, project_id: int, comment_ids: List[int]):
+        """Bulk delete comments
+
+        Args:
+            project_id (int): The id of the project
+            comment_ids (List[int]): The list of comment ids to delete
+        """
+        await self._repository.bulk_delete(project_id, comment_ids)
@@ -0,0 +1,99 @@
+import asyncio
+import contextlib
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from doccano_client.aio.repositories.data_upload import DataUploadRepository
+from doccano_client.aio.repositories.task_status import TaskStatusRepository
+from doccano_client.exceptions import DoccanoAPIError
+from doccano_client.models.data_upload import Option, Task
+from doccano_client.models.task_status import TaskStatus
+
+
+class DataUploadUseCase:
+    def __init__(self, data_upload_repository: DataUploadRepository, task_status_repository: TaskStatusRepository):
+        self._data_upload_repository = data_upload_repository
+        self._task_status_repository = task_status_repository
+
+    async def list_options(self, project_id: int) -> List[Option]:
+        """Return all upload options
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            List[Option]: The list of the upload options.
+        """
+        return await self._data_upload_repository.list_options(project_id)
+
+    async def upload(
+        self,
+        project_id: int,
+        file_paths: List[str],
+        task: Task,
+        format: str,
+        column_data: str = "text",
+        column_label: str = "label",
+        max_workers: int = 4,
+        progress: Optional[Callable[[str, int, int], None]] = None,
+    ) -> TaskStatus:
+        """Upload files concurrently and ingest them into the project
+
+        If any upload fails, the files that were already uploaded are reverted
+        before the error is raised.
+
+        Args:
+            project_id (int): The id of the project
+            file_paths (List[str]): The list of the file paths
+            task (Task): The task of the upload
+            format (str): The format of the upload
+            column_data (str): The column name of the data
+            column_label (str): The column name of the label
+            max_workers (int): The maximum number of files uploaded concurrently. Defaults to 4.
+            progress (Callable[[str, int, int], None], optional): Called after each uploaded file
+                with its path, the number of uploaded files and the total number of files.
+
+        Returns:
+            TaskStatus: The status of the upload task.
+        """
+        upload_ids = await self._upload_files(file_paths, max_workers, progress)
+        task_id = await self._data_upload_repository.ingest(
+            project_id, upload_ids, task, format, column_data=column_data, column_label=column_label
+        )
+        return await self._task_status_repository.wait(task_id)
+
+    async def _upload_files(
+        self, file_paths: List[str], max_workers: int, progress: Optional[Callable[[str, int, int], None]]
+    ) -> List[str]:
+        """Upload files with at most max_workers in flight, reverting the uploaded ones if any upload fails
+
+        Args:
+            file_paths (List[str]): The list of the file paths
+            max_workers (int): The maximum number of files uploaded concurrently
+            progress (Callable[[str, int, int], None], optional): The progress callback
+
+        Returns:
+            List[str]: The ids of the uploaded files, in the order of file_paths.
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+        upload_ids: Dict[int, str] = {}
+
+        async def upload(i: int) -> None:
+            async with semaphore:
+                upload_ids[i] = await self._data_upload_repository.upload(file_paths[i])
+            if progress is not None:
+                progress(file_paths[i], len(upload_ids), len(file_paths))
+
+        tasks = [asyncio.ensure_future(upload(i)) for i in range(len(file_paths))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for pending in tasks:
+                pending.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for upload_id in upload_ids.values():
+                with contextlib.suppress(DoccanoAPIError, httpx.HTTPError):
+                    await self._data_upload_repository.delete(upload_id)
+            raise
+        return [upload_ids[i] for i in range(len(file_paths))]
@@ -0,0 +1,165 @@
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional
+
+from doccano_client.aio.repositories.example import ExampleRepository
+from doccano_client.models.bulk import BulkItemResult
+from doccano_client.models.example import Example
+
+
+class ExampleUseCase:
+    def __init__(self, repository: ExampleRepository):
+        self._repository = repository
+
+    async def find_by_id(self, project_id: int, example_id: int) -> Example:
+        """Find a example by id
+
+        Args:
+            project_id (int): The id of the project to find
+            example_id (int): The id of the example to find
+
+        Returns:
+            Example: The found example
+        """
+        return await self._repository.find_by_id(project_id, example_id)
+
+    async def count(self, project_id: int) -> int:
+        """Count the number of examples
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            int: The number of examples
+        """
+        return await self._repository.count(project_id)
+
+    async def find_latest(self, project_id: int) -> Optional[Example]:
+        """Find the most recently created example
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            Optional[Example]: The latest example, or None if the project has no example
+        """
+        return await self._repository.find_latest(project_id)
+
+    async def list(
+        self,
+        project_id: int,
+        is_confirmed: Optional[bool] = None,
+        max_workers: int = 1,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[Example]:
+        """Return all examples
+
+        Args:
+            project_id (int): The id of the project
+            is_confirmed (bool, optional): Filter by confirmed state. Defaults to None.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
+
+        Yields:
+            Example: The examples in the project.
+        """
+        async for example in self._repository.list(project_id, is_confirmed, max_workers, page_size):
+            yield example
+
+    async def create(
+        self,
+        project_id: int,
+        text: str,
+        score: float = 100.0,
+        meta: Dict[str, Any] = None,
+    ) -> Example:
+        """Create a new example
+
+        Args:
+            project_id (int): The id of the project
+            text (str): The text of the example
+            score (float): The confidence score of the example
+            meta (Dict[str, Any]): The meta data of the example
+
+        Returns:
+            Example: The created example
+        """
+        if meta is None:
+            meta = {}
+        example = Example(text=text, score=score, meta=meta)
+        return await self._repository.create(project_id, example)
+
+    async def update(
+        self,
+        project_id: int,
+        example_id: int,
+        text: str = None,
+        score: float = None,
+        meta: Dict[str, Any] = None,
+    ) -> Example:
+        """Update a example. Only the given fields are sent, in a single request.
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            text (str): The text of the example
+            score (float): The confidence score of the example
+            meta (Dict[str, Any]): The meta data of the example
+
+        Returns:
+            Example: The updated example
+        """
+        fields = {"text": text, "score": score, "meta": meta}
+        fields = {name: value for name, value in fields.items() if value is not None}
+        return await self._repository.partial_update(project_id, example_id, fields)
+
+    async def bulk_update(
+        self, project_id: int, updates: Mapping[int, Dict[str, Any]], max_workers: int = 8
+    ) -> AsyncIterator[BulkItemResult]:
+        """Update some fields of many examples with concurrent requests
+
+        Args:
+            project_id (int): The id of the project
+            updates (Mapping[int, Dict[str, Any]]): The new values by field name, by example id
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each update, in input order. The item is the pair of the
+                example id and its new values.
+        """
+        async for result in self._repository.bulk_partial_update(project_id, updates.items(), max_workers):
+            yield result
+
+    async def delete(self, project_id: int, example_id: int):
+        """Delete a example.
+
+        Args:
+            project_id (int): The project id.
+            example_id (int): The example id.
+        """
+        await self._repository.delete(project_id, example_id)
+
+    async def bulk_delete(self, project_id: int, example_ids: List[int]):
+        """Bulk delete examples
+
+        Args:
+            project_id (int): The id of the project
+            example_ids (List[int]): The list of example ids to delete
+        """
+        await self._repository.bulk_delete(project_id, example_ids)
+
+    async def delete_all(self, project_id: int):
+        """Delete all examples
+
+        Args:
+            project_id (int): The id of the project
+        """
+        await self._repository.delete_all(project_id)
+
+    async def update_state(self, project_id: int, example_id: int):
+        """Update completed state of example
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The example id
+        """
+        await self._repository.update_state(project_id, example_id)
@@ -0,0 +1,594 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Dict, Generic, Iterable, List, Optional, TypeVar
+
+from doccano_client.aio.repositories.label import LabelRepository
+from doccano_client.aio.repositories.label_type import LabelTypeRepository
+from doccano_client.models.bulk import BulkItemResult
+from doccano_client.models.label import (
+    BoundingBox,
+    Category,
+    Label,
+    Relation,
+    Segment,
+    Span,
+    Text,
+)
+
+T = TypeVar("T", bound=Label)
+
+
+class LabelUseCase(Generic[T]):
+    def __init__(self, repository: LabelRepository, label_type_repository: LabelTypeRepository = None):
+        self._repository = repository
+        self._label_type_repository = label_type_repository
+
+    async def find_by_id(self, project_id: int, example_id: int, label_id: int) -> T:
+        """Find a label by id
+
+        Args:
+            project_id (int): The id of the project to find
+            example_id (int): The id of the example
+            label_id (int): The id of the label to find
+
+        Returns:
+            T: The found label
+        """
+        return await self._repository.find_by_id(project_id, example_id, label_id)
+
+    async def list(self, project_id: int, example_id: int) -> List[T]:
+        """Return all labels
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+
+        Returns:
+            T: The labels in the project.
+        """
+        return await self._repository.list(project_id, example_id)
+
+    async def bulk_create(
+        self, project_id: int, labels: Iterable[T | Dict[str, Any]], max_workers: int = 8
+    ) -> AsyncIterator[BulkItemResult]:
+        """Create many labels with concurrent requests
+
+        Args:
+            project_id (int): The id of the project
+            labels (Iterable[T | Dict[str, Any]]): The labels to create, or their fields. Each
+                label holds the id of its example.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each label, in input order.
+        """
+        async for result in self._repository.bulk_create(project_id, labels, max_workers):
+            yield result
+
+    async def delete(self, project_id: int, example_id: int, label_id: int):
+        """Delete a label.
+
+        Args:
+            project_id (int): The project id
+            example_id (int): The id of the example
+            label_id (int): The label id
+        """
+        await self._repository.delete_by_id(project_id, example_id, label_id)
+
+    async def _partial_update(self, project_id: int, example_id: int, label_id: int, **fields) -> T:
+        """Send the given fields of a label, leaving out the ones that are None
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label
+            fields: The new values by field name
+
+        Returns:
+            T: The updated label
+        """
+        fields = {name: value for name, value in fields.items() if value is not None}
+        return await self._repository.partial_update(project_id, example_id, label_id, fields)
+
+    async def delete_all(self, project_id: int, example_id: int):
+        """Delete all labels
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+        """
+        await self._repository.delete_all(project_id, example_id)
+
+
+class CategoryUseCase(LabelUseCase[Category]):
+    async def create(
+        self, project_id: int, example_id: int, label: int | str, human_annotated=False, confidence=0.0
+    ) -> Category:
+        """Create a new category label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label (int | str): The label to create
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            Category: The created category label
+
+        Raises:
+            ValueError: If the label type repository is not set
+        """
+        if self._label_type_repository is None:
+            raise ValueError("LabelTypeRepository is not set")
+
+        if isinstance(label, str):
+            label_type = await self._label_type_repository.find_by_name(project_id, label)
+            label = label_type.id  # type: ignore
+
+        category = Category(example=example_id, label=label, manual=human_annotated, prob=confidence)
+        return await self._repository.create(project_id, category)
+
+    async def update(
+        self,
+        project_id: int,
+        example_id: int,
+        label_id: int,
+        label: Optional[int | str] = None,
+        human_annotated: bool = None,
+        confidence: float = None,
+    ) -> Category:
+        """Update a category label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label
+            label (int | str): The label to create
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            Category: The updated category label
+
+        Raises:
+            ValueError: If the label type repository is not set
+        """
+        if self._label_type_repository is None:
+            raise ValueError("LabelTypeRepository is not set")
+
+        if isinstance(label, str):
+            label_type = await self._label_type_repository.find_by_name(project_id, label)
+            label = label_type.id  # type: ignore
+
+        return await self._partial_update(
+            project_id, example_id, label_id, label=label, manual=human_annotated, prob=confidence
+        )
+
+
+class SpanUseCase(LabelUseCase[Span]):
+    async def create(
+        self,
+        project_id: int,
+        example_id: int,
+        start_offset: int,
+        end_offset: int,
+        label: int | str,
+        human_annotated: bool = False,
+        confidence: float = 0.0,
+    ) -> Span:
+        """Create a new span label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            start_offset (int): The start offset of the span
+            end_offset (int): The end offset of the span
+            label (int | str): The label to create
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            Span: The created span label
+
+        Raises:
+            ValueError: If the label type repository is not set
+        """
+        if self._label_type_repository is None:
+            raise ValueError("LabelTypeRepository is not set")
+
+        if isinstance(label, str):
+            label_type = await self._label_type_repository.find_by_name(project_id, label)
+            label = label_type.id  # type: ignore
+
+        span = Span(
+            example=example_id,
+            start_offset=start_offset,
+            end_offset=end_offset,
+            label=label,
+            manual=human_annotated,
+            prob=confidence,
+        )
+        return await self._repository.create(project_id, span)
+
+    async def update(
+        self,
+        project_id: int,
+        example_id: int,
+        label_id: int,
+        start_offset: Optional[int] = None,
+        end_offset: Optional[int] = None,
+        label: Optional[int | str] = None,
+        human_annotated: bool = None,
+        confidence: float = None,
+    ) -> Span:
+        """Update a span label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label
+            start_offset (int): The start offset of the span
+            end_offset (int): The end offset of the span
+            label (int | str): The label to create
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            Span: The updated span label
+
+        Raises:
+            ValueError: If the label type repository is not set
+        """
+        if self._label_type_repository is None:
+            raise ValueError("LabelTypeRepository is not set")
+
+        if isinstance(label, str):
+            label_type = await self._label_type_repository.find_by_name(project_id, label)
+            label = label_type.id
+
+        return await self._partial_update(
+            project_id,
+            example_id,
+            label_id,
+            start_offset=start_offset,
+            end_offset=end_offset,
+            label=label,
+            manual=human_annotated,
+            prob=confidence,
+        )
+
+
+class RelationUseCase(LabelUseCase[Relation]):
+    async def create(
+        self,
+        project_id: int,
+        example_id: int,
+        from_id: int,
+        to_id: int,
+        label: int | str,
+        human_annotated: bool = False,
+        confidence: float = 0.0,
+    ) -> Relation:
+        """Create a new relation label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            from_id (int): The id of the from span
+            to_id (int): The id of the to span
+            label (int | str): The label to create
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            Relation: The created relation label
+
+        Raises:
+            ValueError: If the label type repository is not set
+        """
+        if self._label_type_repository is None:
+            raise ValueError("LabelTypeRepository is not set")
+
+        if isinstance(label, str):
+            label_type = await self._label_type_repository.find_by_name(project_id, label)
+            label = label_type.id  # type: ignore
+
+        relation = Relation(
+            example=example_id,
+            from_id=from_id,
+            to_id=to_id,
+            type=label,
+            manual=human_annotated,
+            prob=confidence,
+        )
+        return await self._repository.create(project_id, relation)
+
+    async def update(
+        self,
+        project_id: int,
+        example_id: int,
+        label_id: int,
+        from_id: Optional[int] = None,
+        to_id: Optional[int] = None,
+        label: Optional[int | str] = None,
+        human_annotated: bool = None,
+        confidence: float = None,
+    ) -> Relation:
+        """Update a relation label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label
+            from_id (int): The id of the from span
+            to_id (int): The id of the to span
+            label (int | str): The label to create
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            Relation: The updated relation label
+
+        Raises:
+            ValueError: If the label type repository is not set
+        """
+        if self._label_type_repository is None:
+            raise ValueError("LabelTypeRepository is not set")
+
+        if isinstance(label, str):
+            label_type = await self._label_type_repository.find_by_name(project_id, label)
+            label = label_type.id
+
+        return await self._partial_update(
+            project_id,
+            example_id,
+            label_id,
+            from_id=from_id,
+            to_id=to_id,
+            type=label,
+            manual=human_annotated,
+            prob=confidence,
+        )
+
+
+class TextUseCase(LabelUseCase[Text]):
+    async def create(
+        self,
+        project_id: int,
+        example_id: int,
+        text: str,
+        human_annotated: bool = False,
+        confidence: float = 0.0,
+    ) -> Text:
+        """Create a new text label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            text (str): The text to create
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            Text: The created text label
+        """
+        text_label = Text(
+            example=example_id,
+            text=text,
+            manual=human_annotated,
+            prob=confidence,
+        )
+        return await self._repository.create(project_id, text_label)
+
+    async def update(
+        self,
+        project_id: int,
+        example_id: int,
+        label_id: int,
+        text: Optional[str] = None,
+        human_annotated: bool = None,
+        confidence: float = None,
+    ) -> Text:
+        """Update a text label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label
+            text (str): The text to update
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            Text: The updated text label
+        """
+        return await self._partial_update(
+            project_id, example_id, label_id, text=text, manual=human_annotated, prob=confidence
+        )
+
+
+class BoundingBoxUseCase(LabelUseCase[BoundingBox]):
+    async def create(
+        self,
+        project_id: int,
+        example_id: int,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        label: int | str,
+        human_annotated: bool = False,
+        confidence: float = 0.0,
+    ) -> BoundingBox:
+        """Create a new bounding box label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            x (float): The x coordinate of the bounding box
+            y (float): The y coordinate of the bounding box
+            width (float): The width of the bounding box
+            height (float): The height of the bounding box
+            label (int | str): The label to create
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            BoundingBox: The created bounding box label
+
+        Raises:
+            ValueError: If the label type repository is not set
+        """
+        if self._label_type_repository is None:
+            raise ValueError("LabelTypeRepository is not set")
+
+        if isinstance(label, str):
+            label_type = await self._label_type_repository.find_by_name(project_id, label)
+            label = label_type.id  # type: ignore
+
+        bounding_box = BoundingBox(
+            example=example_id,
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+            label=label,
+            manual=human_annotated,
+            prob=confidence,
+        )
+        return await self._repository.create(project_id, bounding_box)
+
+    async def update(
+        self,
+        project_id: int,
+        example_id: int,
+        label_id: int,
+        x: Optional[float] = None,
+        y: Optional[float] = None,
+        width: Optional[float] = None,
+        height: Optional[float] = None,
+        label: Optional[int | str] = None,
+        human_annotated: bool = None,
+        confidence: float = None,
+    ) -> BoundingBox:
+        """Update a bounding box label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label
+            x (float): The x coordinate of the bounding box
+            y (float): The y coordinate of the bounding box
+            width (float): The width of the bounding box
+            height (float): The height of the bounding box
+            label (int | str): The label to create
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            BoundingBox: The updated bounding box label
+
+        Raises:
+            ValueError: If the label type repository is not set
+        """
+        if self._label_type_repository is None:
+            raise ValueError("LabelTypeRepository is not set")
+
+        if isinstance(label, str):
+            label_type = await self._label_type_repository.find_by_name(project_id, label)
+            label = label_type.id
+
+        return await self._partial_update(
+            project_id,
+            example_id,
+            label_id,
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+            label=label,
+            manual=human_annotated,
+            prob=confidence,
+        )
+
+
+class SegmentUseCase(LabelUseCase[Segment]):
+    async def create(
+        self,
+        project_id: int,
+        example_id: int,
+        points: List[float],
+        label: int | str,
+        human_annotated: bool = False,
+        confidence: float = 0.0,
+    ) -> Segment:
+        """Create a new segment label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            points (List[float]): The points of the segment
+            label (int | str): The label to create
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            Segment: The created segment label
+
+        Raises:
+            ValueError: If the label type repository is not set
+        """
+        if self._label_type_repository is None:
+            raise ValueError("LabelTypeRepository is not set")
+
+        if isinstance(label, str):
+            label_type = await self._label_type_repository.find_by_name(project_id, label)
+            label = label_type.id  # type: ignore
+
+        segment = Segment(
+            example=example_id,
+            points=points,
+            label=label,
+            manual=human_annotated,
+            prob=confidence,
+        )
+        return await self._repository.create(project_id, segment)
+
+    async def update(
+        self,
+        project_id: int,
+        example_id: int,
+        label_id: int,
+        points: Optional[List[float]] = None,
+        label: Optional[int | str] = None,
+        human_annotated: bool = None,
+        confidence: float = None,
+    ) -> Segment:
+        """Update a segment label
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label
+            points (List[float]): The points of the segment
+            label (int | str): The label to create
+            human_annotated (bool): Whether the label is human annotated. Defaults to False.
+            confidence (float): The confidence of the label. Defaults to 0.0.
+
+        Returns:
+            Segment: The updated segment label
+
+        Raises:
+            ValueError: If the label type repository is not set
+        """
+        if self._label_type_repository is None:
+            raise ValueError("LabelTypeRepository is not set")
+
+        if isinstance(label, str):
+            label_type = await self._label_type_repository.find_by_name(project_id, label)
+            label = label_type.id
+
+        return await self._partial_update(
+            project_id, example_id, label_id, points=points, label=label, manual=human_annotated, prob=confidence
+        )
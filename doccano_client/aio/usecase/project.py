@@ -0,0 +1,145 @@
+from typing import AsyncIterator, List, Optional
+
+from doccano_client.aio.repositories.project import ProjectRepository
+from doccano_client.models.project import Project
+from doccano_client.usecase.project import ProjectType
+
+
+class ProjectUseCase:
+    def __init__(self, repository: ProjectRepository):
+        self._repository = repository
+
+    async def find_by_id(self, project_id: int) -> Project:
+        """Find a project by id
+
+        Args:
+            project_id (int): The id of the project to find
+
+        Returns:
+            Project: The found project
+        """
+        return await self._repository.find_by_id(project_id)
+
+    async def list(self, max_workers: int = 1, page_size: Optional[int] = None) -> AsyncIterator[Project]:
+        """Return all projects in which you are a member
+
+        Args:
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
+
+        Yields:
+            Project: The next project.
+        """
+        async for project in self._repository.list(max_workers, page_size):
+            yield project
+
+    async def create(
+        self,
+        name: str,
+        project_type: ProjectType,
+        description: str,
+        guideline: str = "",
+        random_order: bool = False,
+        collaborative_annotation: bool = False,
+        single_class_classification: bool = False,
+        allow_overlapping: bool = False,
+        grapheme_mode: bool = False,
+        use_relation: bool = False,
+        tags: Optional[List[str]] = None,
+    ) -> Project:
+        """Create a new project
+
+        Args:
+            name (str): The name of the project
+            project_type (ProjectType): The type of the project
+            description (str): The description of the project.
+            guideline (str): The annotation guideline. Defaults to "".
+            random_order (bool): Whether to shuffle the uploaded data. Defaults to False.
+            collaborative_annotation (bool): If True, a data can be annotated by multiple users. Defaults to False.
+            single_class_classification (bool): If True, only one label can apply a data. Defaults to False.
+            allow_overlapping (bool): If True, span overlapping is allowed. Defaults to False.
+            grapheme_mode (bool): If True, count multi-byte characters as one character. Defaults to False.
+            use_relation (bool): If True, relation labeling is allowed. Defaults to False.
+            tags (Optional[List[str]], optional): The tags of the project. Defaults to None.
+
+        Returns:
+            Project: The created project
+        """
+        project = Project(
+            name=name,
+            description=description,
+            guideline=guideline,
+            project_type=project_type,
+            random_order=random_order,
+            collaborative_annotation=collaborative_annotation,
+            single_class_classification=single_class_classification,
+            allow_overlapping=allow_overlapping,
+            grapheme_mode=grapheme_mode,
+            use_relation=use_relation,
+            tags=tags or [],
+        )
+        return await self._repository.create(project)
+
+    async def update(
+        self,
+        project_id: int,
+        name: str = None,
+        project_type: ProjectType = None,
+        description: str = None,
+        guideline: str = None,
+        random_order: bool = None,
+        collaborative_annotation: bool = None,
+        single_class_classification: bool = None,
+        allow_overlapping: bool = None,
+        grapheme_mode: bool = None,
+        use_relation: bool = None,
+        tags: Optional[List[str]] = None,
+    ) -> Project:
+        """Update a project
+
+        Args:
+            project_id (int): The project id.
+            name (str): The name of the project
+            project_type (ProjectType): The type of the project
+            description (str): The description of the project. Defaults to None.
+            guideline (str): The annotation guideline. Defaults to None.
+            random_order (bool): Whether to shuffle the uploaded data. Defaults to None.
+            collaborative_annotation (bool): If True, a data can be annotated by multiple users. Defaults to None.
+            single_class_classification (bool): If True, only one label can apply a data. Defaults to None.
+            allow_overlapping (bool): If True, span overlapping is allowed. Defaults to None.
+            grapheme_mode (bool): If True, count multi-byte characters as one character. Defaults to None.
+            use_relation (bool): If True, relation labeling is allowed. Defaults to None.
+            tags (Optional[List[str]], optional): The tags of the project. Defaults to None.
+
+        Returns:
+            Project: The updated project
+        """
+        project = await self.find_by_id(project_id)
+        project = Project(
+            id=project_id,
+            name=name or project.name,
+            description=description or project.description,
+            guideline=guideline if guideline is not None else project.guideline,
+            project_type=project_type or project.project_type,
+            random_order=random_order if random_order is not None else project.random_order,
+            collaborative_annotation=collaborative_annotation
+            if collaborative_annotation is not None
+            else project.collaborative_annotation,
+            single_class_classification=single_class_classification
+            if single_class_classification is not None
+            else project.single_class_classification,
+            allow_overlapping=allow_overlapping if allow_overlapping is not None else project.allow_overlapping,
+            grapheme_mode=grapheme_mode if grapheme_mode is not None else project.grapheme_mode,
+            use_relation=use_relation if use_relation is not None else project.use_relation,
+            tags=tags or [],
+        )
+        return await self._repository.update(project)
+
+    async def delete(self, project_id: int):
+        """Delete a project.
+
+        Args:
+            project_id (int): The project id.
+        """
+        await self._repository.delete(project_id)
@@ -1,7 +1,7 @@
 import json
 import pathlib
 import time
-from typing import List, Literal, Optional, Tuple
+from typing import Dict, List, Literal, Optional, Tuple
 
 import pandas as pd
 from flair.trainers import ModelTrainer
@@ -90,6 +90,7 @@ def execute_active_learning(
     prev_completed = 0
     number_of_data = []
     f1_scores = []
+    current_scores: Dict[int, float] = {}
     while True:
         progress = client.get_progress(project_id)
         if progress.is_finished():
@@ -104,9 +105,16 @@ def execute_active_learning(
                 transformer_model=transformer_model,
             )
             print("Update confidence scores...")
-            for score, example_id in tqdm(zip(scores, example_ids)):
-                client.update_example(project_id, example_id, score=score)
-            print("Update completed.")
+            new_scores = dict(zip(example_ids, scores))
+            results = client.bulk_update_example_scores(project_id, new_scores, current=current_scores)
+            failures = 0
+            for result in tqdm(results):
+                if result.ok:
+                    example_id, fields = result.item
+                    current_scores[example_id] = fields["score"]
+                else:
+                    failures += 1
+            print(f"Update completed. {failures} failed.")
 
             number_of_data.append(progress.completed)
             f1_scores.append(f1_micro)
@@ -1,5 +1,3 @@
-import json
-import pathlib
 from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from sklearn.model_selection import train_test_split
@@ -9,8 +7,6 @@ from doccano_client.models.label import Span
 
 
 class Examples:
-    filename = "examples.json"
-
     def __init__(self, examples: Iterable[Example] = None):
         if examples is None:
             examples = []
@@ -25,22 +21,6 @@ class Examples:
     def ids(self) -> List[int]:
         return list(self.items.keys())
 
-    def save(self, project_dir: pathlib.Path):
-        path = project_dir / self.filename
-        with path.open("w") as f:
-            examples = [example.dict() for example in self.items.values()]
-            json.dump(examples, f)
-
-    @classmethod
-    def load(cls, project_dir: pathlib.Path):
-        path = project_dir / cls.filename
-        if not path.exists():
-            return cls()
-        with path.open() as f:
-            items = [Example.parse_obj(example) for example in json.load(f)]
-        examples = cls(items)
-        return examples
-
     def confirm(self, example_id: Optional[int]):
         if example_id is None:
             return
@@ -54,8 +34,6 @@ class Examples:
 
 
 class Spans:
-    filename = "spans.json"
-
     def __init__(self, spans: Dict[int, List[Span]] = None):
         self.items = spans or {}
 
@@ -76,23 +54,6 @@ class Spans:
             return
         self.items[example_id] = spans
 
-    def save(self, project_dir: pathlib.Path):
-        path = project_dir / self.filename
-        with path.open("w") as f:
-            spans = {example_id: [span.dict() for span in spans] for example_id, spans in self.items.items()}
-            json.dump(spans, f)
-
-    @classmethod
-    def load(cls, project_dir: pathlib.Path):
-        path = project_dir / cls.filename
-        if not path.exists():
-            return cls()
-        with path.open() as f:
-            items = json.load(f)
-        items = {int(example_id): [Span.parse_obj(span) for span in spans] for example_id, spans in items.items()}
-        spans = cls(items)
-        return spans
-
     def filter_by(self, example_ids: List[int]) -> "Spans":
         return Spans({example_id: self.items[example_id] for example_id in example_ids})
 
@@ -114,16 +75,6 @@ class NERDataset:
         test_spans = self.spans.filter_by(test_ids)
         return NERDataset(train_examples, train_spans), NERDataset(test_examples, test_spans)
 
-    def save(self, project_dir: pathlib.Path):
-        self.examples.save(project_dir)
-        self.spans.save(project_dir)
-
-    @classmethod
-    def load(cls, project_dir: pathlib.Path):
-        examples = Examples.load(project_dir)
-        spans = Spans.load(project_dir)
-        return cls(examples, spans)
-
     def add_spans(self, example_id: Optional[int], spans: List[Span]):
         if example_id is None:
             return
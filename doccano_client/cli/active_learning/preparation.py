@@ -8,10 +8,11 @@ from flair.datasets import ColumnCorpus
 from spacy.training import offsets_to_biluo_tags
 
 from doccano_client import DoccanoClient
+from doccano_client.mirror import ProjectMirror
 from doccano_client.models.example import Example
 from doccano_client.models.label import Span
 
-from .models import Examples, NERDataset
+from .models import Examples, NERDataset, Spans
 
 DOCCANO_HOME = pathlib.Path(os.path.expanduser(os.environ.get("DOCCANO_HOME", "~/doccano")))
 
@@ -33,24 +34,18 @@ class UnlabeledDataset:
 
 
 def download_dataset(client: DoccanoClient, project_id: int) -> NERDataset:
-    dataset_dir = DOCCANO_HOME / str(project_id) / "dataset"
-    if not dataset_dir.exists():
-        print(f"Downloading dataset for project {project_id}")
-        dataset_dir.mkdir(parents=True, exist_ok=True)
-        examples = Examples(client.list_examples(project_id))
-        dataset = NERDataset(examples)
-        dataset.save(dataset_dir)
-    else:
-        print(f"Loading dataset for project {project_id}")
-        dataset = NERDataset.load(dataset_dir)
-
-    for example in client.list_examples(project_id, is_confirmed=True):
-        if not dataset.has_spans(example.id):
-            spans = client.list_spans(project_id, example.id)  # type: ignore
-            dataset.add_spans(example.id, spans)
-            dataset.confirm(example.id)
-    dataset.save(dataset_dir)
-    return dataset
+    project_dir = DOCCANO_HOME / str(project_id)
+    project_dir.mkdir(parents=True, exist_ok=True)
+    print(f"Syncing dataset for project {project_id}")
+    with ProjectMirror(
+        client, project_id, project_dir / "mirror.sqlite3", ["span"], only_confirmed_labels=True
+    ) as mirror:
+        # only the examples confirmed since the last sync are fetched, with their spans.
+        result = mirror.sync_confirmed()
+        print(f"{result.added} added, {result.updated} updated, {result.deleted} deleted.")
+        examples = Examples(mirror.list_examples())
+        spans = Spans({example_id: mirror.list_spans(example_id) for example_id in examples.filter_by(True).ids})
+    return NERDataset(examples, spans)
 
 
 def make_nlp(lang: str = "en"):
@@ -70,6 +65,7 @@ def prepare_datasets(client: DoccanoClient, project_id: int, lang: str = "en"):
     # convert dataset to conll format
     nlp = make_nlp(lang)
     save_dir = DOCCANO_HOME / str(project_id) / "dataset"
+    save_dir.mkdir(parents=True, exist_ok=True)
     export_examples_to_conll(nlp, train_dataset, save_dir / "train.txt")
     export_examples_to_conll(nlp, test_dataset, save_dir / "test.txt")
 
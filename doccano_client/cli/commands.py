@@ -10,6 +10,7 @@ from doccano_client import DoccanoClient
 from doccano_client.cli.active_learning.languages import LANGUAGES
 from doccano_client.cli.estimators import select_estimator_class
 from doccano_client.cli.usecases import build_annotator
+from doccano_client.utils.checkpoint import Checkpoint
 
 DOCCANO_HOME = os.path.expanduser(os.environ.get("DOCCANO_HOME", "~/doccano"))
 Path(DOCCANO_HOME).mkdir(parents=True, exist_ok=True)
@@ -42,8 +43,18 @@ def command_login(args) -> DoccanoClient:
 def command_predict(args):
     client = command_login(args)
     estimator = select_estimator_class(args.task, args.framework)(args.model)
-    annotator = build_annotator(args.task, client, estimator)
-    annotator.annotate(args.project, args.mapping)
+    annotator = build_annotator(
+        args.task, client, estimator, args.batch_size, args.workers, args.downloads, args.max_download_mb * 2**20
+    )
+    run = args.run or f"{args.task}-{Path(args.model).name}"
+    checkpoint_path = Path(DOCCANO_HOME) / "predict" / str(args.project) / f"{run}.ids"
+    failed_path = checkpoint_path.with_suffix(".failed.jsonl")
+    if not args.resume:
+        failed_path.unlink(missing_ok=True)
+    with Checkpoint(checkpoint_path, flush_every=args.checkpoint_every, resume=args.resume) as checkpoint:
+        if args.resume:
+            print(f"Resuming run {run}: {len(checkpoint)} examples already processed.")
+        annotator.annotate(args.project, args.mapping, checkpoint, args.skip_annotated, failed_path)
     client.logout()
 
 
@@ -85,6 +96,22 @@ def main():
     parser_predict.add_argument("--model", type=str, required=True, help="model path")
     parser_predict.add_argument("--mapping", type=str, required=False, help="mapping file for label type")
     parser_predict.add_argument("--framework", default="spacy", choices=["spacy"], help="framework to predict output")
+    parser_predict.add_argument("--batch-size", type=int, default=32, help="number of texts predicted together (ner)")
+    parser_predict.add_argument(
+        "--workers", type=int, default=1, help="number of processes (ner) or threads (asr) running the model"
+    )
+    parser_predict.add_argument(
+        "--downloads", type=int, default=4, help="number of audio files downloaded at once (asr)"
+    )
+    parser_predict.add_argument(
+        "--max-download-mb", type=int, default=512, help="disk space for audio files awaiting transcription (asr)"
+    )
+    parser_predict.add_argument("--run", type=str, help="name of the run to checkpoint (default: task and model)")
+    parser_predict.add_argument("--resume", action="store_true", help="skip the examples processed by the run")
+    parser_predict.add_argument(
+        "--checkpoint-every", type=int, default=100, help="number of processed examples between checkpoint writes"
+    )
+    parser_predict.add_argument("--skip-annotated", action="store_true", help="skip the examples that have labels")
     parser_predict.set_defaults(handler=command_predict)
 
     # Create a parser for active learning
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Iterator
+from typing import Iterable, Iterator, List, Tuple, TypeVar
 
 from doccano_client.cli.entity import Entity
 
+C = TypeVar("C")
+
 
 class SpaCyEntityEstimator:
     def __init__(self, model: str):
@@ -16,6 +18,23 @@ class SpaCyEntityEstimator:
         for entity in doc.ents:
             yield Entity(start_char=entity.start_char, end_char=entity.end_char, label=entity.label_)
 
+    def predict_many(
+        self, items: Iterable[Tuple[str, C]], batch_size: int = 32, n_process: int = 1
+    ) -> Iterator[Tuple[List[Entity], C]]:
+        """Predict the entities of many texts in batches, possibly on several processes
+
+        Args:
+            items (Iterable[Tuple[str, C]]): Pairs of a text and a picklable context, e.g. an example id
+            batch_size (int): The number of texts processed together. Defaults to 32.
+            n_process (int): The number of processes running the model. Defaults to 1.
+
+        Yields:
+            Tuple[List[Entity], C]: The entities of the next text and its context, in input order
+        """
+        for doc, context in self.nlp.pipe(items, as_tuples=True, batch_size=batch_size, n_process=n_process):
+            entities = [Entity(entity.start_char, entity.end_char, entity.label_) for entity in doc.ents]
+            yield entities, context
+
 
 class ASREstimator:
     def __init__(self, model: str):
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
 import abc
+import collections
 import json
 import pathlib
-import shutil
-from typing import Dict, Iterator
+import tempfile
+import threading
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-import requests
 from tqdm import tqdm
 
 from doccano_client import DoccanoClient
 from doccano_client.cli.entity import Entity
+from doccano_client.models.bulk import BulkItemResult
+from doccano_client.models.example import Example
+from doccano_client.models.label import Label, Span, Text
+from doccano_client.usecase.project_label import LABEL_TYPE
+from doccano_client.utils.checkpoint import Checkpoint
+from doccano_client.utils.pipeline import Pipeline, Stage
 
 
 def load_mapping(filepath: str, encoding="utf-8") -> dict[str, str]:
@@ -25,45 +44,219 @@ def load_mapping(filepath: str, encoding="utf-8") -> dict[str, str]:
         return mapping
 
 
-def download_file(url: str, filename: str) -> pathlib.Path:
-    path = pathlib.Path(filename)
-    with requests.get(url, stream=True) as r:
-        with path.open(mode="wb") as f:
-            shutil.copyfileobj(r.raw, f)
-    return path
+class AudioDownloader:
+    """Download the files of examples into a temporary directory ahead of their transcription
+
+    The files are downloaded with the session of the client. A download starts only while the
+    files on disk take less than max_bytes, so slow transcription bounds the disk usage instead
+    of filling it. Each file must be released once transcribed.
+    """
+
+    def __init__(self, client: DoccanoClient, max_bytes: int = 512 * 2**20, dir: Optional[str] = None):
+        self.client = client
+        self.max_bytes = max_bytes
+        self._dir = tempfile.TemporaryDirectory(prefix="doccano-audio-", dir=dir)
+        self._sizes: Dict[pathlib.Path, int] = {}
+        self._space = threading.Condition()
+        self._in_flight = 0
+        self._closed = False
+
+    def __enter__(self) -> AudioDownloader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def download(self, example: Example) -> Optional[Tuple[Example, pathlib.Path]]:
+        with self._space:
+            # a file larger than max_bytes is still downloaded once the directory is empty.
+            self._space.wait_for(lambda: self._closed or not self._sizes or sum(self._sizes.values()) < self.max_bytes)
+            if self._closed:
+                return None
+            path = pathlib.Path(self._dir.name) / f"{example.id}{pathlib.Path(example.upload_name).suffix}"
+            self._sizes[path] = 0
+            self._in_flight += 1
+        try:
+            self.client.download_example_file(example, path)
+            size = path.stat().st_size
+        except BaseException:
+            self.release(path)
+            raise
+        finally:
+            with self._space:
+                self._in_flight -= 1
+                self._space.notify_all()
+        with self._space:
+            self._sizes[path] = size
+        return example, path
+
+    def release(self, path: pathlib.Path) -> None:
+        path.unlink(missing_ok=True)
+        with self._space:
+            self._sizes.pop(path, None)
+            self._space.notify_all()
+
+    def cancel(self) -> None:
+        """Stop starting downloads and wake up the ones waiting for disk space"""
+        with self._space:
+            self._closed = True
+            self._space.notify_all()
+
+    def close(self) -> None:
+        """Cancel, wait for the downloads in flight and remove the temporary directory"""
+        with self._space:
+            self._closed = True
+            self._space.notify_all()
+            self._space.wait_for(lambda: self._in_flight == 0)
+        self._dir.cleanup()
 
 
 class LabelAnnotator(abc.ABC):
-    def __init__(self, client: DoccanoClient, estimator):
+    label_type: LABEL_TYPE
+
+    def __init__(self, client: DoccanoClient, estimator, batch_size: int = 32, workers: int = 1, post_workers: int = 8):
         self.client = client
         self.estimator = estimator
+        self.batch_size = batch_size
+        self.workers = workers
+        self.post_workers = post_workers
 
-    def annotate(self, project_id: int, filename: str = None):
+    def annotate(
+        self,
+        project_id: int,
+        filename: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        skip_annotated: bool = False,
+        failed_path: Optional[pathlib.Path] = None,
+    ):
         raise NotImplementedError()
 
+    def _run(
+        self,
+        project_id: int,
+        stages: List[Stage],
+        create: Callable[..., Iterator[BulkItemResult]],
+        checkpoint: Optional[Checkpoint] = None,
+        skip_annotated: bool = False,
+        failed_path: Optional[pathlib.Path] = None,
+    ) -> Pipeline:
+        # fetch examples, predict and post labels concurrently, each stage waiting for the
+        # next one when the queue between them is full.
+        total = self.client.count_examples(project_id)
+        annotated = self._annotated_ids(project_id) if skip_annotated else set()
+        failures = 0
+        failed_file: Optional[IO[str]] = None
+
+        def report_failure(result: BulkItemResult) -> None:
+            # the labels that could not be created are appended to failed_path as JSON lines,
+            # which bulk_create_* accepts as they are to retry them.
+            nonlocal failures, failed_file
+            failures += 1
+            if failed_path is None:
+                return
+            if failed_file is None:
+                failed_path.parent.mkdir(parents=True, exist_ok=True)
+                failed_file = failed_path.open("a", encoding="utf-8")
+            failed_file.write(json.dumps({**result.item.dict(exclude={"id"}), "error": str(result.error)}) + "\n")
+            failed_file.flush()
+
+        with tqdm(total=total) as progress:
+
+            def pending_examples() -> Iterator[Example]:
+                for example in self.client.list_examples(project_id):
+                    if example.id in annotated or (checkpoint is not None and example.id in checkpoint):
+                        progress.update()
+                    else:
+                        yield example
+
+            def post(items: Iterator[Tuple[Optional[int], List[Label]]]) -> Iterator[Optional[int]]:
+                # the labels of all examples go through a single bulk create, so at most post_workers
+                # requests are in flight for the whole run. Its results come in input order: an example
+                # is done once the results of all its labels arrived.
+                pending: Deque[List[Any]] = collections.deque()  # [example id, labels left]
+
+                def labels() -> Iterator[Label]:
+                    for example_id, example_labels in items:
+                        pending.append([example_id, len(example_labels)])
+                        yield from example_labels
+
+                def finish() -> Iterator[Optional[int]]:
+                    while pending and pending[0][1] == 0:
+                        example_id, _ = pending.popleft()
+                        # an example is checkpointed even if some of its labels failed: predicting it
+                        # again would post its other labels twice. The failed ones are reported instead.
+                        if checkpoint is not None:
+                            checkpoint.add(example_id)
+                        progress.update()
+                        yield example_id
+
+                for result in create(project_id, labels(), max_workers=self.post_workers):
+                    yield from finish()
+                    pending[0][1] -= 1
+                    if not result.ok:
+                        report_failure(result)
+                    yield from finish()
+                yield from finish()
+
+            pipeline = Pipeline([*stages, Stage("post", post, stream=True)], queue_size=2 * self.batch_size)
+            try:
+                pipeline.run(pending_examples())
+            finally:
+                if failed_file is not None:
+                    failed_file.close()
+                if checkpoint is not None:
+                    checkpoint.flush()
+        print(pipeline.report())
+        if annotated:
+            print(f"Skipped {len(annotated)} annotated examples.")
+        if failures:
+            print(
+                f"Failed to create {failures} labels." + (f" They are listed in {failed_path}." if failed_path else "")
+            )
+        return pipeline
+
+    def _annotated_ids(self, project_id: int) -> Set[int]:
+        # iter_project_labels reads the export only when it holds the labels of every user.
+        labels = self.client.iter_project_labels(project_id, types=[self.label_type])
+        return {example.id for example, labels_by_type in labels if labels_by_type[self.label_type]}  # type: ignore
+
 
 class SpanAnnotator(LabelAnnotator):
-    def annotate(self, project_id: int, filename: str = None):
+    label_type: LABEL_TYPE = "span"
+
+    def annotate(
+        self,
+        project_id: int,
+        filename: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        skip_annotated: bool = False,
+        failed_path: Optional[pathlib.Path] = None,
+    ):
         span_types = self.client.list_label_types(project_id, type="span")
         type_to_id: Dict[str, int] = {span_type.text: span_type.id for span_type in span_types}  # type: ignore
         mapping = load_mapping(filename) if filename else {}
 
-        # predict label and post it.
-        total = self.client.count_examples(project_id)
-        examples = self.client.list_examples(project_id)
-        for example in tqdm(examples, total=total):
-            entities = self.estimator.predict(example.text)
-            entities = self._convert_label_name(entities, mapping)
-            # Todo: bulk create
-            for entity in entities:
-                if entity.label in type_to_id:
-                    self.client.create_span(
-                        project_id,
-                        example.id,
-                        start_offset=entity.start_char,
-                        end_offset=entity.end_char,
-                        label=type_to_id[entity.label],
-                    )
+        def predict(examples: Iterator[Example]) -> Iterator[Tuple[int, List[Span]]]:
+            return self._predict_spans(examples, type_to_id, mapping)
+
+        stages = [Stage("predict", predict, stream=True)]
+        self._run(project_id, stages, self.client.bulk_create_spans, checkpoint, skip_annotated, failed_path)
+
+    def _predict_spans(
+        self, examples: Iterable[Example], type_to_id: Dict[str, int], mapping: dict[str, str]
+    ) -> Iterator[Tuple[int, List[Span]]]:
+        texts = ((example.text or "", example.id) for example in examples)
+        for entities, example_id in self.estimator.predict_many(texts, self.batch_size, self.workers):
+            yield example_id, [
+                Span(
+                    example=example_id,
+                    start_offset=entity.start_char,
+                    end_offset=entity.end_char,
+                    label=type_to_id[entity.label],
+                )
+                for entity in self._convert_label_name(entities, mapping)
+                if entity.label in type_to_id
+            ]
 
     def _convert_label_name(self, entities: list[Entity], mapping: dict[str, str]) -> Iterator[Entity]:
         for entity in entities:
@@ -73,20 +266,61 @@ class SpanAnnotator(LabelAnnotator):
 
 
 class ASRAnnotator(LabelAnnotator):
-    def annotate(self, project_id: int, filename: str = None):
-        # predict label and post it.
-        total = self.client.count_examples(project_id)
-        examples = self.client.list_examples(project_id)
-        for example in tqdm(examples, total=total):
-            audio_file = download_file(example.filename, example.upload_name)
+    label_type: LABEL_TYPE = "text"
+
+    def __init__(
+        self,
+        client: DoccanoClient,
+        estimator,
+        batch_size: int = 32,
+        workers: int = 1,
+        post_workers: int = 8,
+        downloads: int = 4,
+        max_download_bytes: int = 512 * 2**20,
+    ):
+        super().__init__(client, estimator, batch_size, workers, post_workers)
+        self.downloads = downloads
+        self.max_download_bytes = max_download_bytes
+
+    def annotate(
+        self,
+        project_id: int,
+        filename: Optional[str] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        skip_annotated: bool = False,
+        failed_path: Optional[pathlib.Path] = None,
+    ):
+        # download the next audio files while the current ones are transcribed.
+        with AudioDownloader(self.client, self.max_download_bytes) as downloader:
+            stages = [
+                Stage("download", downloader.download, self.downloads, on_stop=downloader.cancel),
+                Stage("predict", lambda item: self._transcribe(downloader, *item), self.workers),
+            ]
+            self._run(project_id, stages, self.client.bulk_create_texts, checkpoint, skip_annotated, failed_path)
+
+    def _transcribe(
+        self, downloader: AudioDownloader, example: Example, audio_file: pathlib.Path
+    ) -> Tuple[Optional[int], List[Text]]:
+        try:
             text = self.estimator.predict(str(audio_file))
-            self.client.create_text(project_id, example.id, text)
-            audio_file.unlink()
+        finally:
+            downloader.release(audio_file)
+        return example.id, [Text(example=example.id, text=text)]  # type: ignore
 
 
-def build_annotator(task: str, client: DoccanoClient, estimator) -> LabelAnnotator:
+def build_annotator(
+    task: str,
+    client: DoccanoClient,
+    estimator,
+    batch_size: int = 32,
+    workers: int = 1,
+    downloads: int = 4,
+    max_download_bytes: int = 512 * 2**20,
+) -> LabelAnnotator:
     if task == "ner":
-        return SpanAnnotator(client, estimator)
+        return SpanAnnotator(client, estimator, batch_size, workers)
     if task == "asr":
-        return ASRAnnotator(client, estimator)
+        return ASRAnnotator(
+            client, estimator, batch_size, workers, downloads=downloads, max_download_bytes=max_download_bytes
+        )
     raise ValueError("There is no annotator.")
@@ -1,8 +1,22 @@
 from __future__ import annotations
 
 import pathlib
-from typing import Any, Dict, Iterator, List, Literal, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from requests.adapters import BaseAdapter
 
+from doccano_client.models.bulk import BulkItemResult
 from doccano_client.models.comment import Comment
 from doccano_client.models.data_download import Option as DataExportOption
 from doccano_client.models.data_upload import Option as DataImportOption
@@ -11,6 +25,7 @@ from doccano_client.models.example import Example
 from doccano_client.models.label import (
     BoundingBox,
     Category,
+    Label,
     Relation,
     Segment,
     Span,
@@ -32,6 +47,7 @@ from doccano_client.repositories.example import ExampleRepository
 from doccano_client.repositories.label import (
     BoundingBoxRepository,
     CategoryRepository,
+    LabelRepository,
     RelationRepository,
     SegmentRepository,
     SpanRepository,
@@ -65,11 +81,33 @@ from doccano_client.usecase.label import (
 from doccano_client.usecase.label_type import LabelTypeUseCase
 from doccano_client.usecase.member import MemberUseCase
 from doccano_client.usecase.project import ProjectType, ProjectUseCase
+from doccano_client.usecase.project_label import LABEL_TYPE, ProjectLabelUseCase
 from doccano_client.usecase.user_details import UserDetailsUseCase
+from doccano_client.utils.cache import ResponseCache
+from doccano_client.utils.instrumentation import RequestHook
+from doccano_client.utils.retry import RetryPolicy
 
 
 class DoccanoClient:
-    def __init__(self, base_url: str, verify: Optional[str | bool] = None):
+    def __init__(
+        self,
+        base_url: str,
+        verify: Optional[str | bool] = None,
+        page_size: Optional[int] = None,
+        label_type_cache_ttl: float = 60.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: Optional[float | Tuple[float, float]] = None,
+        adapter: Optional[BaseAdapter] = None,
+        thread_safe: bool = False,
+        json_backend: Optional[str] = None,
+        trusted_responses: bool = False,
+        cache: Optional[ResponseCache] = None,
+        hooks: Optional[Iterable[RequestHook]] = None,
+    ):
         """Initialize the client.
 
         Args:
@@ -82,29 +120,80 @@ class DoccanoClient:
                 certificates, which will make your application vulnerable to
                 man-in-the-middle (MitM) attacks. Setting verify to ``False``
                 may be useful during local development or testing.
-        """
-        self._base_repository = BaseRepository(base_url, verify=verify)
+            page_size (int, optional): The default number of items requested per page when listing
+                projects, examples and comments. Defaults to None, which uses the server's page size.
+            label_type_cache_ttl (float): The number of seconds label types looked up by name are
+                cached per project. The cache is dropped whenever label types are changed through
+                this client. 0 disables the cache. Defaults to 60.
+            retry_policy (RetryPolicy, optional): The policy for retrying requests rejected by an
+                overloaded server. Defaults to None, which retries idempotent requests up to 3 times
+                on 429, 502 and 503 with jittered exponential backoff. Pass RetryPolicy(max_attempts=1)
+                to disable retries.
+            pool_connections (int): The number of connection pools to cache, one per host. Defaults to 10.
+            pool_maxsize (int): The maximum number of connections kept open per host. Set it to at
+                least the number of threads sharing the client. Defaults to 10.
+            pool_block (bool): Whether to wait for a free connection when the pool is exhausted
+                instead of opening a connection that is discarded after use. Defaults to False.
+            keep_alive (bool): Whether to reuse connections between requests. Defaults to True.
+            timeout (float | Tuple[float, float], optional): The socket timeout in seconds, or a
+                (connect, read) tuple, applied to every request. Defaults to None, which waits forever.
+            adapter (BaseAdapter, optional): A custom transport adapter mounted for http and https
+                instead of the default pooled one. The pool options are ignored when it is given.
+            thread_safe (bool): Whether the client may be used from many threads at once. Each
+                thread then gets its own session, while the connection pool, the cookies and the
+                CSRF token are shared, and an expired login is renewed once under a lock.
+                Defaults to False.
+            json_backend (str, optional): The JSON library encoding request bodies and decoding
+                responses, one of "orjson", "ujson" and "json". Defaults to None, which picks orjson
+                or ujson when installed and falls back to the standard library.
+            trusted_responses (bool): Whether to build examples, comments, members and labels
+                received from the server without validating them, which makes listing them faster.
+                Models sent to the server are still validated. Defaults to False.
+            cache (ResponseCache, optional): The cache of get responses, e.g. MemoryCache(ttl=60) or
+                DiskCache(directory). Stale entries are revalidated with ETag or Last-Modified when the
+                server sends them, and writes through this client invalidate the entries they affect.
+                Defaults to None, which disables caching.
+            hooks (Iterable[RequestHook], optional): The hooks called before each request and after its
+                response or error, e.g. a StatsCollector reporting latency percentiles per endpoint,
+                or an OpenTelemetryHook. Defaults to None.
+        """
+        self._base_repository = BaseRepository(
+            base_url,
+            verify=verify,
+            page_size=page_size,
+            retry_policy=retry_policy,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            timeout=timeout,
+            adapter=adapter,
+            thread_safe=thread_safe,
+            json_backend=json_backend,
+            cache=cache,
+            hooks=hooks,
+        )
         self._user_repository = UserRepository(self._base_repository)
         self._user_details_repository = UserDetailsRepository(self._base_repository)
         self._role_repository = RoleRepository(self._base_repository)
         self._project_repository = ProjectRepository(self._base_repository)
         self._metrics_repository = MetricsRepository(self._base_repository)
-        self._example_repository = ExampleRepository(self._base_repository)
-        self._comment_repository = CommentRepository(self._base_repository)
-        self._member_repository = MemberRepository(self._base_repository)
+        self._example_repository = ExampleRepository(self._base_repository, trusted=trusted_responses)
+        self._comment_repository = CommentRepository(self._base_repository, trusted=trusted_responses)
+        self._member_repository = MemberRepository(self._base_repository, trusted=trusted_responses)
 
         # label type repositories
-        self._category_type_repository = CategoryTypeRepository(self._base_repository)
-        self._span_type_repository = SpanTypeRepository(self._base_repository)
-        self._relation_type_repository = RelationTypeRepository(self._base_repository)
+        self._category_type_repository = CategoryTypeRepository(self._base_repository, cache_ttl=label_type_cache_ttl)
+        self._span_type_repository = SpanTypeRepository(self._base_repository, cache_ttl=label_type_cache_ttl)
+        self._relation_type_repository = RelationTypeRepository(self._base_repository, cache_ttl=label_type_cache_ttl)
 
         # label repositories
-        self._category_repository = CategoryRepository(self._base_repository)
-        self._span_repository = SpanRepository(self._base_repository)
-        self._relation_repository = RelationRepository(self._base_repository)
-        self._segment_repository = SegmentRepository(self._base_repository)
-        self._bounding_box_repository = BoundingBoxRepository(self._base_repository)
-        self._text_repository = TextRepository(self._base_repository)
+        self._category_repository = CategoryRepository(self._base_repository, trusted=trusted_responses)
+        self._span_repository = SpanRepository(self._base_repository, trusted=trusted_responses)
+        self._relation_repository = RelationRepository(self._base_repository, trusted=trusted_responses)
+        self._segment_repository = SegmentRepository(self._base_repository, trusted=trusted_responses)
+        self._bounding_box_repository = BoundingBoxRepository(self._base_repository, trusted=trusted_responses)
+        self._text_repository = TextRepository(self._base_repository, trusted=trusted_responses)
 
         self._task_status_repository = TaskStatusRepository(self._base_repository)
         self._data_import_repository = DataUploadRepository(self._base_repository)
@@ -186,6 +275,29 @@ class DoccanoClient:
     def text(self) -> TextUseCase:
         return TextUseCase(self._text_repository)
 
+    @property
+    def project_label(self) -> ProjectLabelUseCase:
+        label_repositories: Dict[LABEL_TYPE, LabelRepository] = {
+            "category": self._category_repository,
+            "span": self._span_repository,
+            "relation": self._relation_repository,
+            "text": self._text_repository,
+            "bounding_box": self._bounding_box_repository,
+            "segment": self._segment_repository,
+        }
+        label_type_repositories = {
+            "category": self._category_type_repository,
+            "span": self._span_type_repository,
+            "relation": self._relation_type_repository,
+        }
+        return ProjectLabelUseCase(
+            self._example_repository,
+            label_repositories,
+            label_type_repositories,
+            self._project_repository,
+            self.data_export,
+        )
+
     @property
     def user_details(self) -> UserDetailsUseCase:
         return UserDetailsUseCase(self._user_details_repository)
@@ -280,13 +392,18 @@ class DoccanoClient:
         """
         return self._user_repository.find_by_name(name)
 
-    def list_projects(self) -> Iterator[Project]:
+    def list_projects(self, max_workers: int = 1, page_size: Optional[int] = None) -> Iterator[Project]:
         """Return all projects in which you are a member.
 
+        Args:
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
+
         Yields:
             Project: The next project.
         """
-        yield from self.project.list()
+        yield from self.project.list(max_workers, page_size)
 
     def find_project_by_id(self, project_id: int) -> Project:
         """Find a project by id.
@@ -576,17 +693,26 @@ class DoccanoClient:
         """
         self._get_label_type_usecase(type).upload(project_id, file_path)
 
-    def list_examples(self, project_id: int, is_confirmed: Optional[bool] = None) -> Iterator[Example]:
+    def list_examples(
+        self,
+        project_id: int,
+        is_confirmed: Optional[bool] = None,
+        max_workers: int = 1,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Example]:
         """Return all examples.
 
         Args:
             project_id (int): The id of the project.
             is_confirmed (bool, optional): Filter by confirmed state. Defaults to None.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
 
         Yields:
             Example: The examples in the project.
         """
-        yield from self.example.list(project_id, is_confirmed)
+        yield from self.example.list(project_id, is_confirmed, max_workers, page_size)
 
     def find_example_by_id(self, project_id: int, example_id: int) -> Example:
         """Find an example by id.
@@ -611,6 +737,18 @@ class DoccanoClient:
         """
         return self.example.count(project_id)
 
+    def download_example_file(self, example: Example, file_path: str | pathlib.Path) -> pathlib.Path:
+        """Download the uploaded file of an example, e.g. an audio file, with the session of the client.
+
+        Args:
+            example (Example): The example, as returned by find_example_by_id or list_examples.
+            file_path (str | pathlib.Path): The path to save the file to.
+
+        Returns:
+            pathlib.Path: The path to the downloaded file.
+        """
+        return self.example.download_file(example, file_path)
+
     def create_example(self, project_id: int, text: str, score: float = 100.0, meta: Dict[str, Any] = None) -> Example:
         """Create a new example.
 
@@ -642,6 +780,46 @@ class DoccanoClient:
         """
         return self.example.update(project_id, example_id, text, score, meta)
 
+    def bulk_update_examples(
+        self, project_id: int, updates: Mapping[int, Dict[str, Any]], max_workers: int = 8
+    ) -> Iterator[BulkItemResult]:
+        """Update some fields of many examples with concurrent requests.
+
+        The examples are updated as the results are consumed, with at most max_workers
+        requests in flight. A failed request does not stop the others.
+
+        Args:
+            project_id (int): The id of the project.
+            updates (Mapping[int, Dict[str, Any]]): The new values by field name, by example id,
+                e.g. {1: {"score": 0.5}}.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each update, in input order.
+        """
+        yield from self.example.bulk_update(project_id, updates, max_workers)
+
+    def bulk_update_example_scores(
+        self,
+        project_id: int,
+        scores: Mapping[int, float],
+        current: Optional[Mapping[int, float]] = None,
+        max_workers: int = 8,
+    ) -> Iterator[BulkItemResult]:
+        """Update the confidence scores of many examples with concurrent requests.
+
+        Args:
+            project_id (int): The id of the project.
+            scores (Mapping[int, float]): The new scores by example id.
+            current (Mapping[int, float], optional): The scores the server already holds by example id.
+                Examples whose score is unchanged are skipped. Defaults to None, which updates all.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each sent update, in input order.
+        """
+        yield from self.example.bulk_update_scores(project_id, scores, current, max_workers)
+
     def delete_example(self, project_id: int, example_id: int):
         """Delete an example.
 
@@ -689,18 +867,23 @@ class DoccanoClient:
         """
         return self.comment.find_by_id(project_id, comment_id)
 
-    def list_comments(self, project_id: int, example_id: int, query: str = "") -> Iterator[Comment]:
+    def list_comments(
+        self, project_id: int, example_id: int, query: str = "", max_workers: int = 1, page_size: Optional[int] = None
+    ) -> Iterator[Comment]:
         """Return all comments.
 
         Args:
             project_id (int): The id of the project.
             example_id (int): The id of the example.
             query (str): The query string to filter comments.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
 
         Yields:
             Comment: The comments in the project.
         """
-        yield from self.comment.list(project_id, example_id, query)
+        yield from self.comment.list(project_id, example_id, query, max_workers, page_size)
 
     def create_comment(self, project_id: int, example_id: int, text: str) -> Comment:
         """Create a new comment.
@@ -776,11 +959,14 @@ class DoccanoClient:
         format: str,
         column_data: str = "text",
         column_label: str = "label",
+        max_workers: int = 4,
+        progress: Optional[Callable[[str, int, int], None]] = None,
     ) -> TaskStatus:
-        """Upload a file. `task` is one of the
+        """Upload files concurrently and import them. `task` is one of the
         `DocumentClassification`, `SequenceLabeling`, `Seq2seq`, `Speech2text`,
         `ImageClassification`, `BoundingBox`, `Segmentation`, `ImageCaptioning`,
         , `IntentDetectionAndSlotFilling`, and `RelationExtraction`.
+        If any upload fails, the files already uploaded are reverted.
 
         Args:
             project_id (int): The id of the project.
@@ -789,11 +975,91 @@ class DoccanoClient:
             format (str): The format of the upload.
             column_data (str): The column name of the data.
             column_label (str): The column name of the label.
+            max_workers (int): The maximum number of files uploaded concurrently. Defaults to 4.
+            progress (Callable[[str, int, int], None], optional): Called after each uploaded file
+                with its path, the number of uploaded files and the total number of files.
 
         Returns:
             TaskStatus: The status of the upload task.
         """
-        return self.data_import.upload(project_id, file_paths, task, format, column_data, column_label)
+        return self.data_import.upload(
+            project_id, file_paths, task, format, column_data, column_label, max_workers, progress
+        )
+
+    def bulk_create_examples(
+        self,
+        project_id: int,
+        examples: Iterable[Example | Dict[str, Any]],
+        task: Task,
+        chunk_size: int = 1000,
+        column_data: str = "text",
+        column_label: str = "label",
+        max_workers: int = 4,
+    ) -> List[TaskStatus]:
+        """Create many examples through the file import, without writing files to disk.
+
+        Args:
+            project_id (int): The id of the project.
+            examples (Iterable[Example | Dict[str, Any]]): The examples to create. An Example is
+                imported with its text and meta. A dict is imported as a JSONL line, so it can
+                also carry labels under column_label.
+            task (Task): The task of the project.
+            chunk_size (int): The number of examples per uploaded file. Defaults to 1000.
+            column_data (str): The column name of the data.
+            column_label (str): The column name of the label.
+            max_workers (int): The maximum number of chunks uploaded concurrently. Defaults to 4.
+
+        Returns:
+            List[TaskStatus]: The status of the import task of each chunk.
+        """
+        return self.data_import.upload_examples(
+            project_id, examples, task, chunk_size, column_data, column_label, max_workers
+        )
+
+    def iter_export(
+        self, project_id: int, format: str = "JSONL", only_approved=False, chunk_size: int = 65536
+    ) -> Iterator[Tuple[Example, Dict[str, Any]]]:
+        """Export the project and iterate over its records while the export is received.
+
+        Args:
+            project_id (int): The id of the project.
+            format (str): The format of the export. Must be a JSONL format. Defaults to "JSONL".
+            only_approved (bool): Whether to export approved data only.
+            chunk_size (int): The size of the chunks read from the response. Defaults to 65536.
+
+        Yields:
+            Tuple[Example, Dict[str, Any]]: The next example and its labels keyed by column name,
+                e.g. "label" or "entities" and "relations".
+        """
+        yield from self.data_export.iter_export(project_id, format, only_approved, chunk_size)
+
+    def iter_project_labels(
+        self,
+        project_id: int,
+        types: Iterable[LABEL_TYPE] = ("span",),
+        is_confirmed: Optional[bool] = None,
+        max_workers: int = 8,
+        use_export: Optional[bool] = None,
+    ) -> Iterator[Tuple[Example, Dict[str, List[Label]]]]:
+        """Iterate over all examples of a project together with their labels.
+
+        The labels are fetched per example with concurrent requests, or read from a streamed
+        export of the project when that is cheaper.
+
+        Args:
+            project_id (int): The id of the project.
+            types (Iterable[str]): The types of labels to get, among "category", "span", "relation",
+                "text", "bounding_box" and "segment". Defaults to ("span",).
+            is_confirmed (bool, optional): Filter by confirmed state. Defaults to None.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+            use_export (bool, optional): Whether to read the labels from the export. Defaults to None,
+                which uses it for large collaborative projects when all types can be exported.
+
+        Yields:
+            Tuple[Example, Dict[str, List[Label]]]: The next example and its labels by type,
+                e.g. {"span": [Span(...)]}.
+        """
+        yield from self.project_label.iter_labels(project_id, types, is_confirmed, max_workers, use_export)
 
     def download(self, project_id: int, format: str, only_approved=False, dir_name=".") -> pathlib.Path:
         """Download a file.
@@ -1241,6 +1507,84 @@ class DoccanoClient:
         """
         return self.text.create(project_id, example_id, text, human_annotated, confidence)
 
+    def bulk_create_categories(
+        self, project_id: int, categories: Iterable[Category | Dict[str, Any]], max_workers: int = 8
+    ) -> Iterator[BulkItemResult]:
+        """Create many category labels, possibly for many examples, with concurrent requests.
+
+        The labels are created as the results are consumed, with at most max_workers
+        requests in flight. A label given as a dict is validated before it is sent. An
+        invalid label or a failed request does not stop the others.
+
+        Args:
+            project_id (int): The id of the project.
+            categories (Iterable[Category | Dict[str, Any]]): The category labels to create.
+                Each label holds the id of its example.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each label, in input order.
+        """
+        yield from self.category.bulk_create(project_id, categories, max_workers)
+
+    def bulk_create_spans(
+        self, project_id: int, spans: Iterable[Span | Dict[str, Any]], max_workers: int = 8
+    ) -> Iterator[BulkItemResult]:
+        """Create many span labels, possibly for many examples, with concurrent requests.
+
+        The labels are created as the results are consumed, with at most max_workers
+        requests in flight. A label given as a dict is validated before it is sent. An
+        invalid label or a failed request does not stop the others.
+
+        Args:
+            project_id (int): The id of the project.
+            spans (Iterable[Span | Dict[str, Any]]): The span labels to create. Each label holds the id of its example.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each label, in input order.
+        """
+        yield from self.span.bulk_create(project_id, spans, max_workers)
+
+    def bulk_create_relations(
+        self, project_id: int, relations: Iterable[Relation | Dict[str, Any]], max_workers: int = 8
+    ) -> Iterator[BulkItemResult]:
+        """Create many relation labels, possibly for many examples, with concurrent requests.
+
+        The labels are created as the results are consumed, with at most max_workers
+        requests in flight. A label given as a dict is validated before it is sent. An
+        invalid label or a failed request does not stop the others.
+
+        Args:
+            project_id (int): The id of the project.
+            relations (Iterable[Relation | Dict[str, Any]]): The relation labels to create.
+                Each label holds the id of its example.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each label, in input order.
+        """
+        yield from self.relation.bulk_create(project_id, relations, max_workers)
+
+    def bulk_create_texts(
+        self, project_id: int, texts: Iterable[Text | Dict[str, Any]], max_workers: int = 8
+    ) -> Iterator[BulkItemResult]:
+        """Create many text labels, possibly for many examples, with concurrent requests.
+
+        The labels are created as the results are consumed, with at most max_workers
+        requests in flight. A label given as a dict is validated before it is sent. An
+        invalid label or a failed request does not stop the others.
+
+        Args:
+            project_id (int): The id of the project.
+            texts (Iterable[Text | Dict[str, Any]]): The text labels to create. Each label holds the id of its example.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each label, in input order.
+        """
+        yield from self.text.bulk_create(project_id, texts, max_workers)
+
     def create_bounding_box(
         self,
         project_id: int,
@@ -0,0 +1,448 @@
+from __future__ import annotations
+
+import pathlib
+import sqlite3
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from doccano_client.client import DoccanoClient
+from doccano_client.models.comment import Comment
+from doccano_client.models.example import Example
+from doccano_client.models.label import (
+    BoundingBox,
+    Category,
+    Label,
+    Relation,
+    Segment,
+    Span,
+    Text,
+)
+from doccano_client.models.label_type import LabelType
+from doccano_client.models.member import Member
+from doccano_client.models.metrics import LabelCount, LabelDistribution, Progress
+from doccano_client.usecase.project_label import LABEL_TYPE
+from doccano_client.utils.concurrency import ordered_map
+from doccano_client.utils.json_backend import get_json_backend
+from doccano_client.utils.models import construct
+
+LABEL_CLASSES: Dict[str, Type[Label]] = {
+    "category": Category,
+    "span": Span,
+    "relation": Relation,
+    "text": Text,
+    "bounding_box": BoundingBox,
+    "segment": Segment,
+}
+TYPED_LABEL = Literal["category", "span", "relation"]
+TYPED_LABELS: Tuple[TYPED_LABEL, ...] = ("category", "span", "relation")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS examples (
+    id INTEGER PRIMARY KEY,
+    is_confirmed INTEGER NOT NULL,
+    comment_count INTEGER NOT NULL,
+    score REAL NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS labels (
+    type TEXT NOT NULL,
+    example INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS labels_example ON labels (example, type);
+CREATE TABLE IF NOT EXISTS label_types (
+    type TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (type, id)
+);
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY,
+    example INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS comments_example ON comments (example);
+CREATE TABLE IF NOT EXISTS members (
+    id INTEGER PRIMARY KEY,
+    data BLOB NOT NULL
+);
+"""
+
+
+class SyncResult(BaseModel):
+    added: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+
+class ProjectMirror:
+    """Local copy of a project in a SQLite database
+
+    The mirror holds the examples of a project with their labels and comments, together with
+    the label types and members. Reads are served from the database without any request.
+    sync only fetches the labels and comments of the examples that are new or whose confirmed
+    state, comment count or score changed since the last sync.
+    """
+
+    def __init__(
+        self,
+        client: DoccanoClient,
+        project_id: int,
+        path: str | pathlib.Path,
+        types: Iterable[LABEL_TYPE] = ("span",),
+        only_confirmed_labels: bool = False,
+    ):
+        """Open the mirror, creating the database if needed
+
+        Args:
+            client (DoccanoClient): The logged in client used to sync
+            project_id (int): The id of the project
+            path (str | pathlib.Path): The path of the SQLite database
+            types (Iterable[LABEL_TYPE]): The types of labels to mirror. Defaults to ("span",).
+            only_confirmed_labels (bool): Whether to mirror the labels of confirmed examples only,
+                which saves their requests for the other examples. Defaults to False.
+
+        Raises:
+            ValueError: If a type is unknown
+        """
+        self.types = list(types)
+        unknown = set(self.types) - set(LABEL_CLASSES)
+        if unknown:
+            raise ValueError(f"Unknown label types: {', '.join(sorted(unknown))}")
+        self._client = client
+        self.project_id = project_id
+        self.only_confirmed_labels = only_confirmed_labels
+        self._json = get_json_backend()
+        self._db = sqlite3.connect(str(path))
+        self._db.executescript(SCHEMA)
+
+    def __enter__(self) -> ProjectMirror:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database"""
+        self._db.close()
+
+    def _dump(self, model: BaseModel) -> bytes:
+        return self._json.dumps(model.dict())
+
+    def _load(self, model: Type[Any], data: bytes) -> Any:
+        return construct(model, self._json.loads(data))
+
+    def sync(self, max_workers: int = 8) -> SyncResult:
+        """Bring the mirror up to date with the server
+
+        Args:
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Returns:
+            SyncResult: The number of examples added, updated, deleted and left unchanged
+        """
+        known = {
+            row[0]: tuple(row[1:])
+            for row in self._db.execute("SELECT id, is_confirmed, comment_count, score FROM examples")
+        }
+        examples = list(self._client.example.list(self.project_id, max_workers=max_workers))
+        changed = []
+        result = SyncResult()
+        for example in examples:
+            state = known.pop(example.id, None)  # type: ignore
+            if state is None:
+                result.added += 1
+                changed.append(example)
+            elif state != (int(example.is_confirmed), example.comment_count, example.score):
+                result.updated += 1
+                changed.append(example)
+            else:
+                result.unchanged += 1
+        result.deleted = len(known)
+
+        def fetch(example: Example) -> Tuple[Example, Dict[str, List[Label]], List[Comment]]:
+            labels: Dict[str, List[Label]] = {}
+            if example.is_confirmed or not self.only_confirmed_labels:
+                labels = {type: getattr(self._client, type).list(self.project_id, example.id) for type in self.types}
+            comments = []
+            if example.comment_count:
+                comments = list(self._client.comment.list(self.project_id, example.id))  # type: ignore
+            return example, labels, comments
+
+        label_types = {type: self._client.list_label_types(self.project_id, type) for type in self._label_type_kinds}
+        members = self._client.list_members(self.project_id)
+        with self._db:
+            self._delete_examples(list(known) + [example.id for example in changed])
+            for example, labels, comments in ordered_map(fetch, changed, max_workers):
+                self._db.executemany(
+                    "INSERT INTO labels VALUES (?, ?, ?)",
+                    [(type, example.id, self._dump(label)) for type in labels for label in labels[type]],
+                )
+                self._db.executemany(
+                    "INSERT INTO comments VALUES (?, ?, ?)",
+                    [(comment.id, example.id, self._dump(comment)) for comment in comments],
+                )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO examples VALUES (?, ?, ?, ?, ?)",
+                [
+                    (example.id, example.is_confirmed, example.comment_count, example.score, self._dump(example))
+                    for example in examples
+                ],
+            )
+            self._db.execute("DELETE FROM label_types")
+            self._db.executemany(
+                "INSERT INTO label_types VALUES (?, ?, ?)",
+                [
+                    (type, label_type.id, self._dump(label_type))
+                    for type in label_types
+                    for label_type in label_types[type]
+                ],
+            )
+            self._db.execute("DELETE FROM members")
+            self._db.executemany(
+                "INSERT INTO members VALUES (?, ?)", [(member.id, self._dump(member)) for member in members]
+            )
+        return result
+
+    def sync_confirmed(self, max_workers: int = 8, page_size: int = 1000) -> SyncResult:
+        """Bring the confirmed states and the labels of the confirmed examples up to date
+
+        Only the confirmed examples are listed, in pages of page_size, and only the examples
+        confirmed since the last sync get their labels fetched. Confirmations withdrawn since
+        then are applied as well. The requests therefore scale with the number of confirmed
+        examples rather than the size of the project. Comments, and the labels and texts of
+        examples confirmed before, are left as they are. When the number of examples of the
+        project or its latest example changed, or nothing is mirrored yet, a full sync is made
+        instead. Comparing the latest example catches an example added and another deleted
+        between two syncs, since the ids of new examples are always greater than the former ones.
+
+        Args:
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+            page_size (int): The number of examples requested per page. Defaults to 1000.
+
+        Returns:
+            SyncResult: The number of examples updated and left unchanged, or of the full sync
+        """
+        mirrored = self.count_examples()
+        if mirrored == 0 or self._examples_changed(mirrored):
+            return self.sync(max_workers)
+        known = {row[0] for row in self._db.execute("SELECT id FROM examples WHERE is_confirmed = 1")}
+        new = []
+        for example in self._client.example.list(self.project_id, True, max_workers, page_size):
+            if example.id in known:
+                known.remove(example.id)
+            else:
+                new.append(example)
+        withdrawn = [self.find_example_by_id(example_id) for example_id in known]
+        for example in withdrawn:
+            example.is_confirmed = False
+
+        def fetch(example: Example) -> Tuple[Example, Dict[str, List[Label]]]:
+            return example, {type: getattr(self._client, type).list(self.project_id, example.id) for type in self.types}
+
+        with self._db:
+            for example, labels in ordered_map(fetch, new, max_workers):
+                self._db.execute("DELETE FROM labels WHERE example = ?", (example.id,))
+                self._db.executemany(
+                    "INSERT INTO labels VALUES (?, ?, ?)",
+                    [(type, example.id, self._dump(label)) for type in labels for label in labels[type]],
+                )
+            if self.only_confirmed_labels:
+                self._db.executemany("DELETE FROM labels WHERE example = ?", [(example.id,) for example in withdrawn])
+            self._db.executemany(
+                "UPDATE examples SET is_confirmed = ?, data = ? WHERE id = ?",
+                [(example.is_confirmed, self._dump(example), example.id) for example in new + withdrawn],
+            )
+        updated = len(new) + len(withdrawn)
+        return SyncResult(updated=updated, unchanged=mirrored - updated)
+
+    def _examples_changed(self, mirrored: int) -> bool:
+        if self._client.example.count(self.project_id) != mirrored:
+            return True
+        latest = self._client.example.find_latest(self.project_id)
+        (latest_id,) = self._db.execute("SELECT MAX(id) FROM examples").fetchone()
+        return latest is None or latest.id != latest_id
+
+    @property
+    def _label_type_kinds(self) -> List[TYPED_LABEL]:
+        return [type for type in TYPED_LABELS if type in self.types]
+
+    def _delete_examples(self, example_ids: List[int]) -> None:
+        rows = [(example_id,) for example_id in example_ids]
+        self._db.executemany("DELETE FROM examples WHERE id = ?", rows)
+        self._db.executemany("DELETE FROM labels WHERE example = ?", rows)
+        self._db.executemany("DELETE FROM comments WHERE example = ?", rows)
+
+    def find_example_by_id(self, example_id: int) -> Example:
+        """Find a mirrored example by id
+
+        Args:
+            example_id (int): The id of the example
+
+        Returns:
+            Example: The example
+
+        Raises:
+            KeyError: If the example is not mirrored
+        """
+        row = self._db.execute("SELECT data FROM examples WHERE id = ?", (example_id,)).fetchone()
+        if row is None:
+            raise KeyError(example_id)
+        return self._load(Example, row[0])
+
+    def list_examples(self, is_confirmed: Optional[bool] = None) -> Iterator[Example]:
+        """Return the mirrored examples in id order
+
+        Args:
+            is_confirmed (bool, optional): Filter by confirmed state. Defaults to None.
+
+        Yields:
+            Example: The next example
+        """
+        if is_confirmed is None:
+            rows = self._db.execute("SELECT data FROM examples ORDER BY id")
+        else:
+            rows = self._db.execute("SELECT data FROM examples WHERE is_confirmed = ? ORDER BY id", (is_confirmed,))
+        for (data,) in rows:
+            yield self._load(Example, data)
+
+    def count_examples(self, is_confirmed: Optional[bool] = None) -> int:
+        """Count the mirrored examples
+
+        Args:
+            is_confirmed (bool, optional): Filter by confirmed state. Defaults to None.
+
+        Returns:
+            int: The number of examples
+        """
+        if is_confirmed is None:
+            return self._db.execute("SELECT COUNT(*) FROM examples").fetchone()[0]
+        return self._db.execute("SELECT COUNT(*) FROM examples WHERE is_confirmed = ?", (is_confirmed,)).fetchone()[0]
+
+    def list_labels(self, type: LABEL_TYPE, example_id: Optional[int] = None) -> List[Label]:
+        """Return the mirrored labels of a type
+
+        Args:
+            type (LABEL_TYPE): The type of the labels
+            example_id (int, optional): The id of the example. Defaults to None, which returns the labels
+                of all examples.
+
+        Returns:
+            List[Label]: The labels
+
+        Raises:
+            ValueError: If the type is not mirrored
+        """
+        if type not in self.types:
+            raise ValueError(f"Label type '{type}' is not mirrored")
+        if example_id is None:
+            rows = self._db.execute("SELECT data FROM labels WHERE type = ? ORDER BY example", (type,))
+        else:
+            rows = self._db.execute("SELECT data FROM labels WHERE example = ? AND type = ?", (example_id, type))
+        return [self._load(LABEL_CLASSES[type], data) for (data,) in rows]
+
+    def list_categories(self, example_id: int) -> List[Category]:
+        """Return the mirrored categories of an example
+
+        Args:
+            example_id (int): The id of the example
+
+        Returns:
+            List[Category]: The categories
+        """
+        return self.list_labels("category", example_id)  # type: ignore
+
+    def list_spans(self, example_id: int) -> List[Span]:
+        """Return the mirrored spans of an example
+
+        Args:
+            example_id (int): The id of the example
+
+        Returns:
+            List[Span]: The spans
+        """
+        return self.list_labels("span", example_id)  # type: ignore
+
+    def list_relations(self, example_id: int) -> List[Relation]:
+        """Return the mirrored relations of an example
+
+        Args:
+            example_id (int): The id of the example
+
+        Returns:
+            List[Relation]: The relations
+        """
+        return self.list_labels("relation", example_id)  # type: ignore
+
+    def list_label_types(self, type: LABEL_TYPE) -> List[LabelType]:
+        """Return the mirrored label types
+
+        Args:
+            type (LABEL_TYPE): The type of the labels, one of "category", "span" and "relation"
+
+        Returns:
+            List[LabelType]: The label types
+        """
+        rows = self._db.execute("SELECT data FROM label_types WHERE type = ? ORDER BY id", (type,))
+        return [self._load(LabelType, data) for (data,) in rows]
+
+    def list_comments(self, example_id: Optional[int] = None) -> List[Comment]:
+        """Return the mirrored comments
+
+        Args:
+            example_id (int, optional): The id of the example. Defaults to None, which returns all comments.
+
+        Returns:
+            List[Comment]: The comments
+        """
+        if example_id is None:
+            rows = self._db.execute("SELECT data FROM comments ORDER BY id")
+        else:
+            rows = self._db.execute("SELECT data FROM comments WHERE example = ? ORDER BY id", (example_id,))
+        return [self._load(Comment, data) for (data,) in rows]
+
+    def list_members(self) -> List[Member]:
+        """Return the mirrored members
+
+        Returns:
+            List[Member]: The members
+        """
+        return [self._load(Member, data) for (data,) in self._db.execute("SELECT data FROM members ORDER BY id")]
+
+    def get_progress(self) -> Progress:
+        """Compute the progress of the authenticated user from the confirmed states
+
+        Returns:
+            Progress: The progress
+        """
+        total = self.count_examples()
+        completed = self.count_examples(is_confirmed=True)
+        return Progress(total=total, remaining=total - completed, completed=completed)
+
+    def get_label_distribution(self, type: LABEL_TYPE) -> List[LabelDistribution]:
+        """Count the mirrored labels of each member by label type
+
+        Args:
+            type (LABEL_TYPE): The type of the labels, one of "category", "span" and "relation"
+
+        Returns:
+            List[LabelDistribution]: The label counts of each member
+        """
+        names = {label_type.id: label_type.text for label_type in self.list_label_types(type)}
+        counts: Dict[Optional[int], Dict[str, int]] = {}
+        for label in self.list_labels(type):
+            label_type_id = label.type if isinstance(label, Relation) else label.label  # type: ignore
+            by_name = counts.setdefault(label.user, {})
+            name = names.get(label_type_id, str(label_type_id))
+            by_name[name] = by_name.get(name, 0) + 1
+        return [
+            LabelDistribution(
+                username=member.username,
+                counts=[
+                    LabelCount(label=name, count=counts.get(member.user, {}).get(name, 0)) for name in names.values()
+                ],
+            )
+            for member in self.list_members()
+        ]
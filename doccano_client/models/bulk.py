@@ -0,0 +1,13 @@
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+
+class BulkItemResult(BaseModel):
+    item: Any
+    result: Optional[Any] = None
+    error: Optional[Any] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
@@ -9,6 +9,8 @@ from pydantic import (
     validator,
 )
 
+from doccano_client.utils.models import depends_on
+
 
 class Label(BaseModel):
     id: Optional[int]
@@ -28,6 +30,7 @@ class Span(Label):
     end_offset: NonNegativeInt
 
     @root_validator
+    @depends_on("start_offset", "end_offset")
     def check_start_offset_is_less_than_end_offset(cls, values):
         start_offset, end_offset = values.get("start_offset"), values.get("end_offset")
         if start_offset >= end_offset:
@@ -5,6 +5,8 @@ from typing import Literal, Optional
 from pydantic import BaseModel, Field, root_validator
 from pydantic.types import ConstrainedStr
 
+from doccano_client.utils.models import depends_on
+
 PREFIX_KEY = Literal["ctrl", "shift", "ctrl shift"]
 SUFFIX_KEY = Literal[
     "0",
@@ -69,6 +71,7 @@ class LabelType(BaseModel):
     text_color: Color = Field(default="#ffffff")
 
     @root_validator
+    @depends_on("prefix_key", "suffix_key")
     def deny_only_prefix_key(cls, values):
         prefix_key = values.get("prefix_key")
         suffix_key = values.get("suffix_key")
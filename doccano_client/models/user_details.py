@@ -3,6 +3,8 @@ from typing import Dict
 from pydantic import BaseModel, root_validator
 from pydantic.types import ConstrainedStr
 
+from doccano_client.utils.models import depends_on
+
 
 class UserDetails(BaseModel):
     pk: int
@@ -27,6 +29,7 @@ class PasswordChange(BaseModel):
     confirm_password: Password
 
     @root_validator
+    @depends_on("new_password", "confirm_password")
     def new_password_matches_confirm_password(cls, values: Dict[str, Password]):
         new_password = values.get("new_password")
         confirm_password = values.get("confirm_password")
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
-from typing import Optional
+import json
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
 
 import requests
 from requests import Response, exceptions
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.cookies import RequestsCookieJar
+from requests.structures import CaseInsensitiveDict
 
 from doccano_client.exceptions import DoccanoAPIError
+from doccano_client.utils.cache import CachedResponse, ResponseCache
+from doccano_client.utils.concurrency import ordered_map
+from doccano_client.utils.instrumentation import RequestEvent, RequestHook
+from doccano_client.utils.json_backend import JSONBackend, get_json_backend
+from doccano_client.utils.retry import RetryPolicy
 
 
 def get_next_url(base_url: str, initial_url: str, response_data: dict) -> Optional[str]:
@@ -53,10 +66,99 @@ def verbose_raise_for_status(response: Response) -> Response:
     return response
 
 
+SESSION_FAILURES = ("authentication credentials were not provided", "not authenticated", "csrf failed")
+
+
+def is_session_expired(response: Response) -> bool:
+    """Tell whether a request was rejected because the session or its CSRF token expired
+
+    Doccano answers 403 both to an anonymous request and to a user lacking a permission, so a 403
+    only counts when its body reports a missing login or a CSRF failure.
+
+    Args:
+        response (Response): The response to the request
+
+    Returns:
+        bool: Whether logging in again may let the request through
+    """
+    if response.status_code == 401:
+        return True
+    if response.status_code != 403:
+        return False
+    text = response.text.lower()
+    return any(failure in text for failure in SESSION_FAILURES)
+
+
+class JSONResponse(requests.Response):
+    """Response whose json method decodes the body with the JSON backend of the repository"""
+
+    def __init__(self, json_backend: JSONBackend):
+        """Initialize an empty response
+
+        Args:
+            json_backend (JSONBackend): The JSON library decoding the body
+        """
+        super().__init__()
+        self.json_backend = json_backend
+
+    @classmethod
+    def wrap(cls, response: requests.Response, json_backend: JSONBackend) -> JSONResponse:
+        """Take over the state of a response sent by a session
+
+        Args:
+            response (requests.Response): The response
+            json_backend (JSONBackend): The JSON library decoding the body
+
+        Returns:
+            JSONResponse: The response with the same status, headers, body and connection
+        """
+        wrapped = cls(json_backend)
+        wrapped.__dict__.update(vars(response))
+        return wrapped
+
+    def json(self, **kwargs) -> Any:
+        """Decode the JSON body of the response
+
+        Args:
+            kwargs: Arguments for the standard library decoder. When given, it is used instead of the backend.
+
+        Returns:
+            Any: The decoded body
+
+        Raises:
+            requests.exceptions.JSONDecodeError: If the body is not valid JSON, whatever the backend
+        """
+        if kwargs:
+            return super().json(**kwargs)
+        try:
+            return self.json_backend.loads(self.content)
+        except ValueError as err:
+            if isinstance(err, json.JSONDecodeError):
+                raise exceptions.JSONDecodeError(err.msg, err.doc, err.pos) from err
+            # ujson reports no position.
+            raise exceptions.JSONDecodeError(str(err), self.text, 0) from err
+
+
 class BaseRepository:
     """Base repository for interacting with the Doccano API"""
 
-    def __init__(self, base_url: str, verify: Optional[str | bool] = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        verify: Optional[str | bool] = None,
+        page_size: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: Optional[float | Tuple[float, float]] = None,
+        adapter: Optional[BaseAdapter] = None,
+        thread_safe: bool = False,
+        json_backend: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
+        hooks: Optional[Iterable[RequestHook]] = None,
+    ) -> None:
         """Initialize the repository with the base url
 
         Args:
@@ -69,17 +171,120 @@ class BaseRepository:
                 certificates, which will make your application vulnerable to
                 man-in-the-middle (MitM) attacks. Setting verify to ``False``
                 may be useful during local development or testing.
+            page_size (int, optional): The default number of items requested per page by list
+                endpoints. Defaults to None, which uses the server's page size.
+            retry_policy (RetryPolicy, optional): The policy for retrying requests rejected by an
+                overloaded server. Defaults to None, which retries idempotent requests up to 3 times
+                on 429, 502 and 503.
+            pool_connections (int): The number of connection pools to cache, one per host. Defaults to 10.
+            pool_maxsize (int): The maximum number of connections kept open per host. Set it to at
+                least the number of threads sharing the client. Defaults to 10.
+            pool_block (bool): Whether to wait for a free connection when the pool is exhausted
+                instead of opening a connection that is discarded after use. Defaults to False.
+            keep_alive (bool): Whether to reuse connections between requests. Defaults to True.
+            timeout (float | Tuple[float, float], optional): The socket timeout in seconds, or a
+                (connect, read) tuple, applied to every request. Defaults to None, which waits forever.
+            adapter (BaseAdapter, optional): A custom transport adapter mounted for http and https
+                instead of the default pooled one. The pool options are ignored when it is given.
+            thread_safe (bool): Whether the repository may be used from many threads at once. Each
+                thread then gets its own session with its own copy of the headers and cookies, while
+                the connection pool is shared. A login updates the shared copy under a lock, and every
+                thread takes it over before its next request. An expired login is also renewed once,
+                under a lock, when a request is rejected with 401, or with 403 because of a missing
+                session or CSRF token. Defaults to False.
+            json_backend (str, optional): The JSON library encoding request bodies and decoding
+                responses, one of "orjson", "ujson" and "json". Defaults to None, which picks orjson
+                or ujson when installed and falls back to the standard library.
+            cache (ResponseCache, optional): The cache of get responses, e.g. MemoryCache() or
+                DiskCache(directory). The entries are kept per user. Writes through this repository
+                invalidate the entries under and above the written resource, and logging out clears
+                the entries of the user. Defaults to None, which disables caching.
+            hooks (Iterable[RequestHook], optional): The hooks called before each request and after its
+                response or error, e.g. a StatsCollector. More can be appended to the hooks attribute.
+                Defaults to None.
         """
         self._base_url = base_url.rstrip("/")
-        self._session = requests.Session()
-        if verify is not None:
-            self._session.verify = verify
-        headers = {
-            "content-type": "application/json",
-            "accept": "application/json",
-            "referer": base_url,
-        }
-        self._session.headers.update(headers)
+        self._verify = verify
+        self._thread_safe = thread_safe
+        self.json_backend = get_json_backend(json_backend)
+        self.cache = cache
+        self.hooks: List[RequestHook] = list(hooks or [])
+        self._headers = CaseInsensitiveDict(
+            {
+                "content-type": "application/json",
+                "accept": "application/json",
+                "referer": base_url,
+            }
+        )
+        if not keep_alive:
+            self._headers["connection"] = "close"
+        self._cookies = RequestsCookieJar()
+        self._local = threading.local()
+        # sessions of finished threads are dropped along with their thread-local storage
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self._sessions_lock = threading.Lock()
+        self._login_lock = threading.Lock()
+        self._auth_lock = threading.Lock()
+        self._credentials: Optional[Tuple[str, str]] = None
+        self._login_count = 0
+        self.page_size = page_size
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeout = timeout
+        self._adapter = adapter or HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
+        self._default_session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """Create a session with the transport adapter of the repository
+
+        The session of a single-threaded repository uses the headers and cookies of the
+        repository. In thread-safe mode, it gets a copy of them instead.
+
+        Returns:
+            requests.Session: The new session
+        """
+        session = requests.Session()
+        if self._verify is not None:
+            session.verify = self._verify
+        if self._thread_safe:
+            self._sync_session(session)
+        else:
+            session.headers = self._headers
+            session.cookies = self._cookies
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        with self._sessions_lock:
+            self._sessions.add(session)
+        return session
+
+    @property
+    def _session(self) -> requests.Session:
+        """Return the session of the current thread in thread-safe mode, or the shared session otherwise
+
+        Returns:
+            requests.Session: The session to send requests with
+        """
+        if not self._thread_safe:
+            return self._default_session
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._create_session()
+            self._local.session = session
+        elif self._local.login_count != self._login_count:
+            self._sync_session(session)
+        return session
+
+    def _sync_session(self, session: requests.Session) -> None:
+        """Copy the shared headers and cookies into the session of the current thread
+
+        Args:
+            session (requests.Session): The session of the current thread
+        """
+        with self._auth_lock:
+            session.headers = CaseInsensitiveDict(self._headers)
+            session.cookies = self._cookies.copy()
+            self._local.login_count = self._login_count
 
     @property
     def login_url(self) -> str:
@@ -106,23 +311,71 @@ class BaseRepository:
             username (str): The username of the user
             password (str): The password of the user
         """
-        response = self._session.post(self.login_url, json={"username": username, "password": password})
+        with self._login_lock:
+            self._login(username, password)
+            self._credentials = (username, password)
+
+    def _login(self, username: str, password: str) -> None:
+        session = self._session
+        response = session.post(self.login_url, json={"username": username, "password": password}, timeout=self.timeout)
         # TODO: do we want to do anything with the return value token in the future?
         verbose_raise_for_status(response)
-        self._session.headers.update({"X-CSRFToken": self._session.cookies.get("csrftoken")})
+        self._update_auth(session)
+
+    def _update_auth(self, session: requests.Session) -> None:
+        """Share the cookies and the CSRF token of the session that logged in or out
+
+        In thread-safe mode, the other sessions copy them before their next request.
+
+        Args:
+            session (requests.Session): The session that logged in or out
+        """
+        with self._auth_lock:
+            if session.cookies is not self._cookies:
+                self._cookies.clear()
+                self._cookies.update(session.cookies)
+            csrf_token = self._cookies.get("csrftoken")
+            if csrf_token is None:
+                self._headers.pop("X-CSRFToken", None)
+            else:
+                self._headers["X-CSRFToken"] = csrf_token
+            self._login_count += 1
+            if self._thread_safe:
+                session.headers = CaseInsensitiveDict(self._headers)
+                self._local.login_count = self._login_count
+
+    def _relogin(self, login_count: int) -> None:
+        """Login again with the stored credentials unless another thread already did
+
+        Args:
+            login_count (int): The number of logins when the rejected request was sent
+        """
+        with self._login_lock:
+            if self._credentials is not None and self._login_count == login_count:
+                self._login(*self._credentials)
 
     def logout(self) -> None:
         """Logout of the session"""
         url = f"{self.api_url}/auth/logout/"
-        response = self._session.post(url)
+        session = self._session
+        response = session.post(url, timeout=self.timeout)
         verbose_raise_for_status(response)
-        self._session.close()
-
-    def get(self, resource: str, **kwargs) -> requests.Response:
-        """Make a get request to the Doccano API
+        if self.cache is not None:
+            self.cache.clear(self._cache_scope)
+        with self._login_lock:
+            self._credentials = None
+            self._update_auth(session)
+        with self._sessions_lock:
+            for other in list(self._sessions):
+                other.close()
+
+    def request(self, method: str, resource: str, **kwargs) -> requests.Response:
+        """Make a request to the Doccano API, retrying it according to the retry policy
 
         Args:
-            resource (str): The resource to get
+            method (str): The HTTP method
+            resource (str): The resource to request. Other absolute urls, e.g. of uploaded files
+                served behind a proxy or on another port, are requested as they are.
             kwargs: Additional arguments to pass to the request
 
         Returns:
@@ -130,11 +383,228 @@ class BaseRepository:
         """
         if resource.startswith(self.api_url):
             resource = resource[len(self.api_url) + 1 :]
-        url = f"{self.api_url}/{resource}"
-        response = self._session.get(url, **kwargs)
+            url = f"{self.api_url}/{resource}"
+        elif resource.startswith(("http://", "https://")):
+            url = resource
+            resource = urlsplit(resource).path.lstrip("/")
+        else:
+            url = f"{self.api_url}/{resource}"
+        kwargs.setdefault("timeout", self.timeout)
+        if kwargs.get("json") is not None:
+            kwargs["data"] = self.json_backend.dumps(kwargs.pop("json"))
+        if not self.hooks:
+            return self._request(method, url, **kwargs)
+        event = RequestEvent(method, resource)
+        for hook in self.hooks:
+            hook.before_request(event)
+        try:
+            response = self._request(method, url, **kwargs)
+        except Exception as err:
+            error_response = getattr(err, "response", None)
+            event.finish(getattr(error_response, "status_code", None), error=err)
+            for hook in self.hooks:
+                hook.on_error(event)
+            raise
+        size = int(response.headers.get("Content-Length", 0)) if kwargs.get("stream") else len(response.content)
+        event.finish(response.status_code, size)
+        for hook in self.hooks:
+            hook.after_response(event)
+        return response
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Make a request through the cache, if any, and raise for an error status
+
+        Args:
+            method (str): The HTTP method
+            url (str): The absolute url
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            requests.Response: The response from the API
+        """
+        if self._is_cacheable(method, url, **kwargs):
+            response = self._cached_get(url, **kwargs)
+        else:
+            response = self._authenticated_send(method, url, **kwargs)
         verbose_raise_for_status(response)
+        if self.cache is not None and method.upper() not in ("GET", "HEAD", "OPTIONS"):
+            self.cache.invalidate(url)
+        return response
+
+    @property
+    def _cache_scope(self) -> str:
+        """Return the scope of the cache entries of the logged in user, kept in the fragment of their keys
+
+        Returns:
+            str: The scope, e.g. ``user=admin``
+        """
+        username = self._credentials[0] if self._credentials is not None else ""
+        return f"user={quote(username, safe='')}"
+
+    def _is_cacheable(self, method: str, url: str, **kwargs) -> bool:
+        """Tell whether a request is served through the cache
+
+        Args:
+            method (str): The HTTP method
+            url (str): The absolute url
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            bool: True for a get request, not streamed, of a cacheable resource of the API
+        """
+        if self.cache is None or method.upper() != "GET" or kwargs.get("stream"):
+            return False
+        return url.startswith(self.api_url + "/") and self.cache.is_cacheable(url[len(self.api_url) + 1 :])
+
+    def _authenticated_send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, logging in again once if the session expired in thread-safe mode
+
+        Args:
+            method (str): The HTTP method
+            url (str): The absolute url
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            requests.Response: The last response, whatever its status
+        """
+        login_count = self._login_count
+        response = self._send(method, url, **kwargs)
+        if self._thread_safe and self._credentials is not None and is_session_expired(response):
+            response.close()
+            self._relogin(login_count)
+            response = self._send(method, url, **kwargs)
+        return response
+
+    def _cached_get(self, url: str, **kwargs) -> requests.Response:
+        """Serve a get request from the cache, revalidating or refreshing the entry when needed
+
+        Args:
+            url (str): The absolute url
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            requests.Response: The cached or received response
+        """
+        assert self.cache is not None
+        key = requests.Request("GET", url, params=kwargs.get("params")).prepare().url or url
+        key = f"{key}#{self._cache_scope}"
+        cached = self.cache.get(key)
+        if cached is not None and self.cache.is_fresh(cached):
+            return self._to_response(cached)
+        if cached is not None and cached.can_revalidate:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **cached.validators()}
+        response = self._authenticated_send("GET", url, **kwargs)
+        if response.status_code == 304 and cached is not None:
+            cached.stored_at = time.time()
+            self.cache.set(key, cached)
+            return self._to_response(cached)
+        if response.status_code == 200:
+            self.cache.set(key, CachedResponse(response.url, 200, dict(response.headers), response.content))
         return response
 
+    def _to_response(self, cached: CachedResponse) -> requests.Response:
+        """Build a response from a cache entry
+
+        Args:
+            cached (CachedResponse): The cache entry
+
+        Returns:
+            requests.Response: The response
+        """
+        response = JSONResponse(self.json_backend)
+        response.url = cached.url
+        response.status_code = cached.status_code
+        response.headers = CaseInsensitiveDict(cached.headers)
+        response._content = cached.content
+        response.encoding = "utf-8"
+        return response
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying it according to the retry policy
+
+        Args:
+            method (str): The HTTP method
+            url (str): The absolute url
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            requests.Response: The last response, whatever its status
+        """
+        attempt = 1
+        while True:
+            response = JSONResponse.wrap(self._session.request(method, url, **kwargs), self.json_backend)
+            if not self.retry_policy.should_retry(method, response, attempt):
+                return response
+            delay = self.retry_policy.delay(response, attempt)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, resource: str, **kwargs) -> requests.Response:
+        """Make a get request to the Doccano API
+
+        Args:
+            resource (str): The resource to get
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            requests.Response: The response from the API
+        """
+        return self.request("GET", resource, **kwargs)
+
+    def paginate(
+        self,
+        resource: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_workers: int = 1,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the results of a paginated list endpoint
+
+        With a single worker the "next" links are followed one page at a time. With more
+        workers the total count is read from the first page, and the remaining pages are
+        fetched concurrently by limit/offset while still being yielded in order.
+
+        Args:
+            resource (str): The list resource to get
+            params (Dict[str, Any], optional): The query parameters of the request. Defaults to None.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the page size of the repository.
+
+        Yields:
+            Dict[str, Any]: The next item of the results.
+        """
+        params = dict(params or {})
+        page_size = page_size or self.page_size
+        if page_size:
+            params["limit"] = page_size
+        response = self.get(resource, params=params)
+        page = response.json()
+        yield from page["results"]
+        if page["next"] is None:
+            return
+
+        if max_workers <= 1:
+            # the url without the query string, so that the next url can be rebased onto it
+            initial_url = response.url.split("?")[0]
+            while True:
+                next_url = get_next_url(self.api_url, initial_url, page)
+                if next_url is None:
+                    break
+                page = self.get(next_url).json()
+                yield from page["results"]
+            return
+
+        # the server may cap the requested limit, so the first page tells the actual page size
+        limit = len(page["results"])
+
+        def fetch(offset: int) -> Dict[str, Any]:
+            return self.get(resource, params={**params, "limit": limit, "offset": offset}).json()
+
+        for page in ordered_map(fetch, range(limit, page["count"], limit), max_workers):
+            yield from page["results"]
+
     def post(self, resource: str, **kwargs) -> requests.Response:
         """Make a post request to the Doccano API
 
@@ -145,10 +615,7 @@ class BaseRepository:
         Returns:
             requests.Response: The response from the API
         """
-        url = f"{self.api_url}/{resource}"
-        response = self._session.post(url, **kwargs)
-        verbose_raise_for_status(response)
-        return response
+        return self.request("POST", resource, **kwargs)
 
     def put(self, resource: str, **kwargs) -> requests.Response:
         """Make a put request to the Doccano API
@@ -160,10 +627,19 @@ class BaseRepository:
         Returns:
             requests.Response: The response from the API
         """
-        url = f"{self.api_url}/{resource}"
-        response = self._session.put(url, **kwargs)
-        verbose_raise_for_status(response)
-        return response
+        return self.request("PUT", resource, **kwargs)
+
+    def patch(self, resource: str, **kwargs) -> requests.Response:
+        """Make a patch request to the Doccano API
+
+        Args:
+            resource (str): The resource to patch
+            kwargs: Additional arguments to pass to the request
+
+        Returns:
+            requests.Response: The response from the API
+        """
+        return self.request("PATCH", resource, **kwargs)
 
     def delete(self, resource: str, **kwargs) -> requests.Response:
         """Make a delete request to the Doccano API
@@ -175,7 +651,4 @@ class BaseRepository:
         Returns:
             requests.Response: The response from the API
         """
-        url = f"{self.api_url}/{resource}"
-        response = self._session.delete(url, **kwargs)
-        verbose_raise_for_status(response)
-        return response
+        return self.request("DELETE", resource, **kwargs)
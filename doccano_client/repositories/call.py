@@ -0,0 +1,134 @@
+"""Requests shared by the synchronous and the asynchronous repositories
+
+A call describes a request to the Doccano API and how its response is turned into a result,
+without sending it. The repositories of DoccanoClient send their calls with a BaseRepository,
+and the ones of AsyncDoccanoClient await the same calls with an AsyncBaseRepository.
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from doccano_client.aio.repositories.base import AsyncBaseRepository
+    from doccano_client.repositories.base import BaseRepository
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass(frozen=True)
+class Call(Generic[T]):
+    """A request to the Doccano API and the conversion of its response"""
+
+    method: str
+    resource: str
+    convert: Callable[[Any], T]
+    kwargs: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    def send(self, client: BaseRepository) -> T:
+        """Send the request and convert its response
+
+        Args:
+            client (BaseRepository): The client sending the request
+
+        Returns:
+            T: The result of the call
+        """
+        response = getattr(client, self.method.lower())(self.resource, **self.kwargs)
+        return self.convert(response)
+
+    async def asend(self, client: AsyncBaseRepository) -> T:
+        """Send the request asynchronously and convert its response
+
+        Args:
+            client (AsyncBaseRepository): The client sending the request
+
+        Returns:
+            T: The result of the call
+        """
+        response = await getattr(client, self.method.lower())(self.resource, **self.kwargs)
+        return self.convert(response)
+
+
+@dataclasses.dataclass(frozen=True)
+class PageCall(Generic[T]):
+    """A paginated list request to the Doccano API and the conversion of its items"""
+
+    resource: str
+    convert: Callable[[Dict[str, Any]], T]
+    params: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+    def send(self, client: BaseRepository, max_workers: int = 1, page_size: Optional[int] = None) -> Iterator[T]:
+        """Iterate over the converted items of every page
+
+        Args:
+            client (BaseRepository): The client sending the requests
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the page size of the client.
+
+        Yields:
+            T: The next item
+        """
+        for item in client.paginate(self.resource, self.params, max_workers, page_size):
+            yield self.convert(item)
+
+    async def asend(
+        self, client: AsyncBaseRepository, max_workers: int = 1, page_size: Optional[int] = None
+    ) -> AsyncIterator[T]:
+        """Iterate asynchronously over the converted items of every page
+
+        Args:
+            client (AsyncBaseRepository): The client sending the requests
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the page size of the client.
+
+        Yields:
+            T: The next item
+        """
+        async for item in client.paginate(self.resource, self.params, max_workers, page_size):
+            yield self.convert(item)
+
+
+def json_body(convert: Callable[[Any], T]) -> Callable[[Any], T]:
+    """Return the conversion of a response through its JSON body
+
+    Args:
+        convert (Callable[[Any], T]): The conversion of the decoded body
+
+    Returns:
+        Callable[[Any], T]: The conversion of the response
+    """
+    return lambda response: convert(response.json())
+
+
+def json_list(convert: Callable[[Any], T]) -> Callable[[Any], List[T]]:
+    """Return the conversion of a response whose JSON body is a list
+
+    Args:
+        convert (Callable[[Any], T]): The conversion of each item of the decoded body
+
+    Returns:
+        Callable[[Any], List[T]]: The conversion of the response
+    """
+    return lambda response: [convert(item) for item in response.json()]
+
+
+def no_content(response: Any) -> None:
+    """Ignore the response of a call returning nothing
+
+    Args:
+        response (Any): The response
+    """
@@ -4,15 +4,72 @@ from typing import Iterator, List, Optional
 
 from doccano_client.models.comment import Comment
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import (
+    Call,
+    PageCall,
+    json_body,
+    no_content,
+)
+from doccano_client.utils.models import model_parser
+
+
+class CommentCalls:
+    """Calls of the Doccano comment API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name.
+    """
+
+    resource_type = "comments"
+
+    def __init__(self, trusted: bool = False):
+        """Initialize the calls
+
+        Args:
+            trusted (bool): Whether to build comments from responses without validating them. Defaults to False.
+        """
+        self._parse = model_parser(Comment, trusted)
+        self._convert = json_body(self._parse)
+
+    def find_by_id(self, project_id: int, comment_id: int) -> Call[Comment]:
+        return Call("GET", f"projects/{project_id}/{self.resource_type}/{comment_id}", self._convert)
+
+    def list(self, project_id: int, example_id: Optional[int] = None, query: str = "") -> PageCall[Comment]:
+        params = {"example": example_id, "q": query}
+        if not example_id:
+            params.pop("example")
+        return PageCall(f"projects/{project_id}/{self.resource_type}", self._parse, params)
+
+    def create(self, project_id: int, comment: Comment) -> Call[Comment]:
+        resource = f"projects/{project_id}/{self.resource_type}?example={comment.example}"
+        return Call("POST", resource, self._convert, {"json": comment.dict(exclude={"id", "example"})})
+
+    def update(self, project_id: int, comment: Comment) -> Call[Comment]:
+        resource = f"projects/{project_id}/{self.resource_type}/{comment.id}"
+        return Call("PUT", resource, self._convert, {"json": comment.dict()})
+
+    def delete(self, project_id: int, comment: Comment | int) -> Call[None]:
+        comment_id = comment if isinstance(comment, int) else comment.id
+        return Call("DELETE", f"projects/{project_id}/{self.resource_type}/{comment_id}", no_content)
+
+    def bulk_delete(self, project_id: int, comments: List[int] | List[Comment]) -> Call[None]:
+        ids = [comment if isinstance(comment, int) else comment.id for comment in comments]
+        return Call("DELETE", f"projects/{project_id}/{self.resource_type}", no_content, {"json": {"ids": ids}})
 
 
 class CommentRepository:
     """Repository for interacting with the Doccano comment API"""
 
-    resource_type = "comments"
+    resource_type = CommentCalls.resource_type
 
-    def __init__(self, client: BaseRepository):
+    def __init__(self, client: BaseRepository, trusted: bool = False):
+        """Initialize the repository
+
+        Args:
+            client (BaseRepository): The client sending the requests
+            trusted (bool): Whether to build comments from responses without validating them. Defaults to False.
+        """
         self._client = client
+        self._calls = CommentCalls(trusted)
 
     def find_by_id(self, project_id: int, comment_id: int) -> Comment:
         """Find a comment by id
@@ -24,34 +81,30 @@ class CommentRepository:
         Returns:
             Comment: The found comment
         """
-        response = self._client.get(f"projects/{project_id}/{self.resource_type}/{comment_id}")
-        return Comment.parse_obj(response.json())
-
-    def list(self, project_id: int, example_id: Optional[int] = None, query: str = "") -> Iterator[Comment]:
+        return self._calls.find_by_id(project_id, comment_id).send(self._client)
+
+    def list(
+        self,
+        project_id: int,
+        example_id: Optional[int] = None,
+        query: str = "",
+        max_workers: int = 1,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Comment]:
         """Return all comments in which you are a member
 
         Args:
             project_id (int): The id of the project
             example_id (Optional[int], optional): The id of the example. Defaults to None.
             query (str): The query to search. Defaults to None.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
 
         Yields:
             Comment: The list of the comments.
         """
-        params = {"example": example_id, "q": query}
-        if not example_id:
-            params.pop("example")
-
-        response = self._client.get(f"projects/{project_id}/{self.resource_type}", params=params)
-        while True:
-            comments = response.json()
-            for comment in comments["results"]:
-                yield Comment.parse_obj(comment)
-
-            if comments["next"] is None:
-                break
-            else:
-                response = self._client.get(comments["next"])
+        yield from self._calls.list(project_id, example_id, query).send(self._client, max_workers, page_size)
 
     def create(self, project_id: int, comment: Comment) -> Comment:
         """Create a new comment
@@ -63,9 +116,7 @@ class CommentRepository:
         Returns:
             Comment: The created comment
         """
-        resource = f"projects/{project_id}/{self.resource_type}?example={comment.example}"
-        response = self._client.post(resource, json=comment.dict(exclude={"id", "example"}))
-        return Comment.parse_obj(response.json())
+        return self._calls.create(project_id, comment).send(self._client)
 
     def update(self, project_id: int, comment: Comment) -> Comment:
         """Update a comment
@@ -77,9 +128,7 @@ class CommentRepository:
         Returns:
             Comment: The updated comment
         """
-        resource = f"projects/{project_id}/{self.resource_type}/{comment.id}"
-        response = self._client.put(resource, json=comment.dict())
-        return Comment.parse_obj(response.json())
+        return self._calls.update(project_id, comment).send(self._client)
 
     def delete(self, project_id: int, comment: Comment | int):
         """Delete a comment
@@ -88,9 +137,7 @@ class CommentRepository:
             project_id (int): The id of the project
             comment (Comment | int): The comment to delete
         """
-        comment_id = comment if isinstance(comment, int) else comment.id
-        resource = f"projects/{project_id}/{self.resource_type}/{comment_id}"
-        self._client.delete(resource)
+        self._calls.delete(project_id, comment).send(self._client)
 
     def bulk_delete(self, project_id: int, comments: List[int] | List[Comment]):
         """Bulk delete comments
@@ -99,5 +146,4 @@ class CommentRepository:
             project_id (int): The id of the project
             comments (List[int] | List[Comment]): The list of comment ids to delete
         """
-        ids = [comment if isinstance(comment, int) else comment.id for comment in comments]
-        self._client.delete(f"projects/{project_id}/{self.resource_type}", json={"ids": ids})
+        self._calls.bulk_delete(project_id, comments).send(self._client)
@@ -1,10 +1,53 @@
 from __future__ import annotations
 
 import pathlib
-from typing import List
+from typing import Any, Iterator, List, Mapping, Tuple
+
+from requests import Response
 
 from doccano_client.models.data_download import Option
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import Call, json_body, json_list
+
+
+def file_name(headers: Mapping[str, str]) -> str:
+    """Return the name of a downloaded file from the headers of its response
+
+    Args:
+        headers (Mapping[str, str]): The headers of the response
+
+    Returns:
+        str: The file name given by the Content-Disposition header
+    """
+    content_disposition = headers["Content-Disposition"]
+    ATTRIBUTE = "filename="
+    return content_disposition[content_disposition.find(ATTRIBUTE) + len(ATTRIBUTE) + 1 : -1]
+
+
+class DataDownloadCalls:
+    """Calls of the Doccano data download API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name. The file itself is
+    streamed by each repository.
+    """
+
+    def list_options(self, project_id: int) -> Call[List[Option]]:
+        return Call("GET", f"projects/{project_id}/download-format", json_list(Option.parse_obj))
+
+    def find_option_by_name(self, project_id: int, name: str) -> Call[Option]:
+        options = self.list_options(project_id)
+
+        def convert(response: Any) -> Option:
+            for option in options.convert(response):
+                if option.name == name:
+                    return option
+            raise ValueError(f"Download option '{name}' not found")
+
+        return Call(options.method, options.resource, convert)
+
+    def schedule_download(self, project_id: int, option: Option, only_approved=False) -> Call[str]:
+        data = {"format": option.name, "exportApproved": only_approved}
+        return Call("POST", f"projects/{project_id}/download", json_body(lambda body: body["task_id"]), {"json": data})
 
 
 class DataDownloadRepository:
@@ -12,6 +55,7 @@ class DataDownloadRepository:
 
     def __init__(self, client: BaseRepository):
         self._client = client
+        self._calls = DataDownloadCalls()
 
     def list_options(self, project_id: int) -> List[Option]:
         """Return all download options
@@ -22,10 +66,7 @@ class DataDownloadRepository:
         Returns:
             List[Option]: The list of the download options.
         """
-        resource = f"projects/{project_id}/download-format"
-        response = self._client.get(resource)
-        options = [Option.parse_obj(label) for label in response.json()]
-        return options
+        return self._calls.list_options(project_id).send(self._client)
 
     def find_option_by_name(self, project_id: int, name: str) -> Option:
         """Find a download option by name
@@ -40,11 +81,7 @@ class DataDownloadRepository:
         Raises:
             ValueError: If the download option is not found
         """
-        options = self.list_options(project_id)
-        for option in options:
-            if option.name == name:
-                return option
-        raise ValueError(f"Download option '{name}' not found")
+        return self._calls.find_option_by_name(project_id, name).send(self._client)
 
     def schedule_download(self, project_id: int, option: Option, only_approved=False) -> str:
         """Schedule a download
@@ -57,11 +94,7 @@ class DataDownloadRepository:
         Returns:
             str: The celery task id
         """
-        resource = f"projects/{project_id}/download"
-        data = {"format": option.name, "exportApproved": only_approved}
-        response = self._client.post(resource, json=data)
-        task_id = response.json()["task_id"]
-        return task_id
+        return self._calls.schedule_download(project_id, option, only_approved).send(self._client)
 
     def download(self, project_id: int, task_id: str, dir_name=".") -> pathlib.Path:
         """Download a file from the server
@@ -74,16 +107,33 @@ class DataDownloadRepository:
         Returns:
             pathlib.Path: The path to the downloaded file
         """
-        resource = f"projects/{project_id}/download"
-        params = {"taskId": task_id}
-        response = self._client.get(resource, params=params, stream=True)
-        content_disposition = response.headers["Content-Disposition"]
-        ATTRIBUTE = "filename="
-        file_name = content_disposition[content_disposition.find(ATTRIBUTE) + len(ATTRIBUTE) + 1 : -1]
+        file_name, chunks = self.stream(project_id, task_id, chunk_size=8192)
         dir_path = pathlib.Path(dir_name)
         dir_path.mkdir(parents=True, exist_ok=True)
         file_path = dir_path / file_name
         with file_path.open("wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
+            for chunk in chunks:
                 f.write(chunk)
         return file_path
+
+    def stream(self, project_id: int, task_id: str, chunk_size: int = 65536) -> Tuple[str, Iterator[bytes]]:
+        """Stream a file from the server without saving it
+
+        Args:
+            project_id (int): The id of the project
+            task_id (str): The celery task id
+            chunk_size (int): The size of the chunks to read. Defaults to 65536.
+
+        Returns:
+            Tuple[str, Iterator[bytes]]: The name of the file and the chunks of its content.
+                The connection is released once the chunks are exhausted or closed.
+        """
+        resource = f"projects/{project_id}/download"
+        params = {"taskId": task_id}
+        response = self._client.get(resource, params=params, stream=True)
+        return file_name(response.headers), self._iter_content(response, chunk_size)
+
+    @staticmethod
+    def _iter_content(response: Response, chunk_size: int) -> Iterator[bytes]:
+        with response:
+            yield from response.iter_content(chunk_size=chunk_size)
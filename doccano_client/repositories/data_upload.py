@@ -1,12 +1,28 @@
 from __future__ import annotations
 
 import pathlib
-from typing import List
+from typing import IO, List
 
 from requests_toolbelt import MultipartEncoder
 
 from doccano_client.models.data_upload import Option, Task
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import Call, json_body, json_list
+
+
+class DataUploadCalls:
+    """Calls of the Doccano data upload API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name. The files themselves
+    are sent by each repository, whose HTTP library encodes the multipart body.
+    """
+
+    def list_options(self, project_id: int) -> Call[List[Option]]:
+        return Call("GET", f"projects/{project_id}/catalog", json_list(Option.parse_obj))
+
+    def ingest(self, project_id: int, upload_ids: List[str], task: Task, format: str, **kwargs) -> Call[str]:
+        data = {"uploadIds": upload_ids, "task": task, "format": format, **kwargs}
+        return Call("POST", f"projects/{project_id}/upload", json_body(lambda body: body["task_id"]), {"json": data})
 
 
 class DataUploadRepository:
@@ -14,6 +30,7 @@ class DataUploadRepository:
 
     def __init__(self, client: BaseRepository):
         self._client = client
+        self._calls = DataUploadCalls()
 
     def list_options(self, project_id: int) -> List[Option]:
         """Return all upload options
@@ -24,10 +41,7 @@ class DataUploadRepository:
         Returns:
             List[Option]: The list of the upload options.
         """
-        resource = f"projects/{project_id}/catalog"
-        response = self._client.get(resource)
-        options = [Option.parse_obj(label) for label in response.json()]
-        return options
+        return self._calls.list_options(project_id).send(self._client)
 
     def upload(self, file_path: str) -> str:
         """Upload a file to the server
@@ -38,13 +52,28 @@ class DataUploadRepository:
         Returns:
             str: The id of the uploaded file
         """
-        resource = "fp/process/"
         path = pathlib.Path(file_path)
         with path.open("rb") as f:
-            m = MultipartEncoder(fields={"filepond": (path.name, f)})
-            headers = {"Content-Type": m.content_type, "Accept": "*/*"}
-            response = self._client.post(resource, data=m, headers=headers)
-            return response.content.decode()
+            return self._upload(path.name, f)
+
+    def upload_content(self, file_name: str, content: bytes) -> str:
+        """Upload in-memory content to the server as a file
+
+        Args:
+            file_name (str): The name of the file, whose extension the server checks against the format
+            content (bytes): The content of the file
+
+        Returns:
+            str: The id of the uploaded file
+        """
+        return self._upload(file_name, content)
+
+    def _upload(self, file_name: str, content: IO[bytes] | bytes) -> str:
+        resource = "fp/process/"
+        m = MultipartEncoder(fields={"filepond": (file_name, content)})
+        headers = {"Content-Type": m.content_type, "Accept": "*/*"}
+        response = self._client.post(resource, data=m, headers=headers)
+        return response.content.decode()
 
     def delete(self, upload_id: str):
         """Delete the uploaded file from the server
@@ -69,7 +98,4 @@ class DataUploadRepository:
         Returns:
             str: The celery task id
         """
-        resource = f"projects/{project_id}/upload"
-        data = {"uploadIds": upload_ids, "task": task, "format": format, **kwargs}
-        response = self._client.post(resource, json=data)
-        return response.json()["task_id"]
+        return self._calls.ingest(project_id, upload_ids, task, format, **kwargs).send(self._client)
@@ -1,16 +1,93 @@
 from __future__ import annotations
 
-from typing import Iterator, List, Optional
+import pathlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from pydantic import ValidationError
+from requests.exceptions import RequestException
+
+from doccano_client.models.bulk import BulkItemResult
 from doccano_client.models.example import Example
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import (
+    Call,
+    PageCall,
+    json_body,
+    no_content,
+)
+from doccano_client.utils.concurrency import ordered_map
+from doccano_client.utils.models import model_parser, validate_fields
+
+
+class ExampleCalls:
+    """Calls of the Doccano example API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name.
+    """
+
+    def __init__(self, trusted: bool = False):
+        """Initialize the calls
+
+        Args:
+            trusted (bool): Whether to build examples from responses without validating them. Defaults to False.
+        """
+        self._parse = model_parser(Example, trusted)
+        self._convert = json_body(self._parse)
+
+    def find_by_id(self, project_id: int, example_id: int) -> Call[Example]:
+        return Call("GET", f"projects/{project_id}/examples/{example_id}", self._convert)
+
+    def count(self, project_id: int) -> Call[int]:
+        return Call("GET", f"projects/{project_id}/examples", json_body(lambda page: page["count"]))
+
+    def find_latest(self, project_id: int) -> Call[Optional[Example]]:
+        def convert(page: Dict[str, Any]) -> Optional[Example]:
+            return self._parse(page["results"][0]) if page["results"] else None
+
+        params = {"limit": 1, "ordering": "-created_at"}
+        return Call("GET", f"projects/{project_id}/examples", json_body(convert), {"params": params})
+
+    def list(self, project_id: int, is_confirmed: Optional[bool] = None) -> PageCall[Example]:
+        params = {}
+        if is_confirmed is not None:
+            params["confirmed"] = is_confirmed
+        return PageCall(f"projects/{project_id}/examples", self._parse, params)
+
+    def create(self, project_id: int, example: Example) -> Call[Example]:
+        return Call("POST", f"projects/{project_id}/examples", self._convert, {"json": example.dict(exclude={"id"})})
+
+    def update(self, project_id: int, example: Example) -> Call[Example]:
+        return Call("PUT", f"projects/{project_id}/examples/{example.id}", self._convert, {"json": example.dict()})
+
+    def partial_update(self, project_id: int, example_id: int, fields: Dict[str, Any]) -> Call[Example]:
+        fields = validate_fields(Example, fields)
+        return Call("PATCH", f"projects/{project_id}/examples/{example_id}", self._convert, {"json": fields})
+
+    def delete(self, project_id: int, example: Example | int) -> Call[None]:
+        resource = f"projects/{project_id}/examples/{example if isinstance(example, int) else example.id}"
+        return Call("DELETE", resource, no_content)
+
+    def bulk_delete(self, project_id: int, examples: List[int] | List[Example]) -> Call[None]:
+        ids = [example if isinstance(example, int) else example.id for example in examples]
+        return Call("DELETE", f"projects/{project_id}/examples", no_content, {"json": {"ids": ids}})
+
+    def update_state(self, project_id: int, example: Example | int) -> Call[None]:
+        example_id = example if isinstance(example, int) else example.id
+        return Call("POST", f"projects/{project_id}/examples/{example_id}/states", no_content)
 
 
 class ExampleRepository:
     """Repository for interacting with the Doccano example API"""
 
-    def __init__(self, client: BaseRepository):
+    def __init__(self, client: BaseRepository, trusted: bool = False):
+        """Initialize the repository
+
+        Args:
+            client (BaseRepository): The client sending the requests
+            trusted (bool): Whether to build examples from responses without validating them. Defaults to False.
+        """
         self._client = client
+        self._calls = ExampleCalls(trusted)
 
     def find_by_id(self, project_id: int, example_id: int) -> Example:
         """Find a example by id
@@ -22,8 +99,7 @@ class ExampleRepository:
         Returns:
             Example: The found example
         """
-        response = self._client.get(f"projects/{project_id}/examples/{example_id}")
-        return Example.parse_obj(response.json())
+        return self._calls.find_by_id(project_id, example_id).send(self._client)
 
     def count(self, project_id: int) -> int:
         """Count the number of examples
@@ -34,33 +110,56 @@ class ExampleRepository:
         Returns:
             int: The number of examples
         """
-        response = self._client.get(f"projects/{project_id}/examples")
-        return response.json()["count"]
+        return self._calls.count(project_id).send(self._client)
+
+    def find_latest(self, project_id: int) -> Optional[Example]:
+        """Find the most recently created example
+
+        Args:
+            project_id (int): The id of the project
 
-    def list(self, project_id: int, is_confirmed: Optional[bool] = None) -> Iterator[Example]:
+        Returns:
+            Optional[Example]: The latest example, or None if the project has no example
+        """
+        return self._calls.find_latest(project_id).send(self._client)
+
+    def list(
+        self,
+        project_id: int,
+        is_confirmed: Optional[bool] = None,
+        max_workers: int = 1,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Example]:
         """Return all examples in which you are a member
 
         Args:
             project_id (int): The id of the project
             is_confirmed (bool, optional): Filter by confirmed state. Defaults to None.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
 
         Yields:
             Example: The next example.
         """
-        params = {}
-        if is_confirmed is not None:
-            params["confirmed"] = is_confirmed
-        response = self._client.get(f"projects/{project_id}/examples", params=params)
+        yield from self._calls.list(project_id, is_confirmed).send(self._client, max_workers, page_size)
 
-        while True:
-            examples = response.json()
-            for example in examples["results"]:
-                yield Example.parse_obj(example)
+    def download_file(self, example: Example, file_path: pathlib.Path, chunk_size: int = 65536) -> pathlib.Path:
+        """Download the uploaded file of an example, e.g. an audio or an image
+
+        Args:
+            example (Example): The example, whose filename holds the url of the file
+            file_path (pathlib.Path): The path to save the file to
+            chunk_size (int): The size of the chunks to write. Defaults to 65536.
 
-            if examples["next"] is None:
-                break
-            else:
-                response = self._client.get(examples["next"])
+        Returns:
+            pathlib.Path: The path to the downloaded file
+        """
+        with self._client.get(example.filename, stream=True) as response:
+            with file_path.open("wb") as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+        return file_path
 
     def create(self, project_id: int, example: Example) -> Example:
         """Create a new example
@@ -72,8 +171,7 @@ class ExampleRepository:
         Returns:
             Example: The created example
         """
-        response = self._client.post(f"projects/{project_id}/examples", json=example.dict(exclude={"id"}))
-        return Example.parse_obj(response.json())
+        return self._calls.create(project_id, example).send(self._client)
 
     def update(self, project_id: int, example: Example) -> Example:
         """Update a example
@@ -85,9 +183,48 @@ class ExampleRepository:
         Returns:
             Example: The updated example
         """
-        resource = f"projects/{project_id}/examples/{example.id}"
-        response = self._client.put(resource, json=example.dict())
-        return Example.parse_obj(response.json())
+        return self._calls.update(project_id, example).send(self._client)
+
+    def partial_update(self, project_id: int, example_id: int, fields: Dict[str, Any]) -> Example:
+        """Update some fields of a example without sending the others
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example to update
+            fields (Dict[str, Any]): The new values by field name
+
+        Returns:
+            Example: The updated example
+        """
+        return self._calls.partial_update(project_id, example_id, fields).send(self._client)
+
+    def bulk_partial_update(
+        self, project_id: int, updates: Iterable[Tuple[int, Dict[str, Any]]], max_workers: int = 8
+    ) -> Iterator[BulkItemResult]:
+        """Update some fields of many examples with concurrent requests
+
+        The examples are updated lazily as the results are consumed, with at most
+        max_workers requests in flight. An invalid update or a failed request does not stop the others.
+
+        Args:
+            project_id (int): The id of the project
+            updates (Iterable[Tuple[int, Dict[str, Any]]]): Pairs of an example id and its new values by field name
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each update, in input order. The item is the pair of the
+                update. On success, result holds the updated example. On failure, error holds the
+                raised exception.
+        """
+
+        def update(item: Tuple[int, Dict[str, Any]]) -> BulkItemResult:
+            example_id, fields = item
+            try:
+                return BulkItemResult(item=item, result=self.partial_update(project_id, example_id, fields))
+            except (RequestException, ValidationError, KeyError) as err:
+                return BulkItemResult(item=item, error=err)
+
+        yield from ordered_map(update, updates, max_workers)
 
     def delete(self, project_id: int, example: Example | int):
         """Delete a example
@@ -96,8 +233,7 @@ class ExampleRepository:
             project_id (int): The id of the project
             example (Example | int): The example to delete
         """
-        resource = f"projects/{project_id}/examples/{example if isinstance(example, int) else example.id}"
-        self._client.delete(resource)
+        self._calls.delete(project_id, example).send(self._client)
 
     def delete_all(self, project_id: int):
         """Delete all examples
@@ -115,8 +251,7 @@ class ExampleRepository:
             project_id (int): The id of the project
             examples (List[int] | List[Example]): The list of example ids to delete
         """
-        ids = [example if isinstance(example, int) else example.id for example in examples]
-        self._client.delete(f"projects/{project_id}/examples", json={"ids": ids})
+        self._calls.bulk_delete(project_id, examples).send(self._client)
 
     def update_state(self, project_id: int, example: Example | int):
         """Update completed state of example
@@ -125,6 +260,4 @@ class ExampleRepository:
             project_id (int): The id of the project
             example (Example | int): The example to confirm
         """
-        example_id = example if isinstance(example, int) else example.id
-        resource = f"projects/{project_id}/examples/{example_id}/states"
-        self._client.post(resource)
+        self._calls.update_state(project_id, example).send(self._client)
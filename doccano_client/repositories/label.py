@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import functools
-from typing import Generic, List, TypeVar
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, Type, TypeVar
 
+from pydantic import ValidationError
+from requests.exceptions import RequestException
+
+from doccano_client.models.bulk import BulkItemResult
 from doccano_client.models.label import (
     BoundingBox,
     Category,
@@ -13,17 +17,93 @@ from doccano_client.models.label import (
     Text,
 )
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import Call, json_body, json_list, no_content
+from doccano_client.utils.concurrency import ordered_map
+from doccano_client.utils.models import model_parser, validate_fields
 
 T = TypeVar("T", bound=Label)
 
 
+class LabelCalls(Generic[T]):
+    """Calls of the Doccano label API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name.
+    """
+
+    def __init__(self, label_class: Type[T], resource_type: str, trusted: bool = False):
+        """Initialize the calls
+
+        Args:
+            label_class (Type[T]): The label model
+            resource_type (str): The name of the label resource, e.g. "spans"
+            trusted (bool): Whether to build labels from responses without validating them. Defaults to False.
+        """
+        self._label_class = label_class
+        self._resource_type = resource_type
+        self._parse = model_parser(label_class, trusted)
+        self._convert = json_body(self._parse)
+
+    def to_label(self, item: T | Dict[str, Any]) -> T:
+        """Validate a dict into a label, or return a label as it is
+
+        Args:
+            item (T | Dict[str, Any]): The label or its fields
+
+        Returns:
+            T: The label
+        """
+        return self._label_class.parse_obj(item) if isinstance(item, dict) else item
+
+    def find_by_id(self, project_id: int, example_id: int, label_id: int) -> Call[T]:
+        return Call("GET", self._resource(project_id, example_id, label_id), self._convert)
+
+    def list(self, project_id: int, example_id: int) -> Call[List[T]]:
+        return Call("GET", self._resource(project_id, example_id), json_list(self._parse))
+
+    def create(self, project_id: int, label: T) -> Call[T]:
+        resource = self._resource(project_id, label.example)
+        return Call("POST", resource, self._convert, {"json": label.dict(exclude={"id"})})
+
+    def update(self, project_id: int, label: T) -> Call[T]:
+        if label.id is None:
+            raise ValueError("Label id is required")
+        resource = self._resource(project_id, label.example, label.id)
+        return Call("PUT", resource, self._convert, {"json": label.dict()})
+
+    def partial_update(self, project_id: int, example_id: int, label_id: int, fields: Dict[str, Any]) -> Call[T]:
+        fields = validate_fields(self._label_class, fields)
+        return Call("PATCH", self._resource(project_id, example_id, label_id), self._convert, {"json": fields})
+
+    def delete(self, project_id: int, label: T) -> Call[None]:
+        if label.id is None:
+            raise ValueError("Label id is required")
+        return self.delete_by_id(project_id, label.example, label.id)
+
+    def delete_by_id(self, project_id: int, example_id: int, label_id: int) -> Call[None]:
+        return Call("DELETE", self._resource(project_id, example_id, label_id), no_content)
+
+    def delete_all(self, project_id: int, example_id: int) -> Call[None]:
+        return Call("DELETE", self._resource(project_id, example_id), no_content)
+
+    def _resource(self, project_id: int, example_id: int, label_id: Optional[int] = None) -> str:
+        resource = f"projects/{project_id}/examples/{example_id}/{self._resource_type}"
+        return resource if label_id is None else f"{resource}/{label_id}"
+
+
 class LabelRepository(Generic[T]):
     """Repository for interacting with the Doccano label API"""
 
-    def __init__(self, client: BaseRepository, label_class: T, resource_type: str):
+    def __init__(self, client: BaseRepository, label_class: Type[T], resource_type: str, trusted: bool = False):
+        """Initialize the repository
+
+        Args:
+            client (BaseRepository): The client sending the requests
+            label_class (Type[T]): The label model
+            resource_type (str): The name of the label resource, e.g. "spans"
+            trusted (bool): Whether to build labels from responses without validating them. Defaults to False.
+        """
         self._client = client
-        self._label_class = label_class
-        self._resource_type = resource_type
+        self._calls = LabelCalls(label_class, resource_type, trusted)
 
     def find_by_id(self, project_id: int, example_id: int, label_id: int) -> T:
         """Find a label by id
@@ -36,9 +116,7 @@ class LabelRepository(Generic[T]):
         Returns:
             T: The found label
         """
-        resource = f"projects/{project_id}/examples/{example_id}/{self._resource_type}/{label_id}"
-        response = self._client.get(resource)
-        return self._label_class.parse_obj(response.json())
+        return self._calls.find_by_id(project_id, example_id, label_id).send(self._client)
 
     def list(self, project_id: int, example_id: int) -> List[T]:
         """Return all label in which you are a member
@@ -50,10 +128,7 @@ class LabelRepository(Generic[T]):
         Returns:
             T: The list of the label.
         """
-        resource = f"projects/{project_id}/examples/{example_id}/{self._resource_type}"
-        response = self._client.get(resource)
-        labels = [self._label_class.parse_obj(label) for label in response.json()]
-        return labels
+        return self._calls.list(project_id, example_id).send(self._client)
 
     def create(self, project_id: int, label: T) -> T:
         """Create a new label
@@ -65,9 +140,35 @@ class LabelRepository(Generic[T]):
         Returns:
             T: The created label
         """
-        resource = f"projects/{project_id}/examples/{label.example}/{self._resource_type}"
-        response = self._client.post(resource, json=label.dict(exclude={"id"}))
-        return self._label_class.parse_obj(response.json())
+        return self._calls.create(project_id, label).send(self._client)
+
+    def bulk_create(
+        self, project_id: int, labels: Iterable[T | Dict[str, Any]], max_workers: int = 8
+    ) -> Iterator[BulkItemResult]:
+        """Create many labels, possibly for many examples, with concurrent requests
+
+        The labels are created lazily as the results are consumed, with at most
+        max_workers requests in flight. An invalid label or a failed request does not
+        stop the others.
+
+        Args:
+            project_id (int): The id of the project
+            labels (Iterable[T | Dict[str, Any]]): The labels to create. A dict is validated
+                into a label before it is sent.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each label, in input order. On success, result holds the
+                created label. On failure, error holds the raised exception.
+        """
+
+        def create(item: T | Dict[str, Any]) -> BulkItemResult:
+            try:
+                return BulkItemResult(item=item, result=self.create(project_id, self._calls.to_label(item)))
+            except (RequestException, ValidationError) as err:
+                return BulkItemResult(item=item, error=err)
+
+        yield from ordered_map(create, labels, max_workers)
 
     def update(self, project_id: int, label: T) -> T:
         """Update a label
@@ -82,11 +183,21 @@ class LabelRepository(Generic[T]):
         Raises:
             ValueError: If the label id is not set
         """
-        if label.id is None:
-            raise ValueError("Label id is required")
-        resource = f"projects/{project_id}/examples/{label.example}/{self._resource_type}/{label.id}"
-        response = self._client.put(resource, json=label.dict())
-        return self._label_class.parse_obj(response.json())
+        return self._calls.update(project_id, label).send(self._client)
+
+    def partial_update(self, project_id: int, example_id: int, label_id: int, fields: Dict[str, Any]) -> T:
+        """Update some fields of a label without sending the others
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label to update
+            fields (Dict[str, Any]): The new values by field name
+
+        Returns:
+            T: The updated label
+        """
+        return self._calls.partial_update(project_id, example_id, label_id, fields).send(self._client)
 
     def delete(self, project_id: int, label: T):
         """Delete a label
@@ -98,10 +209,17 @@ class LabelRepository(Generic[T]):
         Raises:
             ValueError: If the label id is not set
         """
-        if label.id is None:
-            raise ValueError("Label id is required")
-        resource = f"projects/{project_id}/examples/{label.example}/{self._resource_type}/{label.id}"
-        self._client.delete(resource)
+        self._calls.delete(project_id, label).send(self._client)
+
+    def delete_by_id(self, project_id: int, example_id: int, label_id: int):
+        """Delete a label by id
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label to delete
+        """
+        self._calls.delete_by_id(project_id, example_id, label_id).send(self._client)
 
     def delete_all(self, project_id: int, example_id: int):
         """Delete all labels
@@ -110,8 +228,7 @@ class LabelRepository(Generic[T]):
             project_id (int): The id of the project
             example_id (int): The id of the example
         """
-        resource = f"projects/{project_id}/examples/{example_id}/{self._resource_type}"
-        self._client.delete(resource)
+        self._calls.delete_all(project_id, example_id).send(self._client)
 
 
 CategoryRepository = functools.partial(LabelRepository[Category], label_class=Category, resource_type="categories")
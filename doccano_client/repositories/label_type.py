@@ -2,24 +2,153 @@ from __future__ import annotations
 
 import functools
 import pathlib
-from typing import List
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from requests_toolbelt import MultipartEncoder
 
 from doccano_client.models.label_type import LabelType
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import Call, json_body, json_list
+
+
+class LabelTypeCalls:
+    """Calls of the Doccano label type API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name. The calls also keep
+    the name index of each project for find_by_name, which the calls changing label types drop.
+    """
+
+    def __init__(self, resource_type="label-type", cache_ttl: float = 60.0):
+        """Initialize the calls
+
+        Args:
+            resource_type (str): The label type resource of the API. Defaults to "label-type".
+            cache_ttl (float): The number of seconds the name index of a project is reused by
+                find_by_name before it is fetched again. 0 disables the cache. Defaults to 60.
+        """
+        self._resource_type = resource_type
+        self._cache_ttl = cache_ttl
+        self._cache: Dict[int, Tuple[float, Dict[str, LabelType]]] = {}
+
+    def invalidate(self, project_id: int | None = None):
+        """Drop the cached name index of a project
+
+        Args:
+            project_id (int | None): The id of the project. Defaults to None, which drops every project.
+        """
+        if project_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(project_id, None)
+
+    def cached_index(self, project_id: int) -> Optional[Dict[str, LabelType]]:
+        """Return the name index of a project if it is cached and fresh
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            Optional[Dict[str, LabelType]]: The label types by name, or None if they must be fetched.
+        """
+        cached = self._cache.get(project_id)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+        return None
+
+    def index(self, project_id: int, label_types: Iterable[LabelType]) -> Dict[str, LabelType]:
+        """Index the label types of a project by name and cache the index
+
+        Args:
+            project_id (int): The id of the project
+            label_types (Iterable[LabelType]): The label types of the project
+
+        Returns:
+            Dict[str, LabelType]: The label types by name. The first one wins on a duplicate name.
+        """
+        index: Dict[str, LabelType] = {}
+        for label_type in label_types:
+            index.setdefault(label_type.text, label_type)
+        if self._cache_ttl > 0:
+            self._cache[project_id] = (time.monotonic(), index)
+        return index
+
+    def find_by_id(self, project_id: int, label_type_id: int) -> Call[LabelType]:
+        resource = f"projects/{project_id}/{self._resource_type}s/{label_type_id}"
+        return Call("GET", resource, json_body(LabelType.parse_obj))
+
+    def list(self, project_id: int) -> Call[List[LabelType]]:
+        return Call("GET", f"projects/{project_id}/{self._resource_type}s", json_list(LabelType.parse_obj))
+
+    def create(self, project_id: int, label_type: LabelType) -> Call[LabelType]:
+        resource = f"projects/{project_id}/{self._resource_type}s"
+        return Call("POST", resource, self._changed(project_id), {"json": label_type.dict(exclude={"id"})})
+
+    def update(self, project_id: int, label_type: LabelType) -> Call[LabelType]:
+        if label_type.id is None:
+            raise ValueError("label_type id must be set")
+        resource = f"projects/{project_id}/{self._resource_type}s/{label_type.id}"
+        return Call("PUT", resource, self._changed(project_id), {"json": label_type.dict()})
+
+    def delete(self, project_id: int, label_type: LabelType | int) -> Call[None]:
+        label_type_id = label_type if isinstance(label_type, int) else label_type.id
+        if label_type_id is None:
+            raise ValueError("label_type id must be set")
+        resource = f"projects/{project_id}/{self._resource_type}s/{label_type_id}"
+        return Call("DELETE", resource, lambda response: self.invalidate(project_id))
+
+    def bulk_delete(self, project_id: int, label_types: List[int] | List[LabelType]) -> Call[None]:
+        ids = [label_type if isinstance(label_type, int) else label_type.id for label_type in label_types]
+        resource = f"projects/{project_id}/{self._resource_type}s"
+        return Call("DELETE", resource, lambda response: self.invalidate(project_id), {"json": {"ids": ids}})
+
+    def upload_resource(self, project_id: int) -> str:
+        """Return the resource label type files are uploaded to
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            str: The resource
+        """
+        return f"projects/{project_id}/{self._resource_type}-upload"
+
+    def _changed(self, project_id: int) -> Callable[[Any], LabelType]:
+        def convert(response: Any) -> LabelType:
+            self.invalidate(project_id)
+            return LabelType.parse_obj(response.json())
+
+        return convert
 
 
 class LabelTypeRepository:
     """Repository for interacting with the Doccano label type API"""
 
-    def __init__(self, client: BaseRepository, resource_type="label-type"):
+    def __init__(self, client: BaseRepository, resource_type="label-type", cache_ttl: float = 60.0):
+        """Initialize the repository
+
+        Args:
+            client (BaseRepository): The client to send requests with
+            resource_type (str): The label type resource of the API. Defaults to "label-type".
+            cache_ttl (float): The number of seconds the name index of a project is reused by
+                find_by_name before it is fetched again. 0 disables the cache. Defaults to 60.
+        """
         self._client = client
-        self._resource_type = resource_type
+        self._calls = LabelTypeCalls(resource_type, cache_ttl)
+
+    def invalidate(self, project_id: int | None = None):
+        """Drop the cached name index of a project
+
+        Args:
+            project_id (int | None): The id of the project. Defaults to None, which drops every project.
+        """
+        self._calls.invalidate(project_id)
 
     def find_by_name(self, project_id: int, name: str) -> LabelType:
         """Find a label type by name
 
+        When the name is missing from the cached index, the label types are fetched again once.
+
         Args:
             project_id (int): The id of the project
             name (str): The name of the label type to find
@@ -30,10 +159,12 @@ class LabelTypeRepository:
         Raises:
             ValueError: If the label type is not found
         """
-        label_types = self.list(project_id)
-        for label_type in label_types:
-            if label_type.text == name:
-                return label_type
+        index = self._calls.cached_index(project_id)
+        if index is None or name not in index:
+            # the label type may have been created elsewhere since the index was cached
+            index = self._calls.index(project_id, self.list(project_id))
+        if name in index:
+            return index[name]
         raise ValueError(f"Label type with name {name} not found")
 
     def find_by_id(self, project_id: int, label_type_id: int) -> LabelType:
@@ -46,8 +177,7 @@ class LabelTypeRepository:
         Returns:
             LabelType: The found label type
         """
-        response = self._client.get(f"projects/{project_id}/{self._resource_type}s/{label_type_id}")
-        return LabelType.parse_obj(response.json())
+        return self._calls.find_by_id(project_id, label_type_id).send(self._client)
 
     def list(self, project_id: int) -> List[LabelType]:
         """Return all label types in which you are a member
@@ -58,9 +188,7 @@ class LabelTypeRepository:
         Returns:
             LabelType: The list of the label types.
         """
-        response = self._client.get(f"projects/{project_id}/{self._resource_type}s")
-        label_types = [LabelType.parse_obj(label_type) for label_type in response.json()]
-        return label_types
+        return self._calls.list(project_id).send(self._client)
 
     def create(self, project_id: int, label_type: LabelType) -> LabelType:
         """Create a new label type
@@ -72,10 +200,7 @@ class LabelTypeRepository:
         Returns:
             LabelType: The created label type
         """
-        response = self._client.post(
-            f"projects/{project_id}/{self._resource_type}s", json=label_type.dict(exclude={"id"})
-        )
-        return LabelType.parse_obj(response.json())
+        return self._calls.create(project_id, label_type).send(self._client)
 
     def update(self, project_id: int, label_type: LabelType) -> LabelType:
         """Update a label type
@@ -90,11 +215,7 @@ class LabelTypeRepository:
         Raises:
             ValueError: If the label_type id is not set
         """
-        if label_type.id is None:
-            raise ValueError("label_type id must be set")
-        resource = f"projects/{project_id}/{self._resource_type}s/{label_type.id}"
-        response = self._client.put(resource, json=label_type.dict())
-        return LabelType.parse_obj(response.json())
+        return self._calls.update(project_id, label_type).send(self._client)
 
     def delete(self, project_id: int, label_type: LabelType | int):
         """Delete a label type
@@ -106,11 +227,7 @@ class LabelTypeRepository:
         Raises:
             ValueError: If the label_type id is not set
         """
-        label_type_id = label_type if isinstance(label_type, int) else label_type.id
-        if label_type_id is None:
-            raise ValueError("label_type id must be set")
-        resource = f"projects/{project_id}/{self._resource_type}s/{label_type_id}"
-        self._client.delete(resource)
+        self._calls.delete(project_id, label_type).send(self._client)
 
     def bulk_delete(self, project_id: int, label_types: List[int] | List[LabelType]):
         """Bulk delete label types
@@ -119,8 +236,7 @@ class LabelTypeRepository:
             project_id (int): The id of the project
             label_types (List[int | LabelType]): The list of label type ids to delete
         """
-        ids = [label_type if isinstance(label_type, int) else label_type.id for label_type in label_types]
-        self._client.delete(f"projects/{project_id}/{self._resource_type}s", json={"ids": ids})
+        self._calls.bulk_delete(project_id, label_types).send(self._client)
 
     def upload(self, project_id: int, file_path: str):
         """Upload a label type
@@ -129,12 +245,13 @@ class LabelTypeRepository:
             project_id (int): The id of the project
             file_path (str): The path to the file to upload
         """
-        resource = f"projects/{project_id}/{self._resource_type}-upload"
+        resource = self._calls.upload_resource(project_id)
         path = pathlib.Path(file_path)
         with path.open("rb") as f:
             m = MultipartEncoder(fields={"file": (path.name, f, "application/json")})
             headers = {"Content-Type": m.content_type}
             self._client.post(resource, data=m, headers=headers)
+        self.invalidate(project_id)
 
 
 CategoryTypeRepository = functools.partial(LabelTypeRepository, resource_type="category-type")
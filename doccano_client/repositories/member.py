@@ -4,13 +4,64 @@ from typing import List
 
 from doccano_client.models.member import Member
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import Call, json_body, json_list, no_content
+from doccano_client.utils.models import model_parser
+
+
+class MemberCalls:
+    """Calls of the Doccano member API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name.
+    """
+
+    def __init__(self, trusted: bool = False):
+        """Initialize the calls
+
+        Args:
+            trusted (bool): Whether to build members from responses without validating them. Defaults to False.
+        """
+        self._parse = model_parser(Member, trusted)
+        self._convert = json_body(self._parse)
+
+    def find_by_id(self, project_id: int, member_id: int) -> Call[Member]:
+        return Call("GET", f"projects/{project_id}/members/{member_id}", self._convert)
+
+    def list(self, project_id: int) -> Call[List[Member]]:
+        return Call("GET", f"projects/{project_id}/members", json_list(self._parse))
+
+    def create(self, project_id: int, member: Member) -> Call[Member]:
+        payload = member.dict(exclude={"id", "username", "rolename"})
+        return Call("POST", f"projects/{project_id}/members", self._convert, {"json": payload})
+
+    def update(self, project_id: int, member: Member) -> Call[Member]:
+        if member.id is None:
+            raise ValueError("Member id is required")
+        payload = member.dict(exclude={"username", "rolename"})
+        return Call("PUT", f"projects/{project_id}/members/{member.id}", self._convert, {"json": payload})
+
+    def delete(self, project_id: int, member: Member | int) -> Call[None]:
+        if isinstance(member, Member) and member.id is None:
+            raise ValueError("Member id is required")
+        member_id = member if isinstance(member, int) else member.id
+        return self.bulk_delete(project_id, [member_id])  # type: ignore
+
+    def bulk_delete(self, project_id: int, members: List[int] | List[Member]) -> Call[None]:
+        ids = [member if isinstance(member, int) else member.id for member in members]
+        return Call("DELETE", f"projects/{project_id}/members", no_content, {"json": {"ids": ids}})
 
 
 class MemberRepository:
     """Repository for interacting with the Doccano member API"""
 
-    def __init__(self, client: BaseRepository):
+    def __init__(self, client: BaseRepository, trusted: bool = False):
+        """Initialize the repository
+
+        Args:
+            client (BaseRepository): The client sending the requests
+            trusted (bool): Whether to build members from responses without validating them. Defaults to False.
+        """
         self._client = client
+        self._calls = MemberCalls(trusted)
 
     def find_by_id(self, project_id: int, member_id: int) -> Member:
         """Find a member by id
@@ -22,9 +73,7 @@ class MemberRepository:
         Returns:
             Member: The found member
         """
-        resource = f"projects/{project_id}/members/{member_id}"
-        response = self._client.get(resource)
-        return Member.parse_obj(response.json())
+        return self._calls.find_by_id(project_id, member_id).send(self._client)
 
     def list(self, project_id: int) -> List[Member]:
         """Return all member in which you are a member
@@ -35,10 +84,7 @@ class MemberRepository:
         Returns:
             Member: The list of the member.
         """
-        resource = f"projects/{project_id}/members"
-        response = self._client.get(resource)
-        members = [Member.parse_obj(member) for member in response.json()]
-        return members
+        return self._calls.list(project_id).send(self._client)
 
     def create(self, project_id: int, member: Member) -> Member:
         """Create a new member
@@ -50,9 +96,7 @@ class MemberRepository:
         Returns:
             Member: The created member
         """
-        resource = f"projects/{project_id}/members"
-        response = self._client.post(resource, json=member.dict(exclude={"id", "username", "rolename"}))
-        return Member.parse_obj(response.json())
+        return self._calls.create(project_id, member).send(self._client)
 
     def update(self, project_id: int, member: Member) -> Member:
         """Update a member
@@ -67,11 +111,7 @@ class MemberRepository:
         Raises:
             ValueError: If the member id is not set
         """
-        if member.id is None:
-            raise ValueError("Member id is required")
-        resource = f"projects/{project_id}/members/{member.id}"
-        response = self._client.put(resource, json=member.dict(exclude={"username", "rolename"}))
-        return Member.parse_obj(response.json())
+        return self._calls.update(project_id, member).send(self._client)
 
     def delete(self, project_id: int, member: Member | int):
         """Delete a member
@@ -83,10 +123,7 @@ class MemberRepository:
         Raises:
             ValueError: If the member id is not set
         """
-        if isinstance(member, Member) and member.id is None:
-            raise ValueError("Member id is required")
-        member_id = member if isinstance(member, int) else member.id
-        self.bulk_delete(project_id, [member_id])  # type: ignore
+        self._calls.delete(project_id, member).send(self._client)
 
     def bulk_delete(self, project_id: int, members: List[int] | List[Member]):
         """Bulk delete members
@@ -95,5 +132,4 @@ class MemberRepository:
             project_id (int): The id of the project
             members (List[int] | List[Member]): The list of member ids to delete
         """
-        ids = [member if isinstance(member, int) else member.id for member in members]
-        self._client.delete(f"projects/{project_id}/members", json={"ids": ids})
+        self._calls.bulk_delete(project_id, members).send(self._client)
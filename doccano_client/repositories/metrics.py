@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterator, List
+from typing import Any, Dict, List
 
 from doccano_client.models.metrics import (
     LabelCount,
@@ -9,6 +9,57 @@ from doccano_client.models.metrics import (
     Progress,
 )
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import Call, json_body
+
+
+def _to_progress(response: Dict[str, Any]) -> Progress:
+    return Progress(total=response["total"], completed=response["complete"], remaining=response["remaining"])
+
+
+def _to_members_progress(response: Dict[str, Any]) -> List[MemberProgress]:
+    return [
+        MemberProgress(
+            username=progress["user"],
+            progress=Progress(
+                total=response["total"], completed=progress["done"], remaining=response["total"] - progress["done"]
+            ),
+        )
+        for progress in response["progress"]
+    ]
+
+
+def _to_label_distribution(response: Dict[str, Any]) -> List[LabelDistribution]:
+    return [
+        LabelDistribution(
+            username=username, counts=[LabelCount(label=label, count=count) for label, count in counts.items()]
+        )
+        for username, counts in response.items()
+    ]
+
+
+class MetricsCalls:
+    """Calls of the Doccano metrics API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name.
+    """
+
+    def get_progress(self, project_id: int) -> Call[Progress]:
+        return Call("GET", f"projects/{project_id}/metrics/progress", json_body(_to_progress))
+
+    def get_members_progress(self, project_id: int) -> Call[List[MemberProgress]]:
+        return Call("GET", f"projects/{project_id}/metrics/member-progress", json_body(_to_members_progress))
+
+    def get_category_distribution(self, project_id: int) -> Call[List[LabelDistribution]]:
+        return self._get_label_distribution(f"projects/{project_id}/metrics/category-distribution")
+
+    def get_span_distribution(self, project_id: int) -> Call[List[LabelDistribution]]:
+        return self._get_label_distribution(f"projects/{project_id}/metrics/span-distribution")
+
+    def get_relation_distribution(self, project_id: int) -> Call[List[LabelDistribution]]:
+        return self._get_label_distribution(f"projects/{project_id}/metrics/relation-distribution")
+
+    def _get_label_distribution(self, resource: str) -> Call[List[LabelDistribution]]:
+        return Call("GET", resource, json_body(_to_label_distribution))
 
 
 class MetricsRepository:
@@ -16,6 +67,7 @@ class MetricsRepository:
 
     def __init__(self, client: BaseRepository):
         self._client = client
+        self._calls = MetricsCalls()
 
     def get_progress(self, project_id: int) -> Progress:
         """Get my progress
@@ -26,9 +78,7 @@ class MetricsRepository:
         Returns:
             Progress: Your progress
         """
-        resource = f"projects/{project_id}/metrics/progress"
-        response = self._client.get(resource).json()
-        return Progress(total=response["total"], completed=response["complete"], remaining=response["remaining"])
+        return self._calls.get_progress(project_id).send(self._client)
 
     def get_members_progress(self, project_id: int) -> List[MemberProgress]:
         """Return all metricss in which you are a member
@@ -39,31 +89,7 @@ class MetricsRepository:
         Returns:
             List[MemberProgress]: The list of the member progress.
         """
-        resource = f"projects/{project_id}/metrics/member-progress"
-        response = self._client.get(resource).json()
-        return [
-            MemberProgress(
-                username=progress["user"],
-                progress=Progress(
-                    total=response["total"], completed=progress["done"], remaining=response["total"] - progress["done"]
-                ),
-            )
-            for progress in response["progress"]
-        ]
-
-    def _get_label_distribution(self, resource: str) -> Iterator[LabelDistribution]:
-        """Yield label distribution
-
-        Args:
-            resource (str): The resource to get
-
-        Yields:
-            LabelDistribution: The category distribution.
-        """
-        response = self._client.get(resource).json()
-        for username, counts in response.items():
-            label_counts = [LabelCount(label=label, count=count) for label, count in counts.items()]
-            yield LabelDistribution(username=username, counts=label_counts)
+        return self._calls.get_members_progress(project_id).send(self._client)
 
     def get_category_distribution(self, project_id: int) -> List[LabelDistribution]:
         """Return category distribution
@@ -74,8 +100,7 @@ class MetricsRepository:
         Returns:
             LabelDistribution: The category distribution.
         """
-        resource = f"projects/{project_id}/metrics/category-distribution"
-        return list(self._get_label_distribution(resource))
+        return self._calls.get_category_distribution(project_id).send(self._client)
 
     def get_span_distribution(self, project_id: int) -> List[LabelDistribution]:
         """Return span distribution
@@ -86,8 +111,7 @@ class MetricsRepository:
         Returns:
             LabelDistribution: The span distribution.
         """
-        resource = f"projects/{project_id}/metrics/span-distribution"
-        return list(self._get_label_distribution(resource))
+        return self._calls.get_span_distribution(project_id).send(self._client)
 
     def get_relation_distribution(self, project_id: int) -> List[LabelDistribution]:
         """Return relation distribution
@@ -98,5 +122,4 @@ class MetricsRepository:
         Returns:
             LabelDistribution: The relation distribution.
         """
-        resource = f"projects/{project_id}/metrics/relation-distribution"
-        return list(self._get_label_distribution(resource))
+        return self._calls.get_relation_distribution(project_id).send(self._client)
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterator
+from typing import Any, Dict, Iterator, Optional
 
 from doccano_client.models.project import Project
-from doccano_client.repositories.base import BaseRepository, get_next_url
+from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import Call, PageCall, json_body, no_content
 
 
-class ProjectRepository:
-    """Repository for interacting with the Doccano project API"""
+class ProjectCalls:
+    """Calls of the Doccano project API, shared by the synchronous and the asynchronous repositories
 
-    def __init__(self, client: BaseRepository):
-        self._client = client
+    Each method returns the call of the repository method of the same name.
+    """
 
     def _to_domain(self, response: Dict[str, Any]) -> Project:
         """Convert a response to a domain object
@@ -37,6 +38,32 @@ class ProjectRepository:
         project_dict["tags"] = [{"text": tag} for tag in project_dict["tags"]]
         return project_dict
 
+    def find_by_id(self, project_id: int) -> Call[Project]:
+        return Call("GET", f"projects/{project_id}", json_body(self._to_domain))
+
+    def list(self) -> PageCall[Project]:
+        return PageCall("projects", self._to_domain)
+
+    def create(self, project: Project) -> Call[Project]:
+        payload = self._to_persistent(project)
+        payload.pop("id", None)
+        return Call("POST", "projects", json_body(self._to_domain), {"json": payload})
+
+    def update(self, project: Project) -> Call[Project]:
+        payload = self._to_persistent(project)
+        return Call("PUT", f"projects/{project.id}", json_body(self._to_domain), {"json": payload})
+
+    def delete(self, project: Project | int) -> Call[None]:
+        return Call("DELETE", f"projects/{project if isinstance(project, int) else project.id}", no_content)
+
+
+class ProjectRepository:
+    """Repository for interacting with the Doccano project API"""
+
+    def __init__(self, client: BaseRepository):
+        self._client = client
+        self._calls = ProjectCalls()
+
     def find_by_id(self, project_id: int) -> Project:
         """Find a project by id
 
@@ -46,29 +73,20 @@ class ProjectRepository:
         Returns:
             Project: The found project
         """
-        response = self._client.get(f"projects/{project_id}")
-        return self._to_domain(response.json())
+        return self._calls.find_by_id(project_id).send(self._client)
 
-    def list(self) -> Iterator[Project]:
+    def list(self, max_workers: int = 1, page_size: Optional[int] = None) -> Iterator[Project]:
         """Return all projects in which you are a member
 
+        Args:
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
+
         Yields:
             Project: The next project.
         """
-        response = self._client.get("projects")
-        initial_url = response.url
-
-        while True:
-            projects = response.json()
-            for project in projects["results"]:
-                yield self._to_domain(project)
-
-            next_page = get_next_url(self._client.api_url, initial_url, projects)
-
-            if next_page is None:
-                break
-            else:
-                response = self._client.get(next_page)
+        yield from self._calls.list().send(self._client, max_workers, page_size)
 
     def create(self, project: Project) -> Project:
         """Create a new project
@@ -79,10 +97,7 @@ class ProjectRepository:
         Returns:
             Project: The created project
         """
-        payload = self._to_persistent(project)
-        payload.pop("id", None)
-        response = self._client.post("projects", json=payload)
-        return self._to_domain(response.json())
+        return self._calls.create(project).send(self._client)
 
     def update(self, project: Project) -> Project:
         """Update a project
@@ -93,10 +108,7 @@ class ProjectRepository:
         Returns:
             Project: The updated project
         """
-        resource = f"projects/{project.id}"
-        payload = self._to_persistent(project)
-        response = self._client.put(resource, json=payload)
-        return self._to_domain(response.json())
+        return self._calls.update(project).send(self._client)
 
     def delete(self, project: Project | int):
         """Delete a project
@@ -104,5 +116,4 @@ class ProjectRepository:
         Args:
             project (Project | int): The project to delete
         """
-        resource = f"projects/{project if isinstance(project, int) else project.id}"
-        self._client.delete(resource)
+        self._calls.delete(project).send(self._client)
@@ -1,9 +1,31 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, List
 
 from doccano_client.models.role import Role
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import Call, json_list
+
+
+class RoleCalls:
+    """Calls of the Doccano role API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name.
+    """
+
+    def list(self) -> Call[List[Role]]:
+        return Call("GET", "roles", json_list(Role.parse_obj))
+
+    def find_by_name(self, name: str) -> Call[Role]:
+        roles = self.list()
+
+        def convert(response: Any) -> Role:
+            for role in roles.convert(response):
+                if role.name == name:
+                    return role
+            raise ValueError(f"Role '{name}' not found")
+
+        return Call(roles.method, roles.resource, convert)
 
 
 class RoleRepository:
@@ -11,6 +33,7 @@ class RoleRepository:
 
     def __init__(self, client: BaseRepository):
         self._client = client
+        self._calls = RoleCalls()
 
     def list(self) -> List[Role]:
         """Return all roles
@@ -18,9 +41,7 @@ class RoleRepository:
         Returns:
             Role: The list of the roles.
         """
-        response = self._client.get("roles")
-        roles = [Role.parse_obj(role) for role in response.json()]
-        return roles
+        return self._calls.list().send(self._client)
 
     def find_by_name(self, name: str) -> Role:
         """Find a role by name
@@ -34,8 +55,4 @@ class RoleRepository:
         Raises:
             ValueError: If the role is not found
         """
-        roles = self.list()
-        for role in roles:
-            if role.name == name:
-                return role
-        raise ValueError(f"Role '{name}' not found")
+        return self._calls.find_by_name(name).send(self._client)
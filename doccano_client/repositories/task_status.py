@@ -1,9 +1,22 @@
 from __future__ import annotations
 
 import time
+from typing import Dict, List
 
 from doccano_client.models.task_status import TaskStatus
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import Call, json_body
+from doccano_client.utils.backoff import exponential_backoff
+
+
+class TaskStatusCalls:
+    """Calls of the Doccano task status API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name.
+    """
+
+    def get(self, task_id: str) -> Call[TaskStatus]:
+        return Call("GET", f"tasks/status/{task_id}", json_body(TaskStatus.parse_obj))
 
 
 class TaskStatusRepository:
@@ -11,6 +24,7 @@ class TaskStatusRepository:
 
     def __init__(self, client: BaseRepository):
         self._client = client
+        self._calls = TaskStatusCalls()
 
     def get(self, task_id: str) -> TaskStatus:
         """Return the specified task_status
@@ -21,15 +35,27 @@ class TaskStatusRepository:
         Returns:
             TaskStatus: The task_status.
         """
-        response = self._client.get(f"tasks/status/{task_id}")
-        return TaskStatus.parse_obj(response.json())
+        return self._calls.get(task_id).send(self._client)
 
-    def wait(self, task_id: str, timeout: int = 3600) -> TaskStatus:
+    def wait(
+        self,
+        task_id: str,
+        timeout: float = 3600,
+        interval: float = 0.5,
+        backoff: float = 1.5,
+        max_interval: float = 10.0,
+    ) -> TaskStatus:
         """Wait for the specified task id
 
+        The status is polled at once, then at exponentially growing intervals
+        until the task is ready or the deadline passes.
+
         Args:
             task_id (str): The celery task id
-            timeout (int): The timeout in seconds
+            timeout (float): The maximum number of seconds to wait. Defaults to 3600.
+            interval (float): The seconds to wait before the first re-poll. Defaults to 0.5.
+            backoff (float): The factor applied to the interval after each poll. Defaults to 1.5.
+            max_interval (float): The maximum seconds between polls. Defaults to 10.
 
         Returns:
             TaskStatus: The task_status.
@@ -37,9 +63,48 @@ class TaskStatusRepository:
         Raises:
             TimeoutError: If the task does not complete within the timeout
         """
-        for _ in range(timeout):
-            status = self.get(task_id)
-            if status.ready:
-                return status
-            time.sleep(1)
-        raise TimeoutError(f"Timeout waiting for task {task_id}")
+        statuses = self.wait_all([task_id], timeout, interval, backoff, max_interval)
+        return statuses[0]
+
+    def wait_all(
+        self,
+        task_ids: List[str],
+        timeout: float = 3600,
+        interval: float = 0.5,
+        backoff: float = 1.5,
+        max_interval: float = 10.0,
+    ) -> List[TaskStatus]:
+        """Wait for all the specified task ids
+
+        Every pending task is polled on each round, and the rounds share
+        one backoff schedule and one deadline.
+
+        Args:
+            task_ids (List[str]): The celery task ids
+            timeout (float): The maximum number of seconds to wait. Defaults to 3600.
+            interval (float): The seconds to wait before the first re-poll. Defaults to 0.5.
+            backoff (float): The factor applied to the interval after each poll. Defaults to 1.5.
+            max_interval (float): The maximum seconds between polls. Defaults to 10.
+
+        Returns:
+            List[TaskStatus]: The task_status of each task, in the order of task_ids.
+
+        Raises:
+            TimeoutError: If any task does not complete within the timeout
+        """
+        statuses: Dict[str, TaskStatus] = {}
+        pending = list(dict.fromkeys(task_ids))
+        deadline = time.monotonic() + timeout
+        for delay in exponential_backoff(interval, backoff, max_interval):
+            for task_id in pending:
+                status = self.get(task_id)
+                if status.ready:
+                    statuses[task_id] = status
+            pending = [task_id for task_id in pending if task_id not in statuses]
+            if not pending:
+                return [statuses[task_id] for task_id in task_ids]
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+        raise TimeoutError(f"Timeout waiting for tasks {', '.join(pending)}")
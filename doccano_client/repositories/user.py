@@ -1,9 +1,38 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Any, List
 
 from doccano_client.models.user import User
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import Call, json_body, json_list
+
+
+class UserCalls:
+    """Calls of the Doccano user API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name.
+    """
+
+    def get_profile(self) -> Call[User]:
+        return Call("GET", "me", json_body(User.parse_obj))
+
+    def list(self, name: str = "") -> Call[List[User]]:
+        return Call("GET", f"users?q={name}", json_list(User.parse_obj))
+
+    def find_by_name(self, name: str) -> Call[User]:
+        search = self.list(name)
+
+        def convert(response: Any) -> User:
+            for user in search.convert(response):
+                if user.username == name:
+                    return user
+            raise ValueError(f"User '{name}' not found")
+
+        return Call(search.method, search.resource, convert)
+
+    def create_user(self, username: str, password: str) -> Call[User]:
+        payload = {"username": username, "password1": password, "password2": password}
+        return Call("POST", "users/create", json_body(User.parse_obj), {"json": payload})
 
 
 class UserRepository:
@@ -11,6 +40,7 @@ class UserRepository:
 
     def __init__(self, client: BaseRepository):
         self._client = client
+        self._calls = UserCalls()
 
     def get_profile(self) -> User:
         """Get a profile
@@ -18,8 +48,7 @@ class UserRepository:
         Returns:
             User: The user.
         """
-        response = self._client.get("me")
-        return User.parse_obj(response.json())
+        return self._calls.get_profile().send(self._client)
 
     def list(self, name: str = "") -> List[User]:
         """Return users
@@ -30,9 +59,7 @@ class UserRepository:
         Returns:
             User: The list of the users.
         """
-        response = self._client.get(f"users?q={name}")
-        users = [User.parse_obj(user) for user in response.json()]
-        return users
+        return self._calls.list(name).send(self._client)
 
     def find_by_name(self, name: str) -> User:
         """Find a user by name
@@ -46,11 +73,7 @@ class UserRepository:
         Raises:
             ValueError: If the user is not found
         """
-        users = self.list(name)
-        for user in users:
-            if user.username == name:
-                return user
-        raise ValueError(f"User '{name}' not found")
+        return self._calls.find_by_name(name).send(self._client)
 
     def create_user(self, username: str, password: str) -> User:
         """Create new user.
@@ -62,8 +85,4 @@ class UserRepository:
         Returns:
             User: the newly created user info
         """
-        response = self._client.post(
-            "users/create",
-            json={"username": username, "password1": password, "password2": password},
-        )
-        return User.parse_obj(response.json())
+        return self._calls.create_user(username, password).send(self._client)
@@ -6,6 +6,24 @@ from doccano_client.models.user_details import (
     UserDetails,
 )
 from doccano_client.repositories.base import BaseRepository
+from doccano_client.repositories.call import Call, json_body
+
+
+class UserDetailsCalls:
+    """Calls of the Doccano UserDetails API, shared by the synchronous and the asynchronous repositories
+
+    Each method returns the call of the repository method of the same name.
+    """
+
+    def get_current_user_details(self) -> Call[UserDetails]:
+        return Call("GET", "auth/user/", json_body(UserDetails.parse_obj))
+
+    def update_current_user_details(self, user_details: UserDetails) -> Call[UserDetails]:
+        return Call("PUT", "auth/user/", json_body(UserDetails.parse_obj), {"json": user_details.dict()})
+
+    def change_current_user_password(self, password_change: PasswordChange) -> Call[PasswordUpdated]:
+        payload = {"new_password1": password_change.new_password, "new_password2": password_change.confirm_password}
+        return Call("POST", "auth/password/change/", json_body(PasswordUpdated.parse_obj), {"json": payload})
 
 
 class UserDetailsRepository:
@@ -13,6 +31,7 @@ class UserDetailsRepository:
 
     def __init__(self, client: BaseRepository):
         self._client = client
+        self._calls = UserDetailsCalls()
 
     def get_current_user_details(self) -> UserDetails:
         """Get the Current User Details
@@ -20,8 +39,7 @@ class UserDetailsRepository:
         Returns:
             UserDetails: The user login info.
         """
-        response = self._client.get("auth/user/")
-        return UserDetails.parse_obj(response.json())
+        return self._calls.get_current_user_details().send(self._client)
 
     def update_current_user_details(self, user_details: UserDetails) -> UserDetails:
         """Update either username, first name or last name of the current user.
@@ -33,8 +51,7 @@ class UserDetailsRepository:
         Returns:
             UserDetails: the updated user login info
         """
-        response = self._client.put("auth/user/", json=user_details.dict())
-        return UserDetails.parse_obj(response.json())
+        return self._calls.update_current_user_details(user_details).send(self._client)
 
     def change_current_user_password(self, password_change: PasswordChange) -> PasswordUpdated:
         """Change the password of the Current User
@@ -45,8 +62,4 @@ class UserDetailsRepository:
         Returns:
             PasswordUpdated: Message confirming password change.
         """
-        response = self._client.post(
-            "auth/password/change/",
-            json={"new_password1": password_change.new_password, "new_password2": password_change.confirm_password},
-        )
-        return PasswordUpdated.parse_obj(response.json())
+        return self._calls.change_current_user_password(password_change).send(self._client)
@@ -1,4 +1,4 @@
-from typing import Iterator, List
+from typing import Iterator, List, Optional
 
 from doccano_client.models.comment import Comment
 from doccano_client.repositories.comment import CommentRepository
@@ -20,18 +20,23 @@ class CommentUseCase:
         """
         return self._repository.find_by_id(project_id, comment_id)
 
-    def list(self, project_id: int, example_id: int, query: str = "") -> Iterator[Comment]:
+    def list(
+        self, project_id: int, example_id: int, query: str = "", max_workers: int = 1, page_size: Optional[int] = None
+    ) -> Iterator[Comment]:
         """Return all comments
 
         Args:
             project_id (int): The id of the project
             example_id (int): The id of the example
             query (str): The query string to filter comments
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
 
         Yields:
             Comment: The comments in the project.
         """
-        yield from self._repository.list(project_id, example_id, query)
+        yield from self._repository.list(project_id, example_id, query, max_workers, page_size)
 
     def create(
         self,
@@ -1,9 +1,32 @@
+import json
 import pathlib
-from typing import List
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from doccano_client.models.data_download import Option
+from doccano_client.models.example import Example
 from doccano_client.repositories.data_download import DataDownloadRepository
 from doccano_client.repositories.task_status import TaskStatusRepository
+from doccano_client.utils.stream import iter_lines, iter_zip_entries
+
+LABEL_KEYS = ("label", "entities", "relations", "cats")
+
+
+def to_example(record: Dict[str, Any], column_data: str = "text") -> Tuple[Example, Dict[str, Any]]:
+    """Split an exported JSONL record into an example and its labels
+
+    Args:
+        record (Dict[str, Any]): The exported record
+        column_data (str): The column name of the data. Defaults to "text".
+
+    Returns:
+        Tuple[Example, Dict[str, Any]]: The example, whose meta holds the remaining columns,
+            and its labels keyed by column name.
+    """
+    record = dict(record)
+    labels = {key: record.pop(key) for key in LABEL_KEYS if key in record}
+    record.pop("Comments", None)
+    example = Example(id=record.pop("id", None), text=record.pop(column_data, None), meta=record)
+    return example, labels
 
 
 class DataDownloadUseCase:
@@ -39,3 +62,38 @@ class DataDownloadUseCase:
         self._task_status_repository.wait(task_id)
         file_path = self._data_download_repository.download(project_id, task_id, dir_name)
         return file_path
+
+    def iter_export(
+        self, project_id: int, format: str = "JSONL", only_approved=False, chunk_size: int = 65536
+    ) -> Iterator[Tuple[Example, Dict[str, Any]]]:
+        """Export the project and iterate over its records while the export is received
+
+        The export is streamed and unpacked on the fly, so only one chunk of the
+        response is held in memory at a time.
+
+        Args:
+            project_id (int): The id of the project
+            format (str): The format of the export. Must be a JSONL format. Defaults to "JSONL".
+            only_approved (bool): Whether to export approved data only
+            chunk_size (int): The size of the chunks read from the response. Defaults to 65536.
+
+        Yields:
+            Tuple[Example, Dict[str, Any]]: The next example and its labels keyed by column name.
+
+        Raises:
+            ValueError: If the format is not a JSONL format
+        """
+        if not format.startswith("JSONL"):
+            raise ValueError(f"Format '{format}' cannot be streamed, use a JSONL format")
+        option = self._data_download_repository.find_option_by_name(project_id, format)
+        task_id = self._data_download_repository.schedule_download(project_id, option, only_approved)
+        self._task_status_repository.wait(task_id)
+        file_name, chunks = self._data_download_repository.stream(project_id, task_id, chunk_size)
+        contents: Iterable[Iterator[bytes]]
+        if file_name.endswith(".zip"):
+            contents = (content for _, content in iter_zip_entries(chunks, chunk_size))
+        else:
+            contents = iter([chunks])
+        for content in contents:
+            for line in iter_lines(content):
+                yield to_example(json.loads(line))
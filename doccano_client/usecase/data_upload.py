@@ -1,9 +1,45 @@
-from typing import List
+from __future__ import annotations
+
+import contextlib
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from requests.exceptions import RequestException
 
 from doccano_client.models.data_upload import Option, Task
+from doccano_client.models.example import Example
 from doccano_client.models.task_status import TaskStatus
 from doccano_client.repositories.data_upload import DataUploadRepository
 from doccano_client.repositories.task_status import TaskStatusRepository
+from doccano_client.utils.concurrency import ordered_map
+
+
+def to_jsonl_chunks(
+    examples: Iterable[Example | Dict[str, Any]], chunk_size: int, column_data: str = "text"
+) -> Iterator[bytes]:
+    """Serialize examples into JSONL documents of at most chunk_size lines
+
+    Args:
+        examples (Iterable[Example | Dict[str, Any]]): The examples to serialize. An Example is written
+            as its meta with the text under column_data. A dict is written as is.
+        chunk_size (int): The maximum number of examples per document
+        column_data (str): The column name of the data. Defaults to "text".
+
+    Yields:
+        bytes: The next JSONL document.
+    """
+    iterator = iter(examples)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        lines = []
+        for example in chunk:
+            record = {**example.meta, column_data: example.text} if isinstance(example, Example) else example
+            lines.append(json.dumps(record, ensure_ascii=False))
+        yield "\n".join(lines).encode("utf-8")
 
 
 class DataUploadUseCase:
@@ -30,8 +66,13 @@ class DataUploadUseCase:
         format: str,
         column_data: str = "text",
         column_label: str = "label",
+        max_workers: int = 4,
+        progress: Optional[Callable[[str, int, int], None]] = None,
     ) -> TaskStatus:
-        """Upload a file
+        """Upload files concurrently and ingest them into the project
+
+        If any upload fails, the files that were already uploaded are reverted
+        before the error is raised.
 
         Args:
             project_id (int): The id of the project
@@ -40,12 +81,89 @@ class DataUploadUseCase:
             format (str): The format of the upload
             column_data (str): The column name of the data
             column_label (str): The column name of the label
+            max_workers (int): The maximum number of files uploaded concurrently. Defaults to 4.
+            progress (Callable[[str, int, int], None], optional): Called after each uploaded file
+                with its path, the number of uploaded files and the total number of files.
 
         Returns:
             TaskStatus: The status of the upload task.
         """
-        upload_ids = [self._data_upload_repository.upload(file_path) for file_path in file_paths]
+        upload_ids = self._upload_files(file_paths, max_workers, progress)
         task_id = self._data_upload_repository.ingest(
             project_id, upload_ids, task, format, column_data=column_data, column_label=column_label
         )
         return self._task_status_repository.wait(task_id)
+
+    def _upload_files(
+        self, file_paths: List[str], max_workers: int, progress: Optional[Callable[[str, int, int], None]]
+    ) -> List[str]:
+        """Upload files on a thread pool, reverting the uploaded ones if any upload fails
+
+        Args:
+            file_paths (List[str]): The list of the file paths
+            max_workers (int): The maximum number of files uploaded concurrently
+            progress (Callable[[str, int, int], None], optional): The progress callback
+
+        Returns:
+            List[str]: The ids of the uploaded files, in the order of file_paths.
+        """
+        upload_ids: Dict[int, str] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._data_upload_repository.upload, path): i for i, path in enumerate(file_paths)
+            }
+            try:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    upload_ids[i] = future.result()
+                    if progress is not None:
+                        progress(file_paths[i], len(upload_ids), len(file_paths))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+                for future in futures:
+                    if not future.cancelled() and future.exception() is None:
+                        with contextlib.suppress(RequestException):
+                            self._data_upload_repository.delete(future.result())
+                raise
+        return [upload_ids[i] for i in range(len(file_paths))]
+
+    def upload_examples(
+        self,
+        project_id: int,
+        examples: Iterable[Example | Dict[str, Any]],
+        task: Task,
+        chunk_size: int = 1000,
+        column_data: str = "text",
+        column_label: str = "label",
+        max_workers: int = 4,
+    ) -> List[TaskStatus]:
+        """Upload examples through the file import without writing them to disk
+
+        The examples are serialized into in-memory JSONL chunks. Each chunk is uploaded and
+        ingested as its own import task, and all the tasks are waited on at the end.
+
+        Args:
+            project_id (int): The id of the project
+            examples (Iterable[Example | Dict[str, Any]]): The examples to upload. A dict is uploaded
+                as a JSONL line, so it can carry labels under column_label.
+            task (Task): The task of the upload
+            chunk_size (int): The number of examples per uploaded file. Defaults to 1000.
+            column_data (str): The column name of the data
+            column_label (str): The column name of the label
+            max_workers (int): The maximum number of chunks uploaded concurrently. Defaults to 4.
+
+        Returns:
+            List[TaskStatus]: The status of the import task of each chunk.
+        """
+
+        def upload_chunk(chunk: bytes) -> str:
+            upload_id = self._data_upload_repository.upload_content("examples.jsonl", chunk)
+            return self._data_upload_repository.ingest(
+                project_id, [upload_id], task, "JSONL", column_data=column_data, column_label=column_label
+            )
+
+        chunks = to_jsonl_chunks(examples, chunk_size, column_data)
+        task_ids = list(ordered_map(upload_chunk, chunks, max_workers))
+        return self._task_status_repository.wait_all(task_ids)
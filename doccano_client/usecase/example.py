@@ -1,5 +1,9 @@
-from typing import Any, Dict, Iterator, List, Optional
+from __future__ import annotations
 
+import pathlib
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from doccano_client.models.bulk import BulkItemResult
 from doccano_client.models.example import Example
 from doccano_client.repositories.example import ExampleRepository
 
@@ -31,17 +35,49 @@ class ExampleUseCase:
         """
         return self._repository.count(project_id)
 
-    def list(self, project_id: int, is_confirmed: Optional[bool] = None) -> Iterator[Example]:
+    def find_latest(self, project_id: int) -> Optional[Example]:
+        """Find the most recently created example
+
+        Args:
+            project_id (int): The id of the project
+
+        Returns:
+            Optional[Example]: The latest example, or None if the project has no example
+        """
+        return self._repository.find_latest(project_id)
+
+    def list(
+        self,
+        project_id: int,
+        is_confirmed: Optional[bool] = None,
+        max_workers: int = 1,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Example]:
         """Return all examples
 
         Args:
             project_id (int): The id of the project
             is_confirmed (bool, optional): Filter by confirmed state. Defaults to None.
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
 
         Yields:
             Example: The examples in the project.
         """
-        yield from self._repository.list(project_id, is_confirmed)
+        yield from self._repository.list(project_id, is_confirmed, max_workers, page_size)
+
+    def download_file(self, example: Example, file_path: str | pathlib.Path) -> pathlib.Path:
+        """Download the uploaded file of an example
+
+        Args:
+            example (Example): The example
+            file_path (str | pathlib.Path): The path to save the file to
+
+        Returns:
+            pathlib.Path: The path to the downloaded file
+        """
+        return self._repository.download_file(example, pathlib.Path(file_path))
 
     def create(
         self,
@@ -74,7 +110,7 @@ class ExampleUseCase:
         score: float = None,
         meta: Dict[str, Any] = None,
     ) -> Example:
-        """Update a example
+        """Update a example. Only the given fields are sent, in a single request.
 
         Args:
             project_id (int): The id of the project
@@ -86,14 +122,50 @@ class ExampleUseCase:
         Returns:
             Example: The updated example
         """
-        example = self.find_by_id(project_id, example_id)
-        example = Example(
-            id=example_id,
-            text=text if text is not None else example.text,
-            score=score if score is not None else example.score,
-            meta=meta if meta is not None else example.meta,
-        )
-        return self._repository.update(project_id, example)
+        fields = {"text": text, "score": score, "meta": meta}
+        fields = {name: value for name, value in fields.items() if value is not None}
+        return self._repository.partial_update(project_id, example_id, fields)
+
+    def bulk_update(
+        self, project_id: int, updates: Mapping[int, Dict[str, Any]], max_workers: int = 8
+    ) -> Iterator[BulkItemResult]:
+        """Update some fields of many examples with concurrent requests
+
+        Args:
+            project_id (int): The id of the project
+            updates (Mapping[int, Dict[str, Any]]): The new values by field name, by example id
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each update, in input order. The item is the pair of the
+                example id and its new values.
+        """
+        yield from self._repository.bulk_partial_update(project_id, updates.items(), max_workers)
+
+    def bulk_update_scores(
+        self,
+        project_id: int,
+        scores: Mapping[int, float],
+        current: Optional[Mapping[int, float]] = None,
+        max_workers: int = 8,
+    ) -> Iterator[BulkItemResult]:
+        """Update the confidence scores of many examples with concurrent requests
+
+        Args:
+            project_id (int): The id of the project
+            scores (Mapping[int, float]): The new scores by example id
+            current (Mapping[int, float], optional): The scores the server already holds by example id.
+                Examples whose score is unchanged are skipped. Defaults to None, which updates all.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each sent update, in input order.
+        """
+        current = current or {}
+        updates = {
+            example_id: {"score": score} for example_id, score in scores.items() if current.get(example_id) != score
+        }
+        yield from self.bulk_update(project_id, updates, max_workers)
 
     def delete(self, project_id: int, example_id: int):
         """Delete a example.
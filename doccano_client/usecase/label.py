@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
 
+from doccano_client.models.bulk import BulkItemResult
 from doccano_client.models.label import (
     BoundingBox,
     Category,
@@ -47,6 +48,22 @@ class LabelUseCase(Generic[T]):
         """
         return self._repository.list(project_id, example_id)
 
+    def bulk_create(
+        self, project_id: int, labels: Iterable[T | Dict[str, Any]], max_workers: int = 8
+    ) -> Iterator[BulkItemResult]:
+        """Create many labels with concurrent requests
+
+        Args:
+            project_id (int): The id of the project
+            labels (Iterable[T | Dict[str, Any]]): The labels to create, or their fields. Each
+                label holds the id of its example.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+
+        Yields:
+            BulkItemResult: The result of each label, in input order.
+        """
+        yield from self._repository.bulk_create(project_id, labels, max_workers)
+
     def delete(self, project_id: int, example_id: int, label_id: int):
         """Delete a label.
 
@@ -55,8 +72,22 @@ class LabelUseCase(Generic[T]):
             example_id (int): The id of the example
             label_id (int): The label id
         """
-        label = self.find_by_id(project_id, example_id, label_id)
-        self._repository.delete(project_id, label)
+        self._repository.delete_by_id(project_id, example_id, label_id)
+
+    def _partial_update(self, project_id: int, example_id: int, label_id: int, **fields) -> T:
+        """Send the given fields of a label, leaving out the ones that are None
+
+        Args:
+            project_id (int): The id of the project
+            example_id (int): The id of the example
+            label_id (int): The id of the label
+            fields: The new values by field name
+
+        Returns:
+            T: The updated label
+        """
+        fields = {name: value for name, value in fields.items() if value is not None}
+        return self._repository.partial_update(project_id, example_id, label_id, fields)
 
     def delete_all(self, project_id: int, example_id: int):
         """Delete all labels
@@ -122,8 +153,6 @@ class CategoryUseCase(LabelUseCase[Category]):
         Raises:
             ValueError: If the label type repository is not set
         """
-        category = self.find_by_id(project_id, example_id, label_id)
-
         if self._label_type_repository is None:
             raise ValueError("LabelTypeRepository is not set")
 
@@ -131,14 +160,9 @@ class CategoryUseCase(LabelUseCase[Category]):
             label_type = self._label_type_repository.find_by_name(project_id, label)
             label = label_type.id  # type: ignore
 
-        category = Category(
-            id=category.id,
-            example=example_id,
-            label=label or category.label,
-            manual=human_annotated or category.manual,
-            prob=confidence or category.prob,
+        return self._partial_update(
+            project_id, example_id, label_id, label=label, manual=human_annotated, prob=confidence
         )
-        return self._repository.update(project_id, category)
 
 
 class SpanUseCase(LabelUseCase[Span]):
@@ -215,8 +239,6 @@ class SpanUseCase(LabelUseCase[Span]):
         Raises:
             ValueError: If the label type repository is not set
         """
-        span = self.find_by_id(project_id, example_id, label_id)
-
         if self._label_type_repository is None:
             raise ValueError("LabelTypeRepository is not set")
 
@@ -224,16 +246,16 @@ class SpanUseCase(LabelUseCase[Span]):
             label_type = self._label_type_repository.find_by_name(project_id, label)
             label = label_type.id
 
-        span = Span(
-            id=span.id,
-            example=example_id,
-            start_offset=start_offset or span.start_offset,
-            end_offset=end_offset or span.end_offset,
-            label=label or span.label,
-            manual=human_annotated or span.manual,
-            prob=confidence or span.prob,
+        return self._partial_update(
+            project_id,
+            example_id,
+            label_id,
+            start_offset=start_offset,
+            end_offset=end_offset,
+            label=label,
+            manual=human_annotated,
+            prob=confidence,
         )
-        return self._repository.update(project_id, span)
 
 
 class RelationUseCase(LabelUseCase[Relation]):
@@ -310,8 +332,6 @@ class RelationUseCase(LabelUseCase[Relation]):
         Raises:
             ValueError: If the label type repository is not set
         """
-        relation = self.find_by_id(project_id, example_id, label_id)
-
         if self._label_type_repository is None:
             raise ValueError("LabelTypeRepository is not set")
 
@@ -319,16 +339,16 @@ class RelationUseCase(LabelUseCase[Relation]):
             label_type = self._label_type_repository.find_by_name(project_id, label)
             label = label_type.id
 
-        relation = Relation(
-            id=relation.id,
-            example=example_id,
-            from_id=from_id or relation.from_id,
-            to_id=to_id or relation.to_id,
-            type=label or relation.type,
-            manual=human_annotated or relation.manual,
-            prob=confidence or relation.prob,
+        return self._partial_update(
+            project_id,
+            example_id,
+            label_id,
+            from_id=from_id,
+            to_id=to_id,
+            type=label,
+            manual=human_annotated,
+            prob=confidence,
         )
-        return self._repository.update(project_id, relation)
 
 
 class TextUseCase(LabelUseCase[Text]):
@@ -382,15 +402,9 @@ class TextUseCase(LabelUseCase[Text]):
         Returns:
             Text: The updated text label
         """
-        text_label = self.find_by_id(project_id, example_id, label_id)
-        text_label = Text(
-            id=text_label.id,
-            example=example_id,
-            text=text or text_label.text,
-            manual=human_annotated or text_label.manual,
-            prob=confidence or text_label.prob,
+        return self._partial_update(
+            project_id, example_id, label_id, text=text, manual=human_annotated, prob=confidence
         )
-        return self._repository.update(project_id, text_label)
 
 
 class BoundingBoxUseCase(LabelUseCase[BoundingBox]):
@@ -480,24 +494,22 @@ class BoundingBoxUseCase(LabelUseCase[BoundingBox]):
         if self._label_type_repository is None:
             raise ValueError("LabelTypeRepository is not set")
 
-        bounding_box = self.find_by_id(project_id, example_id, label_id)
-
         if isinstance(label, str):
             label_type = self._label_type_repository.find_by_name(project_id, label)
             label = label_type.id
 
-        bounding_box = BoundingBox(
-            id=bounding_box.id,
-            example=example_id,
-            x=x or bounding_box.x,
-            y=y or bounding_box.y,
-            width=width or bounding_box.width,
-            height=height or bounding_box.height,
-            label=label or bounding_box.label,
-            manual=human_annotated or bounding_box.manual,
-            prob=confidence or bounding_box.prob,
+        return self._partial_update(
+            project_id,
+            example_id,
+            label_id,
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+            label=label,
+            manual=human_annotated,
+            prob=confidence,
         )
-        return self._repository.update(project_id, bounding_box)
 
 
 class SegmentUseCase(LabelUseCase[Segment]):
@@ -572,18 +584,10 @@ class SegmentUseCase(LabelUseCase[Segment]):
         if self._label_type_repository is None:
             raise ValueError("LabelTypeRepository is not set")
 
-        segment = self.find_by_id(project_id, example_id, label_id)
-
         if isinstance(label, str):
             label_type = self._label_type_repository.find_by_name(project_id, label)
             label = label_type.id
 
-        segment = Segment(
-            id=segment.id,
-            example=example_id,
-            points=points or segment.points,
-            label=label or segment.label,
-            manual=human_annotated or segment.manual,
-            prob=confidence or segment.prob,
+        return self._partial_update(
+            project_id, example_id, label_id, points=points, label=label, manual=human_annotated, prob=confidence
         )
-        return self._repository.update(project_id, segment)
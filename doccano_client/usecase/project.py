@@ -31,13 +31,18 @@ class ProjectUseCase:
         """
         return self._repository.find_by_id(project_id)
 
-    def list(self) -> Iterator[Project]:
+    def list(self, max_workers: int = 1, page_size: Optional[int] = None) -> Iterator[Project]:
         """Return all projects in which you are a member
 
+        Args:
+            max_workers (int): The maximum number of pages fetched concurrently. Defaults to 1.
+            page_size (int, optional): The number of items requested per page. Defaults to None,
+                which uses the default page size of the client.
+
         Yields:
             Project: The next project.
         """
-        yield from self._repository.list()
+        yield from self._repository.list(max_workers, page_size)
 
     def create(
         self,
@@ -0,0 +1,181 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from doccano_client.models.example import Example
+from doccano_client.models.label import Category, Label, Relation, Span
+from doccano_client.models.project import ProjectType
+from doccano_client.repositories.example import ExampleRepository
+from doccano_client.repositories.label import LabelRepository
+from doccano_client.repositories.label_type import LabelTypeRepository
+from doccano_client.repositories.project import ProjectRepository
+from doccano_client.usecase.data_download import DataDownloadUseCase
+from doccano_client.utils.concurrency import ordered_map
+
+LABEL_TYPE = Literal["category", "span", "relation", "text", "bounding_box", "segment"]
+EXPORTABLE_TYPES = frozenset({"category", "span", "relation"})
+# The column of a JSONL export holding each type of labels, by project type.
+EXPORT_COLUMNS: Dict[ProjectType, Dict[str, str]] = {
+    ProjectType.DOCUMENT_CLASSIFICATION: {"category": "label"},
+    ProjectType.IMAGE_CLASSIFICATION: {"category": "label"},
+    ProjectType.SEQUENCE_LABELING: {"span": "label", "relation": "relations"},
+    ProjectType.INTENT_DETECTION_AND_SLOT_FILLING: {"category": "cats", "span": "entities"},
+}
+
+
+class ProjectLabelUseCase:
+    def __init__(
+        self,
+        example_repository: ExampleRepository,
+        label_repositories: Dict[LABEL_TYPE, LabelRepository],
+        label_type_repositories: Dict[str, LabelTypeRepository],
+        project_repository: ProjectRepository,
+        data_download_usecase: DataDownloadUseCase,
+    ):
+        self._example_repository = example_repository
+        self._label_repositories = label_repositories
+        self._label_type_repositories = label_type_repositories
+        self._project_repository = project_repository
+        self._data_download_usecase = data_download_usecase
+
+    def iter_labels(
+        self,
+        project_id: int,
+        types: Iterable[LABEL_TYPE] = ("span",),
+        is_confirmed: Optional[bool] = None,
+        max_workers: int = 8,
+        use_export: Optional[bool] = None,
+        export_threshold: int = 1000,
+    ) -> Iterator[Tuple[Example, Dict[str, List[Label]]]]:
+        """Iterate over all examples of a project together with their labels
+
+        The labels are either fetched per example, with at most max_workers requests in flight,
+        or read from a streamed JSONL export of the project. The export takes a single request
+        but cannot filter by confirmed state, and its labels carry no id, user or confidence
+        except for the ids of the spans of relations.
+
+        Args:
+            project_id (int): The id of the project
+            types (Iterable[LABEL_TYPE]): The types of labels to get. Defaults to ("span",).
+            is_confirmed (bool, optional): Filter by confirmed state. Defaults to None.
+            max_workers (int): The maximum number of requests in flight. Defaults to 8.
+            use_export (bool, optional): Whether to read the labels from the export. Defaults to None,
+                which uses it when the project is collaborative, all types can be exported, no confirmed
+                state is requested and the project holds at least export_threshold examples.
+            export_threshold (int): The number of examples from which the export is cheaper. Defaults to 1000.
+
+        Yields:
+            Tuple[Example, Dict[str, List[Label]]]: The next example and its labels by type, in the order
+                of the examples.
+
+        Raises:
+            ValueError: If a type is unknown, or the export is requested for a type or a filter it does not support
+        """
+        types = list(types)
+        unknown = set(types) - set(self._label_repositories)
+        if unknown:
+            raise ValueError(f"Unknown label types: {', '.join(sorted(unknown))}")
+        if use_export is None:
+            use_export = (
+                is_confirmed is None
+                and EXPORTABLE_TYPES.issuperset(types)
+                and self._example_repository.count(project_id) >= export_threshold
+                and self._project_repository.find_by_id(project_id).collaborative_annotation
+            )
+        if use_export:
+            yield from self._iter_export(project_id, types, is_confirmed)
+            return
+
+        def fetch(example: Example) -> Tuple[Example, Dict[str, List[Label]]]:
+            # the examples of a project always have an id.
+            example_id = cast(int, example.id)
+            labels: Dict[str, List[Label]] = {
+                type: self._label_repositories[type].list(project_id, example_id) for type in types
+            }
+            return example, labels
+
+        examples = self._example_repository.list(project_id, is_confirmed, max_workers)
+        yield from ordered_map(fetch, examples, max_workers)
+
+    def _iter_export(
+        self, project_id: int, types: List[LABEL_TYPE], is_confirmed: Optional[bool]
+    ) -> Iterator[Tuple[Example, Dict[str, List[Label]]]]:
+        """Read the labels from a JSONL export of the project
+
+        Args:
+            project_id (int): The id of the project
+            types (List[LABEL_TYPE]): The types of labels to get
+            is_confirmed (bool, optional): Must be None, since the export cannot filter by confirmed state
+
+        Yields:
+            Tuple[Example, Dict[str, List[Label]]]: The next example and its labels by type
+
+        Raises:
+            ValueError: If a type or the filter cannot be exported
+        """
+        unsupported = set(types) - EXPORTABLE_TYPES
+        if unsupported:
+            raise ValueError(f"Label types cannot be exported: {', '.join(sorted(unsupported))}")
+        if is_confirmed is not None:
+            raise ValueError("The export cannot filter by confirmed state")
+        label_type_ids: Dict[Tuple[str, str], int] = {}
+
+        def label_type_id(type: str, name: str) -> int:
+            if (type, name) not in label_type_ids:
+                repository = self._label_type_repositories[type]
+                label_type_ids[type, name] = repository.find_by_name(project_id, name).id  # type: ignore
+            return label_type_ids[type, name]
+
+        project_type = self._project_repository.find_by_id(project_id).project_type
+        columns = dict(EXPORT_COLUMNS.get(project_type, {}))
+        format = "JSONL"
+        if "relation" in types and "relation" in columns:
+            format = "JSONL(relation)"
+            columns["span"] = "entities"
+        for example, record in self._data_download_usecase.iter_export(project_id, format):
+            labels: Dict[str, List[Label]] = {
+                type: to_labels(type, example.id, record.get(columns.get(type, ""), []), label_type_id)
+                for type in types
+            }
+            yield example, labels
+
+
+def to_labels(
+    type: str, example_id: Optional[int], values: List[Any], label_type_id: Callable[[str, str], int]
+) -> List[Label]:
+    """Convert the labels of an exported record to label models
+
+    Args:
+        type (str): The type of labels to convert, one of "category", "span" and "relation"
+        example_id (int, optional): The id of the example
+        values (List[Any]): The column of the record holding the labels of the type
+        label_type_id (Callable[[str, str], int]): The function returning the id of a label type by type and name
+
+    Returns:
+        List[Label]: The labels
+    """
+    if type == "category":
+        return [Category.parse_obj({"example": example_id, "label": label_type_id(type, name)}) for name in values]
+    if type == "span":
+        # spans are exported as objects next to relations, and as (start, end, label) triples otherwise.
+        entities = (
+            value if isinstance(value, dict) else dict(zip(("start_offset", "end_offset", "label"), value))
+            for value in values
+        )
+        return [
+            Span.parse_obj({**entity, "example": example_id, "label": label_type_id(type, entity["label"])})
+            for entity in entities
+        ]
+    return [
+        Relation.parse_obj({**relation, "example": example_id, "type": label_type_id(type, relation["type"])})
+        for relation in values
+    ]
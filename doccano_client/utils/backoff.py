@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Iterator
+
+
+def exponential_backoff(initial: float, factor: float, maximum: float) -> Iterator[float]:
+    """Yield exponentially growing delays capped at a maximum
+
+    Args:
+        initial (float): The first delay in seconds
+        factor (float): The factor applied to the delay after each step
+        maximum (float): The maximum delay in seconds
+
+    Yields:
+        float: The next delay in seconds.
+    """
+    delay = initial
+    while True:
+        yield min(delay, maximum)
+        delay *= factor
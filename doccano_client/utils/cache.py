@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import base64
+import collections
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, List, Optional
+from urllib.parse import quote, urlsplit
+
+from doccano_client.utils.instrumentation import resource_template
+
+# read-mostly resources, by template relative to the API url. Task statuses and paginated
+# lists change without a write through the client, so they are never cached.
+CACHEABLE_RESOURCES: FrozenSet[str] = frozenset(
+    {
+        "me",
+        "roles",
+        "projects/{id}",
+        "projects/{id}/catalog",
+        "projects/{id}/download-format",
+        "projects/{id}/category-types",
+        "projects/{id}/category-types/{id}",
+        "projects/{id}/span-types",
+        "projects/{id}/span-types/{id}",
+        "projects/{id}/relation-types",
+        "projects/{id}/relation-types/{id}",
+    }
+)
+
+
+class CachedResponse:
+    """The parts of a successful GET response kept in a cache"""
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: Dict[str, str],
+        content: bytes,
+        stored_at: Optional[float] = None,
+    ):
+        """Initialize the cached response
+
+        Args:
+            url (str): The url of the response
+            status_code (int): The status code
+            headers (Dict[str, str]): The response headers
+            content (bytes): The body
+            stored_at (float, optional): The time.time() at which the response was received or
+                last revalidated. Defaults to None, which means now.
+        """
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.stored_at = time.time() if stored_at is None else stored_at
+
+    def _header(self, name: str) -> Optional[str]:
+        name = name.lower()
+        return next((value for key, value in self.headers.items() if key.lower() == name), None)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self._header("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self._header("Last-Modified")
+
+    @property
+    def can_revalidate(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+
+    def validators(self) -> Dict[str, str]:
+        """Return the headers making a conditional request for this response
+
+        Returns:
+            Dict[str, str]: If-None-Match and If-Modified-Since headers, when available
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Base class of response caches
+
+    Only the responses of the resources in the allowlist are cached. Entries younger than
+    ttl are served without a request. Older entries that carry an ETag or a Last-Modified
+    header are revalidated with a conditional request, the others are fetched again.
+    """
+
+    def __init__(self, ttl: float = 60.0, resources: Iterable[str] = CACHEABLE_RESOURCES):
+        """Initialize the cache
+
+        Args:
+            ttl (float): The number of seconds an entry is served without revalidation. Defaults to 60.
+            resources (Iterable[str]): The templates of the cacheable resources relative to the API url,
+                e.g. ``projects/{id}/span-types``. Defaults to CACHEABLE_RESOURCES.
+        """
+        self.ttl = ttl
+        self.resources = frozenset(resources)
+
+    def is_cacheable(self, resource: str) -> bool:
+        """Tell whether the responses of a resource may be cached
+
+        Args:
+            resource (str): The resource relative to the API url, possibly with a query string
+
+        Returns:
+            bool: True if the template of the resource is in the allowlist
+        """
+        return resource_template(resource) in self.resources
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry of a key
+
+        Args:
+            key (str): The url of the request
+
+        Returns:
+            Optional[CachedResponse]: The entry, or None
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        """Store an entry
+
+        Args:
+            key (str): The url of the request
+            response (CachedResponse): The entry
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present
+
+        Args:
+            key (str): The url of the request
+        """
+        raise NotImplementedError
+
+    def keys(self) -> List[str]:
+        """Return the keys of all entries
+
+        Returns:
+            List[str]: The keys
+        """
+        raise NotImplementedError
+
+    def clear(self, scope: Optional[str] = None) -> None:
+        """Remove the entries of a scope, or all entries
+
+        Args:
+            scope (str, optional): The scope of the entries, i.e. the fragment of their keys such as
+                ``user=admin``. Defaults to None, which removes all entries.
+        """
+        for key in self.keys():
+            if scope is None or urlsplit(key).fragment == scope:
+                self.delete(key)
+
+    def is_fresh(self, response: CachedResponse) -> bool:
+        """Tell whether an entry may be served without asking the server
+
+        Args:
+            response (CachedResponse): The entry
+
+        Returns:
+            bool: True if the entry is younger than ttl
+        """
+        return time.time() - response.stored_at < self.ttl
+
+    def invalidate(self, url: str) -> None:
+        """Remove the entries a write to the url may have changed
+
+        These are the entries under the url, e.g. ``projects/1/examples/2/spans`` for
+        ``projects/1/examples/2``, and the entries of its parents, e.g. the list
+        ``projects/1/examples`` and the detail ``projects/1``.
+
+        The entries of every scope are removed, since the write changed the resource for all users.
+
+        Args:
+            url (str): The url of the write request
+        """
+        path = urlsplit(url).path.rstrip("/")
+        for key in self.keys():
+            key_path = urlsplit(key).path.rstrip("/")
+            if key_path == path or key_path.startswith(path + "/") or path.startswith(key_path + "/"):
+                self.delete(key)
+
+
+class MemoryCache(ResponseCache):
+    """Response cache in memory, evicting the least recently used entries"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0, resources: Iterable[str] = CACHEABLE_RESOURCES):
+        """Initialize the cache
+
+        Args:
+            maxsize (int): The maximum number of entries. Defaults to 256.
+            ttl (float): The number of seconds an entry is served without revalidation. Defaults to 60.
+            resources (Iterable[str]): The templates of the cacheable resources. Defaults to CACHEABLE_RESOURCES.
+        """
+        super().__init__(ttl, resources)
+        self.maxsize = maxsize
+        self._entries: collections.OrderedDict[str, CachedResponse] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._entries)
+
+
+class DiskCache(ResponseCache):
+    """Response cache in a directory, one JSON file per entry, shared between processes
+
+    The files are laid out by scope and url path, e.g. ``user=admin/v1/projects/1/<hash>.json``.
+    A write then only reads the directories of the written resource and of its parents,
+    whatever the number of entries, and clearing a scope leaves the other ones alone.
+    """
+
+    def __init__(
+        self, directory: str | pathlib.Path, ttl: float = 60.0, resources: Iterable[str] = CACHEABLE_RESOURCES
+    ):
+        """Initialize the cache, creating the directory if needed
+
+        Args:
+            directory (str | pathlib.Path): The directory of the entries
+            ttl (float): The number of seconds an entry is served without revalidation. Defaults to 60.
+            resources (Iterable[str]): The templates of the cacheable resources. Defaults to CACHEABLE_RESOURCES.
+        """
+        super().__init__(ttl, resources)
+        self.directory = pathlib.Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _scope_dir(self, scope: str) -> pathlib.Path:
+        return self.directory / quote(scope or "_", safe="")
+
+    @staticmethod
+    def _segments(url: str) -> List[str]:
+        return [quote(segment, safe="") for segment in urlsplit(url).path.split("/") if segment]
+
+    def _path(self, key: str) -> pathlib.Path:
+        directory = self._scope_dir(urlsplit(key).fragment).joinpath(*self._segments(key))
+        return directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _read(self, path: pathlib.Path) -> Optional[dict]:
+        try:
+            with path.open(encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._read(self._path(key))
+        if entry is None or entry["key"] != key:
+            return None
+        return CachedResponse(
+            entry["url"],
+            entry["status_code"],
+            entry["headers"],
+            base64.b64decode(entry["content"]),
+            entry["stored_at"],
+        )
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        entry = {
+            "key": key,
+            "url": response.url,
+            "status_code": response.status_code,
+            "headers": response.headers,
+            "content": base64.b64encode(response.content).decode("ascii"),
+            "stored_at": response.stored_at,
+        }
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except FileNotFoundError:
+            pass
+
+    def keys(self) -> List[str]:
+        keys = []
+        for path in self.directory.rglob("*.json"):
+            entry = self._read(path)
+            if entry is not None:
+                keys.append(entry["key"])
+        return keys
+
+    def clear(self, scope: Optional[str] = None) -> None:
+        directories = [self._scope_dir(scope)] if scope is not None else list(self.directory.iterdir())
+        for directory in directories:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def invalidate(self, url: str) -> None:
+        segments = self._segments(url)
+        for scope_dir in self.directory.iterdir():
+            if not scope_dir.is_dir():
+                continue
+            # the entries of the resource and under it are in its directory tree, the entries
+            # of its parents directly in the directories above.
+            target = scope_dir.joinpath(*segments)
+            paths = list(target.rglob("*.json")) if target.is_dir() else []
+            for depth in range(len(segments)):
+                paths.extend(scope_dir.joinpath(*segments[:depth]).glob("*.json"))
+            for path in paths:
+                path.unlink(missing_ok=True)
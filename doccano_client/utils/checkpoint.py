@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import threading
+from typing import List, Set
+
+
+class Checkpoint:
+    """The ids of the items a run has processed, journaled to a file to resume the run
+
+    The ids are buffered and appended to the file every flush_every ids with a single write
+    followed by fsync, so a flush costs the same whatever the size of the run. A process
+    killed during a write leaves at most a torn last line, which is ignored when the
+    checkpoint is loaded and cut off: the ids flushed before are never lost.
+    """
+
+    def __init__(self, path: str | pathlib.Path, flush_every: int = 100, resume: bool = True):
+        """Initialize the checkpoint, creating its directory if needed
+
+        Args:
+            path (str | pathlib.Path): The file of the checkpoint
+            flush_every (int): The number of ids buffered before they are written. Defaults to 100.
+            resume (bool): Whether to load the ids of a previous run. Otherwise the file is
+                emptied. Defaults to True.
+
+        Raises:
+            ValueError: If flush_every is less than 1
+        """
+        if flush_every < 1:
+            raise ValueError("flush_every must be greater than 0")
+        self.path = pathlib.Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self._done: Set[int] = self._load() if resume else set()
+        self._pending: List[int] = []
+        self._lock = threading.Lock()
+        if not resume or not self.path.exists():
+            self.path.write_bytes(b"")
+
+    def __enter__(self) -> Checkpoint:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def _load(self) -> Set[int]:
+        try:
+            content = self.path.read_bytes()
+        except FileNotFoundError:
+            return set()
+        # everything after the last newline is a torn write, cut off before appending to the file.
+        end = content.rfind(b"\n") + 1
+        if end < len(content):
+            os.truncate(self.path, end)
+        return {int(line) for line in content[:end].split()}
+
+    def add(self, item_id: int) -> None:
+        """Record a processed item, writing the buffered ids when flush_every are pending
+
+        Args:
+            item_id (int): The id of the item
+        """
+        with self._lock:
+            if item_id in self._done:
+                return
+            self._done.add(item_id)
+            self._pending.append(item_id)
+            if len(self._pending) >= self.flush_every:
+                self._flush()
+
+    def flush(self) -> None:
+        """Write the buffered ids to the file"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        data = b"".join(b"%d\n" % item_id for item_id in self._pending)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        self._pending.clear()
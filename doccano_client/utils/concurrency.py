@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    TypeVar,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_map(func: Callable[[T], R], items: Iterable[T], max_workers: int) -> Iterator[R]:
+    """Apply a function to the items on a thread pool and yield the results in input order
+
+    At most ``max_workers`` calls are in flight at any time, so a slow consumer
+    applies backpressure instead of buffering every result in memory.
+
+    Args:
+        func (Callable[[T], R]): The function to apply
+        items (Iterable[T]): The items to apply the function to
+        max_workers (int): The maximum number of concurrent calls
+
+    Yields:
+        R: The result of the function for the next item
+
+    Raises:
+        ValueError: if max_workers is less than 1.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque[Future] = deque()
+        try:
+            for item in items:
+                if len(pending) >= max_workers:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(func, item))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def async_ordered_map(
+    func: Callable[[T], Awaitable[R]], items: Iterable[T], max_workers: int
+) -> AsyncIterator[R]:
+    """Await a coroutine function on the items concurrently and yield the results in input order
+
+    This is the asyncio counterpart of ``ordered_map``: at most ``max_workers`` calls
+    are in flight at any time.
+
+    Args:
+        func (Callable[[T], Awaitable[R]]): The coroutine function to apply
+        items (Iterable[T]): The items to apply the function to
+        max_workers (int): The maximum number of concurrent calls
+
+    Yields:
+        R: The result of the function for the next item
+
+    Raises:
+        ValueError: if max_workers is less than 1.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0")
+    pending: Deque[asyncio.Task] = deque()
+    try:
+        for item in items:
+            if len(pending) >= max_workers:
+                yield await pending.popleft()
+            pending.append(asyncio.ensure_future(func(item)))
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import collections
+import math
+import re
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+ID_SEGMENT = re.compile(r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$")
+
+
+def resource_template(resource: str) -> str:
+    """Replace the ids in a resource by a placeholder, e.g. ``projects/{id}/examples``
+
+    Args:
+        resource (str): The resource relative to the API url, possibly with a query string
+
+    Returns:
+        str: The template of the resource, without query string
+    """
+    path = resource.split("?", 1)[0].strip("/")
+    return "/".join("{id}" if ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+class RequestEvent:
+    """A request made through the repository, passed to every hook"""
+
+    def __init__(self, method: str, resource: str):
+        """Initialize the event when the request starts
+
+        Args:
+            method (str): The HTTP method
+            resource (str): The resource relative to the API url
+        """
+        self.method = method.upper()
+        self.resource = resource
+        self.template = resource_template(resource)
+        self.started_at = time.perf_counter()
+        self.elapsed: Optional[float] = None
+        self.status: Optional[int] = None
+        self.bytes = 0
+        self.error: Optional[BaseException] = None
+        self.context: Dict[str, Any] = {}
+
+    def finish(self, status: Optional[int] = None, bytes: int = 0, error: Optional[BaseException] = None) -> None:
+        """Record the outcome of the request
+
+        Args:
+            status (int, optional): The status code, if a response was received
+            bytes (int): The size of the response body. Defaults to 0.
+            error (BaseException, optional): The raised exception, if any
+        """
+        self.elapsed = time.perf_counter() - self.started_at
+        self.status = status
+        self.bytes = bytes
+        self.error = error
+
+
+class RequestHook:
+    """Base class of request hooks. Override the methods of interest."""
+
+    def before_request(self, event: RequestEvent) -> None:
+        """Called before the request is sent
+
+        Args:
+            event (RequestEvent): The request
+        """
+
+    def after_response(self, event: RequestEvent) -> None:
+        """Called after a successful response
+
+        Args:
+            event (RequestEvent): The finished request
+        """
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when the request failed or was answered with an error status
+
+        Args:
+            event (RequestEvent): The finished request, whose error is set
+        """
+
+
+class EndpointStats(BaseModel):
+    method: str
+    template: str
+    count: int
+    errors: int
+    error_rate: float
+    bytes: int
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Return the nearest-rank percentile of sorted values
+
+    Args:
+        sorted_values (List[float]): The values in ascending order
+        q (float): The percentile between 0 and 100
+
+    Returns:
+        float: The percentile, or 0.0 if there are no values
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class _Endpoint:
+    def __init__(self, max_samples: int):
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+        self.first_started: Optional[float] = None
+        self.last_finished: Optional[float] = None
+        self.latencies: Deque[float] = collections.deque(maxlen=max_samples)
+
+
+class StatsCollector(RequestHook):
+    """Hook aggregating latency percentiles, throughput and error rates per endpoint template"""
+
+    def __init__(self, max_samples: int = 10000):
+        """Initialize the collector
+
+        Args:
+            max_samples (int): The number of latest latencies kept per endpoint for the percentiles.
+                Defaults to 10000.
+        """
+        self.max_samples = max_samples
+        self._endpoints: Dict[Tuple[str, str], _Endpoint] = {}
+        self._lock = threading.Lock()
+
+    def after_response(self, event: RequestEvent) -> None:
+        self._record(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        self._record(event)
+
+    def _record(self, event: RequestEvent) -> None:
+        elapsed = event.elapsed or 0.0
+        with self._lock:
+            endpoint = self._endpoints.get((event.method, event.template))
+            if endpoint is None:
+                endpoint = self._endpoints[event.method, event.template] = _Endpoint(self.max_samples)
+            endpoint.count += 1
+            endpoint.errors += event.error is not None
+            endpoint.bytes += event.bytes
+            endpoint.latencies.append(elapsed)
+            if endpoint.first_started is None:
+                endpoint.first_started = event.started_at
+            endpoint.last_finished = event.started_at + elapsed
+
+    def reset(self) -> None:
+        """Forget all recorded requests"""
+        with self._lock:
+            self._endpoints.clear()
+
+    def stats(self) -> List[EndpointStats]:
+        """Return the statistics of every endpoint, the most requested first
+
+        Latencies are in seconds, throughput in requests per second between the start
+        of the first request and the end of the last one.
+
+        Returns:
+            List[EndpointStats]: The statistics
+        """
+        with self._lock:
+            endpoints = [(key, endpoint, sorted(endpoint.latencies)) for key, endpoint in self._endpoints.items()]
+        results = []
+        for (method, template), endpoint, latencies in endpoints:
+            duration = (endpoint.last_finished or 0.0) - (endpoint.first_started or 0.0)
+            results.append(
+                EndpointStats(
+                    method=method,
+                    template=template,
+                    count=endpoint.count,
+                    errors=endpoint.errors,
+                    error_rate=endpoint.errors / endpoint.count,
+                    bytes=endpoint.bytes,
+                    throughput=endpoint.count / duration if duration > 0 else 0.0,
+                    p50=percentile(latencies, 50),
+                    p95=percentile(latencies, 95),
+                    p99=percentile(latencies, 99),
+                )
+            )
+        return sorted(results, key=lambda stats: stats.count, reverse=True)
+
+    def report(self) -> str:
+        """Format the statistics as a table with latencies in milliseconds
+
+        Returns:
+            str: The table
+        """
+        lines = [
+            f"{'method':<7} {'endpoint':<48} {'count':>7} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'req/s':>8}"
+        ]
+        for stats in self.stats():
+            lines.append(
+                f"{stats.method:<7} {stats.template:<48} {stats.count:>7} {stats.error_rate * 100:>6.1f} "
+                f"{stats.p50 * 1000:>8.1f} {stats.p95 * 1000:>8.1f} {stats.p99 * 1000:>8.1f} {stats.throughput:>8.1f}"
+            )
+        return "\n".join(lines)
+
+
+class OpenTelemetryHook(RequestHook):
+    """Hook recording a client span and a duration histogram per request with OpenTelemetry
+
+    The opentelemetry-api package must be installed. Without a configured SDK, the
+    spans and the measurements are dropped.
+    """
+
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None):
+        """Initialize the hook
+
+        Args:
+            tracer_provider (Any, optional): The tracer provider. Defaults to None, which uses the global one.
+            meter_provider (Any, optional): The meter provider. Defaults to None, which uses the global one.
+        """
+        from opentelemetry import metrics, trace
+
+        self._trace = trace
+        self._tracer = trace.get_tracer("doccano_client", tracer_provider=tracer_provider)
+        meter = metrics.get_meter("doccano_client", meter_provider=meter_provider)
+        self._duration = meter.create_histogram(
+            "http.client.duration", unit="ms", description="Duration of the requests to doccano"
+        )
+
+    def before_request(self, event: RequestEvent) -> None:
+        event.context["otel_span"] = self._tracer.start_span(
+            f"{event.method} {event.template}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={"http.method": event.method, "http.route": event.template},
+        )
+
+    def after_response(self, event: RequestEvent) -> None:
+        self._end(event)
+
+    def on_error(self, event: RequestEvent) -> None:
+        span = event.context.get("otel_span")
+        if span is not None and event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        self._end(event)
+
+    def _end(self, event: RequestEvent) -> None:
+        attributes: Dict[str, Any] = {"http.method": event.method, "http.route": event.template}
+        if event.status is not None:
+            attributes["http.status_code"] = event.status
+        self._duration.record((event.elapsed or 0.0) * 1000, attributes=attributes)
+        span = event.context.pop("otel_span", None)
+        if span is not None:
+            span.set_attributes(attributes)
+            span.end()
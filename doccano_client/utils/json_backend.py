@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional
+
+
+class JSONBackend:
+    """JSON encoder and decoder used for request and response bodies"""
+
+    def __init__(self, name: str, dumps: Callable[[Any], bytes], loads: Callable[[bytes | str], Any]):
+        """Initialize the backend
+
+        Args:
+            name (str): The name of the backend
+            dumps (Callable[[Any], bytes]): The function encoding an object to UTF-8 JSON
+            loads (Callable[[bytes | str], Any]): The function decoding JSON
+        """
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JSONBackend({self.name!r})"
+
+
+def _stdlib_backend() -> JSONBackend:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    return JSONBackend("json", dumps, json.loads)
+
+
+def _orjson_backend() -> JSONBackend:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    return JSONBackend("orjson", dumps, orjson.loads)
+
+
+def _ujson_backend() -> JSONBackend:
+    import ujson
+
+    def dumps(obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    return JSONBackend("ujson", dumps, ujson.loads)
+
+
+BACKENDS = {"orjson": _orjson_backend, "ujson": _ujson_backend, "json": _stdlib_backend}
+
+
+def get_json_backend(name: Optional[str] = None) -> JSONBackend:
+    """Return a JSON backend by name, or the fastest one installed
+
+    Args:
+        name (str, optional): One of "orjson", "ujson" and "json". Defaults to None, which picks
+            orjson or ujson when installed and falls back to the standard library.
+
+    Returns:
+        JSONBackend: The backend
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the named backend is not installed
+    """
+    if name is not None:
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown JSON backend '{name}', choose one of {', '.join(BACKENDS)}")
+        return BACKENDS[name]()
+    for factory in BACKENDS.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return _stdlib_backend()
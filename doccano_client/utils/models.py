@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.utils import ROOT_KEY
+
+M = TypeVar("M", bound=BaseModel)
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def depends_on(*names: str) -> Callable[[F], F]:
+    """Declare the fields a root validator reads, so that a partial update can run it
+
+    Apply it below ``root_validator``.
+
+    Args:
+        names (str): The names of the fields
+
+    Returns:
+        Callable[[F], F]: The decorator recording the names on the validator
+    """
+
+    def decorator(func: F) -> F:
+        func.__depends_on__ = frozenset(names)  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+def construct(model: Type[M], data: Dict[str, Any]) -> M:
+    """Build a model from trusted data without validating it
+
+    Unlike ``BaseModel.construct``, keys that are not fields of the model are dropped,
+    so the model serializes back to the same payload as a validated one.
+
+    Args:
+        model (Type[M]): The model class
+        data (Dict[str, Any]): The data returned by the server
+
+    Returns:
+        M: The model
+    """
+    fields = model.__fields__
+    return model.construct(**{key: value for key, value in data.items() if key in fields})
+
+
+def model_parser(model: Type[M], trusted: bool = False) -> Callable[[Dict[str, Any]], M]:
+    """Return the function building a model from a server response
+
+    Args:
+        model (Type[M]): The model class
+        trusted (bool): Whether to skip validation. Defaults to False.
+
+    Returns:
+        Callable[[Dict[str, Any]], M]: ``model.parse_obj``, or ``construct`` for the model when trusted
+    """
+    if trusted:
+        return lambda data: construct(model, data)
+    return model.parse_obj
+
+
+def validate_fields(model: Type[M], fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate some fields of a model, e.g. for a partial update
+
+    Validators of single fields run. A root validator of the model runs only when it declares
+    the fields it reads with ``depends_on`` and they are all given.
+
+    Args:
+        model (Type[M]): The model class
+        fields (Dict[str, Any]): The values by field name
+
+    Returns:
+        Dict[str, Any]: The validated values
+
+    Raises:
+        ValidationError: If a value is invalid
+        KeyError: If a name is not a field of the model
+    """
+    values = {}
+    errors = []
+    for name, value in fields.items():
+        values[name], error = model.__fields__[name].validate(value, {}, loc=name, cls=model)
+        if error:
+            errors.append(error)
+    if errors:
+        raise ValidationError(errors, model)
+    for _, root_validator in model.__post_root_validators__:
+        names = getattr(root_validator, "__depends_on__", None)
+        if not names or not names <= values.keys():
+            continue
+        try:
+            values = root_validator(model, values)
+        except (ValueError, TypeError, AssertionError) as err:
+            raise ValidationError([ErrorWrapper(err, loc=ROOT_KEY)], model)
+    return values
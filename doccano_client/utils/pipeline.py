@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+_END = object()
+
+
+class StageStats(BaseModel):
+    name: str
+    workers: int
+    processed: int
+    busy: float
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """The number of items processed per second of wall time"""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """The share of the wall time the workers of the stage spent processing"""
+        return self.busy / (self.elapsed * self.workers) if self.elapsed > 0 else 0.0
+
+
+class Stage:
+    """A step of a pipeline
+
+    A stage either maps each item to one output on ``workers`` threads, or, when ``stream``
+    is set, receives an iterator over all its input items on a single thread and yields its
+    outputs, e.g. to batch them. An output of None is dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Any], Any],
+        workers: int = 1,
+        stream: bool = False,
+        on_stop: Optional[Callable[[], None]] = None,
+    ):
+        """Initialize the stage
+
+        Args:
+            name (str): The name shown in the statistics
+            func (Callable[[Any], Any]): The function applied to each item, or to the iterator
+                of the items for a stream stage
+            workers (int): The number of threads applying the function. Defaults to 1.
+            stream (bool): Whether the function consumes an iterator. Defaults to False.
+            on_stop (Callable[[], None], optional): Called when the pipeline stops on an error,
+                e.g. to wake up workers waiting for a later stage. Defaults to None.
+
+        Raises:
+            ValueError: If workers is less than 1, or greater than 1 for a stream stage
+        """
+        if workers < 1:
+            raise ValueError("workers must be greater than 0")
+        if stream and workers != 1:
+            raise ValueError("A stream stage runs on a single worker")
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.stream = stream
+        self.on_stop = on_stop
+        self.processed = 0
+        self.busy = 0.0
+        self._lock = threading.Lock()
+
+    def _count(self, busy: float) -> None:
+        with self._lock:
+            self.processed += 1
+            self.busy += busy
+
+
+class Pipeline:
+    """Run a source and stages concurrently, connected by bounded queues
+
+    Each stage runs on its own threads, so fetching, predicting and posting overlap. A full
+    queue blocks the stage feeding it, which bounds memory when a later stage is slower. The
+    first exception stops every stage and is raised by run.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: int = 64):
+        """Initialize the pipeline
+
+        Args:
+            stages (List[Stage]): The stages, in order
+            queue_size (int): The maximum number of items waiting between two stages. Defaults to 64.
+        """
+        self.source = Stage("fetch", lambda item: item)
+        self.stages = stages
+        self.queue_size = queue_size
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    def stats(self) -> List[StageStats]:
+        """Return the counters of the source and of every stage, also while running
+
+        Returns:
+            List[StageStats]: The statistics, in pipeline order
+        """
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished_at or time.perf_counter()) - self._started_at
+        return [
+            StageStats(
+                name=stage.name, workers=stage.workers, processed=stage.processed, busy=stage.busy, elapsed=elapsed
+            )
+            for stage in [self.source, *self.stages]
+        ]
+
+    def report(self) -> str:
+        """Format the statistics as one line per stage
+
+        Returns:
+            str: The report
+        """
+        return "\n".join(
+            f"{stats.name}: {stats.processed} items, {stats.throughput:.1f}/s, {stats.utilization:.0%} busy"
+            for stats in self.stats()
+        )
+
+    def run(self, items: Iterable[Any]) -> List[StageStats]:
+        """Feed the items through the stages and wait until all are processed
+
+        Args:
+            items (Iterable[Any]): The items fed to the first stage, produced on a thread of their own
+
+        Returns:
+            List[StageStats]: The final statistics
+
+        Raises:
+            BaseException: The first exception raised by the source or a stage
+        """
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+        self._queues: List[queue.Queue] = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        self._done = [0] * len(self.stages)
+        self._done_lock = threading.Lock()
+        self._fail_lock = threading.Lock()
+        self._started_at = time.perf_counter()
+        self._finished_at = None
+
+        threads = [threading.Thread(target=self._produce, args=(items,), daemon=True)]
+        for index, stage in enumerate(self.stages):
+            threads.extend(
+                threading.Thread(target=self._work, args=(index,), daemon=True) for _ in range(stage.workers)
+            )
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self._finished_at = time.perf_counter()
+        if self._errors:
+            raise self._errors[0]
+        return self.stats()
+
+    def _put(self, index: int, item: Any) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queues[index].put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _receive(self, index: int) -> Iterator[Any]:
+        while not self._stop.is_set():
+            try:
+                item = self._queues[index].get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _END:
+                return
+            yield item
+
+    def _emit(self, index: int, output: Any) -> None:
+        if output is not None and index + 1 < len(self.stages):
+            self._put(index + 1, output)
+
+    def _fail(self, err: BaseException) -> None:
+        with self._fail_lock:
+            self._errors.append(err)
+            if self._stop.is_set():
+                return
+            self._stop.set()
+        for stage in self.stages:
+            if stage.on_stop is not None:
+                stage.on_stop()
+
+    def _close(self, index: int) -> None:
+        """Tell every worker of a stage that no more items come"""
+        if index < len(self.stages):
+            for _ in range(self.stages[index].workers):
+                self._put(index, _END)
+
+    def _produce(self, items: Iterable[Any]) -> None:
+        try:
+            iterator = iter(items)
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                item = next(iterator, _END)
+                if item is _END:
+                    break
+                self.source._count(time.perf_counter() - started)
+                self._emit(-1, item)
+        except BaseException as err:
+            self._fail(err)
+        finally:
+            self._close(0)
+
+    def _work(self, index: int) -> None:
+        stage = self.stages[index]
+        try:
+            if stage.stream:
+                for output in stage.func(_counted(self._receive(index), stage)):
+                    self._emit(index, output)
+                    if self._stop.is_set():
+                        break
+            else:
+                for item in self._receive(index):
+                    started = time.perf_counter()
+                    output = stage.func(item)
+                    stage._count(time.perf_counter() - started)
+                    self._emit(index, output)
+        except BaseException as err:
+            self._fail(err)
+        finally:
+            with self._done_lock:
+                self._done[index] += 1
+                last = self._done[index] == stage.workers
+            if last:
+                self._close(index + 1)
+
+
+def _counted(items: Iterator[Any], stage: Stage) -> Iterator[Any]:
+    """Count the items a stream stage consumes, attributing the time between them to the stage
+
+    Args:
+        items (Iterator[Any]): The input items of the stage
+        stage (Stage): The stage
+
+    Yields:
+        Any: The next item
+    """
+    resumed = time.perf_counter()
+    for item in items:
+        stage._count(time.perf_counter() - resumed)
+        yield item
+        resumed = time.perf_counter()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import email.utils
+import random
+import time
+from typing import Iterable, Mapping, Optional, Protocol
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class Response(Protocol):
+    """The parts of a response the policy reads, provided by both requests and httpx"""
+
+    @property
+    def status_code(self) -> int:
+        ...
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        ...
+
+
+class RetryPolicy:
+    """Policy deciding whether and when a failed request is sent again"""
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        statuses: Iterable[int] = (429, 502, 503),
+        methods: Iterable[str] = IDEMPOTENT_METHODS,
+        backoff: float = 0.5,
+        backoff_factor: float = 2.0,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+    ):
+        """Initialize the policy
+
+        Args:
+            max_attempts (int): The maximum number of attempts, including the first one. 1 disables
+                retries. Defaults to 3.
+            statuses (Iterable[int]): The response statuses to retry. Defaults to 429, 502 and 503.
+            methods (Iterable[str]): The HTTP methods to retry. Defaults to the idempotent methods.
+                Add POST only if the server is known not to have processed rejected requests.
+            backoff (float): The delay in seconds before the first retry. Defaults to 0.5.
+            backoff_factor (float): The factor applied to the delay after each retry. Defaults to 2.
+            max_backoff (float): The maximum delay in seconds. Defaults to 30.
+            jitter (bool): Whether to draw each delay uniformly between 0 and its nominal value
+                so that concurrent clients do not retry in lockstep. Defaults to True.
+            respect_retry_after (bool): Whether to wait as long as the Retry-After header asks,
+                up to max_backoff. Defaults to True.
+        """
+        self.max_attempts = max_attempts
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.backoff = backoff
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+
+    def should_retry(self, method: str, response: Response, attempt: int) -> bool:
+        """Return whether the request should be sent again
+
+        Args:
+            method (str): The HTTP method of the request
+            response (Response): The response of the attempt
+            attempt (int): The number of attempts made so far
+
+        Returns:
+            bool: True if the request should be retried.
+        """
+        return attempt < self.max_attempts and method.upper() in self.methods and response.status_code in self.statuses
+
+    def delay(self, response: Response, attempt: int) -> float:
+        """Return the number of seconds to wait before the next attempt
+
+        Args:
+            response (Response): The response of the attempt
+            attempt (int): The number of attempts made so far
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        delay = min(self.backoff * self.backoff_factor ** (attempt - 1), self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date
+
+    Args:
+        value (str, optional): The value of the header
+
+    Returns:
+        Optional[float]: The number of seconds to wait, or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(date.timestamp() - time.time(), 0.0)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import Iterable, Iterator, Tuple
+
+LOCAL_FILE_HEADER = b"PK\x03\x04"
+DATA_DESCRIPTOR = b"PK\x07\x08"
+CENTRAL_DIRECTORY = b"PK\x01\x02"
+STORED = 0
+DEFLATED = 8
+
+
+class ByteStream:
+    """Buffered reader over an iterator of byte chunks"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+
+    def _fill(self, size: int) -> None:
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer.extend(chunk)
+
+    def read(self, size: int) -> bytes:
+        """Read exactly size bytes, or fewer if the stream ends
+
+        Args:
+            size (int): The number of bytes to read
+
+        Returns:
+            bytes: The bytes read.
+        """
+        self._fill(size)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def read_some(self, size: int) -> bytes:
+        """Read at most size bytes, fetching a new chunk only if the buffer is empty
+
+        Args:
+            size (int): The maximum number of bytes to read
+
+        Returns:
+            bytes: The bytes read, empty at the end of the stream.
+        """
+        self._fill(1)
+        return self.read(min(size, len(self._buffer)))
+
+    def unread(self, data: bytes) -> None:
+        """Push bytes back to the front of the stream
+
+        Args:
+            data (bytes): The bytes to push back
+        """
+        self._buffer[:0] = data
+
+
+def iter_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Split a stream of byte chunks into lines
+
+    Args:
+        chunks (Iterable[bytes]): The chunks of the stream
+
+    Yields:
+        bytes: The next non-empty line, without its line ending.
+    """
+    pending = b""
+    for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield line.rstrip(b"\r")
+    if pending.strip():
+        yield pending.rstrip(b"\r")
+
+
+def _iter_stored(stream: ByteStream, size: int, chunk_size: int) -> Iterator[bytes]:
+    while size > 0:
+        data = stream.read_some(min(size, chunk_size))
+        if not data:
+            raise ValueError("Truncated zip entry")
+        size -= len(data)
+        yield data
+
+
+def _iter_deflated(stream: ByteStream, chunk_size: int) -> Iterator[bytes]:
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    while not decompressor.eof:
+        data = decompressor.unconsumed_tail or stream.read_some(chunk_size)
+        if not data:
+            raise ValueError("Truncated zip entry")
+        output = decompressor.decompress(data, chunk_size)
+        if output:
+            yield output
+    stream.unread(decompressor.unused_data)
+
+
+def _zip64_compressed_size(extra: bytes) -> int:
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, size = struct.unpack("<HH", extra[offset : offset + 4])
+        if header_id == 0x0001:
+            return struct.unpack("<Q", extra[offset + 12 : offset + 20])[0]
+        offset += 4 + size
+    raise ValueError("Missing zip64 extra field")
+
+
+def iter_zip_entries(chunks: Iterable[bytes], chunk_size: int = 65536) -> Iterator[Tuple[str, Iterator[bytes]]]:
+    """Unpack a zip archive from a stream without seeking
+
+    The local file headers are read in order, so entries are available while the
+    archive is still being received. Each entry must be consumed, or is skipped,
+    before the next one is produced. Only stored and deflated entries are supported.
+
+    Args:
+        chunks (Iterable[bytes]): The chunks of the archive
+        chunk_size (int): The maximum size of the decompressed chunks. Defaults to 65536.
+
+    Yields:
+        Tuple[str, Iterator[bytes]]: The name of the next entry and the chunks of its content.
+
+    Raises:
+        ValueError: If the archive is truncated or uses an unsupported compression method.
+    """
+    stream = ByteStream(chunks)
+    while stream.read(4) == LOCAL_FILE_HEADER:
+        header = stream.read(26)
+        if len(header) < 26:
+            raise ValueError("Truncated zip header")
+        _, flags, method, _, _, _, compressed_size, _, name_length, extra_length = struct.unpack("<HHHHHIIIHH", header)
+        name = stream.read(name_length).decode("utf-8" if flags & 0x800 else "cp437")
+        extra = stream.read(extra_length)
+        has_descriptor = bool(flags & 0x08)
+        if method == DEFLATED:
+            content = _iter_deflated(stream, chunk_size)
+        elif method == STORED and not has_descriptor:
+            if compressed_size == 0xFFFFFFFF:
+                compressed_size = _zip64_compressed_size(extra)
+            content = _iter_stored(stream, compressed_size, chunk_size)
+        else:
+            raise ValueError(f"Unsupported zip entry {name}")
+
+        yield name, content
+        for _ in content:
+            pass
+
+        if has_descriptor:
+            # crc and sizes, optionally preceded by a signature, with 8-byte sizes for zip64.
+            signature = stream.read(4)
+            if signature != DATA_DESCRIPTOR:
+                stream.unread(signature)
+            stream.read(12)
+            following = stream.read(4)
+            if following in (LOCAL_FILE_HEADER, CENTRAL_DIRECTORY, b""):
+                stream.unread(following)
+            else:
+                stream.read(4)
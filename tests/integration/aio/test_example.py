@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+import vcr
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+from doccano_client.aio.repositories.example import ExampleRepository
+from doccano_client.models.example import Example
+from tests.conftest import repository_fixtures
+
+
+@pytest.fixture
+def example():
+    return Example(text="Test Example")
+
+
+class TestExampleRepository:
+    @classmethod
+    def setup_method(cls):
+        cls.base = AsyncBaseRepository("http://localhost:8000")
+        with vcr.use_cassette(str(repository_fixtures / "example/login.yaml"), mode="once"):
+            asyncio.run(cls.base.login(username="admin", password="password"))
+        cls.client = ExampleRepository(cls.base)
+        cls.project_id = 16
+
+    def test_create(self, example):
+        with vcr.use_cassette(str(repository_fixtures / "example/create.yaml"), mode="once"):
+            response = asyncio.run(self.client.create(self.project_id, example))
+        assert response.text == example.text
+
+    def test_update(self, example):
+        async def create_and_update():
+            with vcr.use_cassette(str(repository_fixtures / "example/create.yaml"), mode="once"):
+                created = await self.client.create(self.project_id, example)
+            with vcr.use_cassette(str(repository_fixtures / "example/update.yaml"), mode="once"):
+                created.text = "Updated Example"
+                updated = await self.client.update(self.project_id, created)
+            return created, updated
+
+        created, updated = asyncio.run(create_and_update())
+        assert updated.text == "Updated Example"
+        assert updated.id == created.id
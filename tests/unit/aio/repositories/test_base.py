@@ -0,0 +1,68 @@
+import asyncio
+import json
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from doccano_client.aio.repositories.base import AsyncBaseRepository
+
+
+def paged_handler(total: int, default_limit: int, next_host: str = "", requests: list = None):
+    def handler(request):
+        if requests is not None:
+            requests.append(request)
+        query = parse_qs(urlparse(str(request.url)).query)
+        limit = int(query.get("limit", [default_limit])[0])
+        offset = int(query.get("offset", [0])[0])
+        url = str(request.url).split("?")[0]
+        if next_host:
+            url = url.replace("http://localhost:8000", next_host)
+        end = min(offset + limit, total)
+        body = {
+            "count": total,
+            "next": f"{url}?limit={limit}&offset={end}" if end < total else None,
+            "previous": None,
+            "results": [{"id": i} for i in range(offset, end)],
+        }
+        return httpx.Response(200, content=json.dumps(body))
+
+    return handler
+
+
+def paginate(handler, **kwargs):
+    async def run():
+        client = AsyncBaseRepository("http://localhost:8000")
+        client._session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return [item async for item in client.paginate("projects/1/examples", **kwargs)]
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_paginate(max_workers):
+    requests = []
+    items = paginate(paged_handler(total=23, default_limit=5, requests=requests), max_workers=max_workers)
+    assert [item["id"] for item in items] == list(range(23))
+    assert len(requests) == 5
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_paginate_with_page_size(max_workers):
+    requests = []
+    handler = paged_handler(total=23, default_limit=5, requests=requests)
+    items = paginate(handler, max_workers=max_workers, page_size=10)
+    assert [item["id"] for item in items] == list(range(23))
+    assert len(requests) == 3
+    assert "limit=10" in str(requests[0].url)
+
+
+def test_paginate_follows_next_url_on_the_base_url():
+    requests = []
+    handler = paged_handler(total=12, default_limit=5, next_host="http://backend:3000", requests=requests)
+    items = paginate(handler, page_size=5)
+    assert len(items) == 12
+    assert all(request.url.host == "localhost" for request in requests)
@@ -0,0 +1,25 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from doccano_client.aio.repositories.task_status import TaskStatusRepository
+from doccano_client.models.task_status import TaskStatus
+
+
+class TestTaskStatusRepository:
+    def setup_method(self):
+        self.repository = TaskStatusRepository(MagicMock())
+        self.repository.get = AsyncMock()
+
+    def test_wait_all(self):
+        ready = {"a": iter([False, True]), "b": iter([True])}
+        self.repository.get.side_effect = lambda task_id: TaskStatus(ready=next(ready[task_id]), result=task_id)
+        statuses = asyncio.run(self.repository.wait_all(["a", "b"], interval=0.01))
+        assert [status.result for status in statuses] == ["a", "b"]
+        assert self.repository.get.await_count == 3
+
+    def test_wait_times_out(self):
+        self.repository.get.return_value = TaskStatus(ready=False)
+        with pytest.raises(TimeoutError):
+            asyncio.run(self.repository.wait("task", timeout=0.05, interval=0.01))
@@ -0,0 +1,73 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from doccano_client.aio.usecase.data_upload import DataUploadUseCase
+from doccano_client.exceptions import DoccanoAPIError
+
+
+class TestDataUploadUseCase:
+    @classmethod
+    def setup_method(cls):
+        cls.data_upload_repository = AsyncMock()
+        cls.task_status_repository = AsyncMock()
+        cls.usecase = DataUploadUseCase(cls.data_upload_repository, cls.task_status_repository)
+
+    def test_upload(self):
+        project_id = 0
+        self.data_upload_repository.upload.side_effect = lambda file_path: f"upload_{file_path}"
+        self.data_upload_repository.ingest.return_value = "task_id"
+        asyncio.run(
+            self.usecase.upload(
+                project_id,
+                file_paths=["a.txt", "b.txt"],
+                task="DocumentClassification",
+                format="JSONL",
+            )
+        )
+        self.data_upload_repository.ingest.assert_awaited_once_with(
+            project_id,
+            ["upload_a.txt", "upload_b.txt"],
+            "DocumentClassification",
+            "JSONL",
+            column_data="text",
+            column_label="label",
+        )
+        self.task_status_repository.wait.assert_awaited_once_with("task_id")
+
+    def test_upload_reverts_on_failure(self):
+        async def upload(file_path):
+            if file_path == "bad.txt":
+                raise DoccanoAPIError("400 Client Error", MagicMock(text="bad file"))
+            return f"upload_{file_path}"
+
+        self.data_upload_repository.upload.side_effect = upload
+        with pytest.raises(DoccanoAPIError):
+            asyncio.run(self.usecase.upload(0, ["a.txt", "bad.txt"], "DocumentClassification", "JSONL"))
+        self.data_upload_repository.delete.assert_awaited_once_with("upload_a.txt")
+        self.data_upload_repository.ingest.assert_not_awaited()
+
+    def test_upload_bounds_concurrent_uploads(self):
+        in_flight = []
+        peak = []
+
+        async def upload(file_path):
+            in_flight.append(file_path)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(file_path)
+            return f"upload_{file_path}"
+
+        self.data_upload_repository.upload.side_effect = upload
+        file_paths = [f"{i}.txt" for i in range(6)]
+        asyncio.run(self.usecase.upload(0, file_paths, "DocumentClassification", "JSONL", max_workers=2))
+        assert max(peak) == 2
+        upload_ids = self.data_upload_repository.ingest.await_args.args[1]
+        assert upload_ids == [f"upload_{path}" for path in file_paths]
+
+    def test_upload_reports_progress(self):
+        self.data_upload_repository.upload.side_effect = lambda file_path: f"upload_{file_path}"
+        progress = MagicMock()
+        asyncio.run(self.usecase.upload(0, ["a.txt", "b.txt"], "DocumentClassification", "JSONL", progress=progress))
+        assert [call.args[1:] for call in progress.call_args_list] == [(1, 2), (2, 2)]
@@ -0,0 +1,53 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from doccano_client.aio.usecase.example import ExampleUseCase
+from doccano_client.models.example import Example
+
+
+@pytest.fixture
+def payload():
+    return {
+        "text": "Test",
+    }
+
+
+class TestExampleUseCase:
+    @classmethod
+    def setup_method(cls):
+        cls.repository = AsyncMock()
+        cls.usecase = ExampleUseCase(cls.repository)
+
+    def test_find_by_id(self):
+        asyncio.run(self.usecase.find_by_id(0, 1))
+        self.repository.find_by_id.assert_awaited_once_with(0, 1)
+
+    def test_list(self):
+        async def list_examples():
+            return [example async for example in self.usecase.list(0)]
+
+        example = Example(id=1, text="Test")
+
+        async def iterate(*args):
+            yield example
+
+        self.repository.list = MagicMock(side_effect=iterate)
+        assert asyncio.run(list_examples()) == [example]
+        self.repository.list.assert_called_once_with(0, None, 1, None)
+
+    def test_create(self, payload):
+        project_id = 0
+        asyncio.run(self.usecase.create(project_id, **payload))
+        self.repository.create.assert_awaited_once_with(project_id, Example.parse_obj(payload))
+
+    def test_update(self, payload):
+        project_id = 0
+        asyncio.run(self.usecase.update(project_id, 1, **payload))
+        self.repository.find_by_id.assert_not_awaited()
+        self.repository.partial_update.assert_awaited_once_with(project_id, 1, payload)
+
+    def test_delete(self):
+        asyncio.run(self.usecase.delete(0, 1))
+        self.repository.delete.assert_awaited_once_with(0, 1)
@@ -0,0 +1,71 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from doccano_client.aio.usecase.label import CategoryUseCase, LabelUseCase
+from doccano_client.models.label import Category, Label
+
+
+class TestLabelUseCase:
+    @classmethod
+    def setup_method(cls):
+        cls.label_repository = AsyncMock()
+        cls.label_type_repository = AsyncMock()
+        cls.usecase = LabelUseCase(cls.label_repository, cls.label_type_repository)
+
+    def test_find_by_id(self):
+        asyncio.run(self.usecase.find_by_id(0, 1, 2))
+        self.label_repository.find_by_id.assert_awaited_once_with(0, 1, 2)
+
+    def test_list(self):
+        asyncio.run(self.usecase.list(0, 1))
+        self.label_repository.list.assert_awaited_once_with(0, 1)
+
+    def test_delete(self):
+        asyncio.run(self.usecase.delete(0, 1, 2))
+        self.label_repository.find_by_id.assert_not_awaited()
+        self.label_repository.delete_by_id.assert_awaited_once_with(0, 1, 2)
+
+    def test_delete_all(self):
+        asyncio.run(self.usecase.delete_all(0, 1))
+        self.label_repository.delete_all.assert_awaited_once_with(0, 1)
+
+    def test_bulk_create(self):
+        async def bulk_create():
+            return [result async for result in self.usecase.bulk_create(0, labels, 4)]
+
+        async def iterate(*args):
+            for label in labels:
+                yield label
+
+        labels = [Label(example=1), Label(example=2)]
+        self.label_repository.bulk_create = MagicMock(side_effect=iterate)
+        assert asyncio.run(bulk_create()) == labels
+        self.label_repository.bulk_create.assert_called_once_with(0, labels, 4)
+
+
+class TestCategoryUseCase:
+    @classmethod
+    def setup_method(cls):
+        cls.label_repository = AsyncMock()
+        cls.label_type_repository = AsyncMock()
+        cls.usecase = CategoryUseCase(cls.label_repository, cls.label_type_repository)
+        cls.name = "Test"
+        cls.project_id = 0
+        cls.example_id = 1
+        cls.label_type_id = 2
+        cls.label_id = 3
+        cls.category = Category(label=cls.label_type_id, example=cls.example_id)
+        cls.label_type_repository.find_by_name.return_value = MagicMock(id=cls.label_type_id)
+
+    def test_create(self):
+        asyncio.run(self.usecase.create(self.project_id, self.example_id, self.name))
+        self.label_type_repository.find_by_name.assert_awaited_once_with(self.project_id, self.name)
+        self.label_repository.create.assert_awaited_once_with(self.project_id, self.category)
+
+    def test_update(self):
+        asyncio.run(self.usecase.update(self.project_id, self.example_id, self.label_id, self.name))
+        self.label_type_repository.find_by_name.assert_awaited_once_with(self.project_id, self.name)
+        self.label_repository.find_by_id.assert_not_awaited()
+        self.label_repository.partial_update.assert_awaited_once_with(
+            self.project_id, self.example_id, self.label_id, {"label": self.label_type_id}
+        )
@@ -0,0 +1,33 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from doccano_client.models.example import Example
+from doccano_client.models.label import Span
+
+pytest.importorskip("spacy")
+pytest.importorskip("flair")
+pytest.importorskip("sklearn")
+
+from doccano_client.cli.active_learning import preparation  # noqa: E402
+
+
+def test_prepare_datasets_on_empty_doccano_home(tmp_path, monkeypatch):
+    home = tmp_path / "doccano"
+    monkeypatch.setattr(preparation, "DOCCANO_HOME", home)
+    examples = [Example(id=i, text="Alice lives in Paris", is_confirmed=i <= 5) for i in range(1, 8)]
+    client = MagicMock()
+    client.example.count.return_value = len(examples)
+    client.example.list.side_effect = lambda *args, **kwargs: iter(examples)
+    client.span.list.side_effect = lambda project_id, example_id: [
+        Span(id=example_id, example=example_id, start_offset=0, end_offset=5, label=1)
+    ]
+    client.list_label_types.return_value = []
+    client.list_members.return_value = []
+
+    labeled, unlabeled = preparation.prepare_datasets(client, 1)
+
+    assert (home / "1" / "dataset" / "train.txt").exists()
+    assert (home / "1" / "dataset" / "test.txt").exists()
+    assert (home / "1" / "mirror.sqlite3").exists()
+    assert unlabeled.ids == [6, 7]
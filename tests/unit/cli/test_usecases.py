@@ -0,0 +1,105 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from doccano_client.models.bulk import BulkItemResult
+from doccano_client.models.example import Example
+from doccano_client.models.label import Span
+from doccano_client.models.label_type import LabelType
+from doccano_client.utils.checkpoint import Checkpoint
+
+pytest.importorskip("tqdm")
+
+from doccano_client.cli.entity import Entity  # noqa: E402
+from doccano_client.cli.usecases import SpanAnnotator  # noqa: E402
+
+
+class FailingEstimator:
+    def __init__(self, fail_at=None, empty=()):
+        self.fail_at = fail_at
+        self.empty = empty
+        self.predicted = []
+
+    def predict_many(self, items, batch_size=32, n_process=1):
+        for text, example_id in items:
+            if example_id == self.fail_at:
+                raise RuntimeError("killed")
+            self.predicted.append(example_id)
+            yield [] if example_id in self.empty else [Entity(0, 1, "PER")], example_id
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.list_label_types.return_value = [LabelType(id=1, text="PER")]
+    client.count_examples.return_value = 10
+    client.list_examples.side_effect = lambda project_id: iter([Example(id=i, text="x") for i in range(10)])
+    client.posted = []
+
+    def bulk_create_spans(project_id, spans, max_workers=8):
+        for span in spans:
+            client.posted.append(span)
+            yield BulkItemResult(item=span, error=RuntimeError() if span.example == client.failing else None)
+
+    client.failing = None
+    client.bulk_create_spans.side_effect = bulk_create_spans
+    return client
+
+
+def test_span_annotator_resumes_after_an_interrupted_run(client, tmp_path):
+    path = tmp_path / "run.ids"
+    with pytest.raises(RuntimeError, match="killed"):
+        with Checkpoint(path, flush_every=2) as checkpoint:
+            SpanAnnotator(client, FailingEstimator(fail_at=6)).annotate(1, checkpoint=checkpoint)
+    first_run = {span.example for span in client.posted}
+    # the pipeline stops on the error, possibly before the predicted examples are posted.
+    assert first_run <= set(range(6))
+    assert len(Checkpoint(path)) == len(first_run)
+
+    client.posted.clear()
+    estimator = FailingEstimator()
+    with Checkpoint(path, flush_every=2) as checkpoint:
+        SpanAnnotator(client, estimator).annotate(1, checkpoint=checkpoint)
+    assert estimator.predicted == sorted(set(range(10)) - first_run)
+    assert len(Checkpoint(path)) == 10
+
+
+def test_span_annotator_skips_annotated_examples(client):
+    client.iter_project_labels.return_value = iter(
+        [(Example(id=i, text="x"), {"span": [MagicMock()] if i < 8 else []}) for i in range(10)]
+    )
+    estimator = FailingEstimator()
+    SpanAnnotator(client, estimator).annotate(1, skip_annotated=True)
+    assert estimator.predicted == [8, 9]
+    client.iter_project_labels.assert_called_once_with(1, types=["span"])
+
+
+def test_span_annotator_posts_all_labels_through_one_bulk_create(client, tmp_path):
+    client.failing = 3
+    with Checkpoint(tmp_path / "run.ids") as checkpoint:
+        estimator = FailingEstimator(empty={0, 4, 9})
+        SpanAnnotator(client, estimator, post_workers=4).annotate(1, checkpoint=checkpoint)
+    client.bulk_create_spans.assert_called_once()
+    assert client.bulk_create_spans.call_args.kwargs == {"max_workers": 4}
+    assert sorted(span.example for span in client.posted) == [1, 2, 3, 5, 6, 7, 8]
+    assert len(Checkpoint(tmp_path / "run.ids")) == 10
+
+
+def test_span_annotator_reports_failed_labels_instead_of_posting_them_again(client, tmp_path):
+    path = tmp_path / "run.ids"
+    failed_path = tmp_path / "run.failed.jsonl"
+    client.failing = 3
+    with Checkpoint(path) as checkpoint:
+        SpanAnnotator(client, FailingEstimator()).annotate(1, checkpoint=checkpoint, failed_path=failed_path)
+    assert 3 in Checkpoint(path)
+    (failed,) = [json.loads(line) for line in failed_path.read_text().splitlines()]
+    assert failed["example"] == 3
+    assert Span.parse_obj(failed) == Span(example=3, start_offset=0, end_offset=1, label=1)
+
+    client.posted.clear()
+    estimator = FailingEstimator()
+    with Checkpoint(path) as checkpoint:
+        SpanAnnotator(client, estimator).annotate(1, checkpoint=checkpoint, failed_path=failed_path)
+    assert estimator.predicted == []
+    assert client.posted == []
@@ -1,6 +1,19 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlparse
+
 import pytest
+import responses
+from requests import Response, exceptions
+from requests.adapters import BaseAdapter
 
-from doccano_client.repositories.base import get_next_url
+from doccano_client.exceptions import DoccanoAPIError
+from doccano_client.repositories.base import BaseRepository, get_next_url
+from doccano_client.utils.cache import MemoryCache
+from doccano_client.utils.instrumentation import RequestHook
+from doccano_client.utils.retry import RetryPolicy
+from tests.unit.utils.test_json_backend import installed_backends
 
 
 @pytest.mark.parametrize(
@@ -51,3 +64,346 @@ def test_get_next_url_error(base_url, initial_request_url, response_url):
     # should return the unmodified url when in doubt
     url = get_next_url(base_url, initial_request_url, {"next": response_url})
     assert url == response_url
+
+
+def paged_callback(total: int, default_limit: int):
+    def callback(request):
+        query = parse_qs(urlparse(request.url).query)
+        limit = int(query.get("limit", [default_limit])[0])
+        offset = int(query.get("offset", [0])[0])
+        url = request.url.split("?")[0]
+        end = min(offset + limit, total)
+        body = {
+            "count": total,
+            "next": f"{url}?limit={limit}&offset={end}" if end < total else None,
+            "previous": None,
+            "results": [{"id": i} for i in range(offset, end)],
+        }
+        return 200, {}, json.dumps(body)
+
+    return callback
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+@responses.activate
+def test_paginate(max_workers):
+    url = "http://localhost:8000/v1/projects/1/examples"
+    responses.add_callback(responses.GET, url, callback=paged_callback(total=23, default_limit=5))
+    client = BaseRepository("http://localhost:8000")
+    items = list(client.paginate("projects/1/examples", max_workers=max_workers))
+    assert [item["id"] for item in items] == list(range(23))
+    assert len(responses.calls) == 5
+
+
+@responses.activate
+def test_paginate_single_page():
+    url = "http://localhost:8000/v1/projects"
+    responses.add_callback(responses.GET, url, callback=paged_callback(total=3, default_limit=5))
+    client = BaseRepository("http://localhost:8000")
+    items = list(client.paginate("projects", max_workers=4))
+    assert [item["id"] for item in items] == [0, 1, 2]
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+@responses.activate
+def test_paginate_with_page_size(max_workers):
+    url = "http://localhost:8000/v1/projects/1/examples"
+    responses.add_callback(responses.GET, url, callback=paged_callback(total=23, default_limit=5))
+    client = BaseRepository("http://localhost:8000")
+    items = list(client.paginate("projects/1/examples", max_workers=max_workers, page_size=10))
+    assert [item["id"] for item in items] == list(range(23))
+    assert len(responses.calls) == 3
+    assert "limit=10" in responses.calls[0].request.url
+
+
+@responses.activate
+def test_paginate_uses_default_page_size():
+    url = "http://localhost:8000/v1/projects"
+    responses.add_callback(responses.GET, url, callback=paged_callback(total=23, default_limit=5))
+    client = BaseRepository("http://localhost:8000", page_size=20)
+    items = list(client.paginate("projects"))
+    assert len(items) == 23
+    assert len(responses.calls) == 2
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("doccano_client.repositories.base.time.sleep", sleeps.append)
+    return sleeps
+
+
+@responses.activate
+def test_request_retries_overloaded_server(sleeps):
+    url = "http://localhost:8000/v1/projects"
+    responses.add(responses.GET, url, status=503)
+    responses.add(responses.GET, url, status=429, headers={"Retry-After": "2"})
+    responses.add(responses.GET, url, json={"count": 0})
+    client = BaseRepository("http://localhost:8000")
+    assert client.get("projects").json() == {"count": 0}
+    assert len(responses.calls) == 3
+    assert len(sleeps) == 2
+    assert sleeps[1] == 2
+
+
+@responses.activate
+def test_request_gives_up_after_max_attempts(sleeps):
+    url = "http://localhost:8000/v1/projects"
+    responses.add(responses.GET, url, status=502)
+    client = BaseRepository("http://localhost:8000", retry_policy=RetryPolicy(max_attempts=2))
+    with pytest.raises(DoccanoAPIError):
+        client.get("projects")
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_request_does_not_retry_post_by_default(sleeps):
+    url = "http://localhost:8000/v1/projects"
+    responses.add(responses.POST, url, status=503)
+    client = BaseRepository("http://localhost:8000")
+    with pytest.raises(DoccanoAPIError):
+        client.post("projects", json={})
+    assert len(responses.calls) == 1
+    assert sleeps == []
+
+
+def test_pool_options():
+    client = BaseRepository("http://localhost:8000", pool_maxsize=32, pool_block=True)
+    adapter = client._session.get_adapter("http://localhost:8000/v1/projects")
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+    assert client._session.get_adapter("https://example.com") is adapter
+
+
+def test_custom_adapter_and_timeout():
+    class RecordingAdapter(BaseAdapter):
+        def __init__(self):
+            super().__init__()
+            self.sent = []
+
+        def send(self, request, **kwargs):
+            self.sent.append((request, kwargs))
+            response = Response()
+            response.status_code = 200
+            response.url = request.url
+            response._content = b"{}"
+            return response
+
+        def close(self):
+            pass
+
+    adapter = RecordingAdapter()
+    client = BaseRepository("http://localhost:8000", adapter=adapter, timeout=(3, 30), keep_alive=False)
+    client.get("projects")
+    request, kwargs = adapter.sent[0]
+    assert kwargs["timeout"] == (3, 30)
+    assert request.headers["connection"] == "close"
+
+
+def test_thread_safe_sessions_copy_state():
+    client = BaseRepository("http://localhost:8000", thread_safe=True)
+    sessions = {}
+
+    def get_session(name):
+        sessions[name] = client._session
+
+    thread = threading.Thread(target=get_session, args=("worker",))
+    thread.start()
+    thread.join()
+    get_session("main")
+    assert sessions["main"] is not sessions["worker"]
+    assert sessions["main"].cookies is not sessions["worker"].cookies
+    assert sessions["main"].headers is not sessions["worker"].headers
+    assert sessions["main"].headers == sessions["worker"].headers
+    assert sessions["main"].get_adapter("http://localhost") is sessions["worker"].get_adapter("http://localhost")
+
+
+@responses.activate
+def test_thread_safe_login_reaches_every_session():
+    login_url = "http://localhost:8000/v1/auth/login/"
+    url = "http://localhost:8000/v1/projects"
+    responses.add(responses.POST, login_url, json={}, headers={"Set-Cookie": "csrftoken=token; Path=/"})
+    responses.add(responses.GET, url, json={})
+    client = BaseRepository("http://localhost:8000", thread_safe=True)
+    barrier = threading.Barrier(8)
+
+    def request(index):
+        client.get("projects")
+        barrier.wait()
+        if index == 0:
+            client.login("admin", "password")
+        barrier.wait()
+        client.get("projects")
+        return client._session
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(executor.map(request, range(8)))
+    gets = [call.request for call in responses.calls if call.request.url == url]
+    assert [request.headers.get("X-CSRFToken") for request in gets[8:]] == ["token"] * 8
+    assert all("csrftoken=token" in request.headers["Cookie"] for request in gets[8:])
+    assert len({id(session.headers) for session in sessions}) == 8
+    assert len({id(session.cookies) for session in sessions}) == 8
+
+
+@responses.activate
+def test_thread_safe_relogin_once_on_expired_session():
+    login_url = "http://localhost:8000/v1/auth/login/"
+    url = "http://localhost:8000/v1/projects"
+    responses.add(responses.POST, login_url, json={}, headers={"Set-Cookie": "csrftoken=first; Path=/"})
+    client = BaseRepository("http://localhost:8000", thread_safe=True)
+    client.login("admin", "password")
+    assert client._headers["X-CSRFToken"] == "first"
+
+    responses.replace(responses.POST, login_url, json={}, headers={"Set-Cookie": "csrftoken=second; Path=/"})
+
+    def callback(request):
+        if request.headers.get("X-CSRFToken") == "first":
+            return 403, {}, json.dumps({"detail": "Authentication credentials were not provided."})
+        return 200, {}, json.dumps({"ok": True})
+
+    responses.add_callback(responses.GET, url, callback=callback)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: client.get("projects").json(), range(16)))
+    assert all(result == {"ok": True} for result in results)
+    assert len([call for call in responses.calls if call.request.url == login_url]) == 2
+    assert client._headers["X-CSRFToken"] == "second"
+
+
+@pytest.mark.parametrize(
+    "status, body, relogin",
+    [
+        (401, {"detail": "Invalid session."}, True),
+        (403, {"detail": "CSRF Failed: CSRF token missing or incorrect."}, True),
+        (403, {"detail": "Authentication credentials were not provided."}, True),
+        (403, {"detail": "You do not have permission to perform this action."}, False),
+    ],
+)
+@responses.activate
+def test_thread_safe_relogin_only_on_session_failures(status, body, relogin):
+    login_url = "http://localhost:8000/v1/auth/login/"
+    responses.add(responses.POST, login_url, json={})
+    responses.add(responses.GET, "http://localhost:8000/v1/projects", status=status, json=body)
+    client = BaseRepository("http://localhost:8000", thread_safe=True)
+    client.login("admin", "password")
+    with pytest.raises(DoccanoAPIError):
+        client.get("projects")
+    logins = len([call for call in responses.calls if call.request.url == login_url])
+    assert logins == (2 if relogin else 1)
+
+
+@responses.activate
+def test_relogin_is_disabled_by_default():
+    responses.add(responses.POST, "http://localhost:8000/v1/auth/login/", json={})
+    responses.add(responses.GET, "http://localhost:8000/v1/projects", status=403)
+    client = BaseRepository("http://localhost:8000")
+    client.login("admin", "password")
+    with pytest.raises(DoccanoAPIError):
+        client.get("projects")
+    assert len(responses.calls) == 2
+
+
+@pytest.mark.parametrize("json_backend", ["json", None])
+@responses.activate
+def test_request_uses_json_backend(json_backend):
+    responses.add(
+        responses.POST,
+        "http://localhost:8000/v1/projects",
+        json={"id": 1, "name": "東京"},
+        match=[responses.matchers.json_params_matcher({"name": "東京"})],
+    )
+    client = BaseRepository("http://localhost:8000", json_backend=json_backend)
+    response = client.post("projects", json={"name": "東京"})
+    assert response.json() == {"id": 1, "name": "東京"}
+    assert response.json_backend is client.json_backend
+    assert responses.calls[0].request.headers["content-type"] == "application/json"
+
+
+@pytest.mark.parametrize("json_backend", installed_backends())
+@responses.activate
+def test_invalid_json_raises_the_requests_error(json_backend):
+    responses.add(responses.GET, "http://localhost:8000/v1/projects", body="<html>", status=500)
+    client = BaseRepository("http://localhost:8000", json_backend=json_backend)
+    response = client._send("GET", "http://localhost:8000/v1/projects")
+    with pytest.raises(exceptions.JSONDecodeError):
+        response.json()
+    with pytest.raises(DoccanoAPIError, match="500 Server Error"):
+        client.get("projects")
+
+
+@responses.activate
+def test_cache_serves_fresh_responses_and_invalidates_on_write():
+    url = "http://localhost:8000/v1/projects/1/category-types"
+    responses.add(responses.GET, url, json=[{"id": 1}])
+    responses.add(responses.POST, url, json={"id": 2})
+    client = BaseRepository("http://localhost:8000", cache=MemoryCache())
+    assert client.get("projects/1/category-types").json() == [{"id": 1}]
+    assert client.get("projects/1/category-types").json() == [{"id": 1}]
+    assert len(responses.calls) == 1
+    client.post("projects/1/category-types", json={"text": "foo"})
+    client.get("projects/1/category-types")
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_cache_revalidates_stale_responses():
+    url = "http://localhost:8000/v1/me"
+    responses.add(responses.GET, url, json={"id": 1}, headers={"ETag": '"v1"'})
+    responses.add(responses.GET, url, status=304, match=[responses.matchers.header_matcher({"If-None-Match": '"v1"'})])
+    client = BaseRepository("http://localhost:8000", cache=MemoryCache(ttl=0))
+    assert client.get("me").json() == {"id": 1}
+    assert client.get("me").json() == {"id": 1}
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_hooks_receive_request_events():
+    responses.add(responses.GET, "http://localhost:8000/v1/projects/1", json={"id": 1})
+    responses.add(responses.GET, "http://localhost:8000/v1/projects/2", status=404)
+    events = []
+
+    class Recorder(RequestHook):
+        def before_request(self, event):
+            events.append(("before", event.template))
+
+        def after_response(self, event):
+            events.append(("after", event.status, event.bytes))
+
+        def on_error(self, event):
+            events.append(("error", event.status, type(event.error)))
+
+    client = BaseRepository("http://localhost:8000", hooks=[Recorder()])
+    client.get("projects/1")
+    with pytest.raises(DoccanoAPIError):
+        client.get("projects/2")
+    assert events == [
+        ("before", "projects/{id}"),
+        ("after", 200, len(b'{"id": 1}')),
+        ("before", "projects/{id}"),
+        ("error", 404, DoccanoAPIError),
+    ]
+
+
+@responses.activate
+def test_request_accepts_absolute_urls():
+    responses.add(responses.GET, "http://localhost:8000/media/audio.wav", body=b"RIFF")
+    responses.add(responses.GET, "http://localhost:8000/v1/media/audio.wav", status=404)
+    responses.add(responses.GET, "http://127.0.0.1:8080/media/audio.wav", body=b"WAVE")
+    client = BaseRepository("http://localhost:8000")
+    assert client.get("http://localhost:8000/media/audio.wav").content == b"RIFF"
+    assert client.get("http://127.0.0.1:8080/media/audio.wav").content == b"WAVE"
+
+
+@responses.activate
+def test_cache_skips_task_status_and_lists():
+    status_url = "http://localhost:8000/v1/tasks/status/1"
+    responses.add(responses.GET, status_url, json={"ready": False})
+    responses.add(responses.GET, status_url, json={"ready": True})
+    responses.add(responses.GET, "http://localhost:8000/v1/projects/1/examples", json={"count": 0})
+    client = BaseRepository("http://localhost:8000", cache=MemoryCache(ttl=60))
+    assert client.get("tasks/status/1").json() == {"ready": False}
+    assert client.get("tasks/status/1").json() == {"ready": True}
+    client.get("projects/1/examples")
+    client.get("projects/1/examples")
+    assert len(responses.calls) == 4
+    assert client.cache.keys() == []
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+
+from pydantic import ValidationError
+
+from doccano_client.exceptions import DoccanoAPIError
+from doccano_client.models.example import Example
+from doccano_client.repositories.example import ExampleRepository
+
+
+class TestExampleRepository:
+    def setup_method(self):
+        self.client = MagicMock()
+        self.repository = ExampleRepository(self.client)
+
+    def test_bulk_partial_update_reports_failures(self):
+        def patch(resource, json):
+            example_id = int(resource.rsplit("/", 1)[1])
+            if example_id == 3:
+                raise DoccanoAPIError("400 Client Error", MagicMock(text="bad request"))
+            return MagicMock(json=MagicMock(return_value={"id": example_id, **json}))
+
+        self.client.patch.side_effect = patch
+        updates = [(i, {"score": i / 10}) for i in range(10)]
+        results = list(self.repository.bulk_partial_update(0, updates, max_workers=4))
+        assert [result.item for result in results] == updates
+        assert [result.ok for result in results] == [i != 3 for i in range(10)]
+        assert [result.result.score for result in results if result.ok] == [i / 10 for i in range(10) if i != 3]
+
+    def test_bulk_partial_update_reports_invalid_fields(self):
+        self.client.patch.side_effect = lambda resource, json: MagicMock(json=MagicMock(return_value={"id": 0, **json}))
+        updates = [(0, {"score": 0.5}), (1, {"score": "high"}), (2, {"unknown": 1}), (3, {"is_confirmed": True})]
+        results = list(self.repository.bulk_partial_update(0, updates))
+        assert [result.ok for result in results] == [True, False, False, True]
+        assert isinstance(results[1].error, ValidationError)
+        assert isinstance(results[2].error, KeyError)
+        assert self.client.patch.call_count == 2
+
+    def test_download_file(self, tmp_path):
+        response = self.client.get.return_value.__enter__.return_value
+        response.iter_content.return_value = [b"RI", b"FF"]
+        example = Example(id=1, filename="http://localhost:8000/media/a.wav", upload_name="a.wav")
+        path = self.repository.download_file(example, tmp_path / "a.wav")
+        assert path.read_bytes() == b"RIFF"
+        self.client.get.assert_called_once_with("http://localhost:8000/media/a.wav", stream=True)
+
+    def test_find_latest(self):
+        self.client.get.return_value.json.return_value = {"count": 3, "results": [{"id": 3, "text": "latest"}]}
+        assert self.repository.find_latest(0).id == 3
+        self.client.get.assert_called_once_with("projects/0/examples", params={"limit": 1, "ordering": "-created_at"})
+
+    def test_find_latest_in_empty_project(self):
+        self.client.get.return_value.json.return_value = {"count": 0, "results": []}
+        assert self.repository.find_latest(0) is None
@@ -0,0 +1,80 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from doccano_client.exceptions import DoccanoAPIError
+from doccano_client.models.label import Span
+from doccano_client.repositories.label import SpanRepository
+
+
+class TestLabelRepository:
+    def setup_method(self):
+        self.client = MagicMock()
+        self.repository = SpanRepository(self.client)
+        self.spans = [Span(example=i, start_offset=0, end_offset=1, label=1) for i in range(10)]
+
+    def test_bulk_create(self):
+        self.client.post.side_effect = lambda resource, json: MagicMock(json=MagicMock(return_value={"id": 1, **json}))
+        results = list(self.repository.bulk_create(0, self.spans, max_workers=4))
+        assert [result.item for result in results] == self.spans
+        assert all(result.ok for result in results)
+        assert [result.result.example for result in results] == list(range(10))
+        assert self.client.post.call_count == 10
+
+    def test_bulk_create_reports_failures(self):
+        def post(resource, json):
+            if json["example"] == 3:
+                raise DoccanoAPIError("400 Client Error", MagicMock(text="bad request"))
+            return MagicMock(json=MagicMock(return_value={"id": 1, **json}))
+
+        self.client.post.side_effect = post
+        results = list(self.repository.bulk_create(0, self.spans, max_workers=4))
+        assert [result.ok for result in results] == [i != 3 for i in range(10)]
+        assert isinstance(results[3].error, DoccanoAPIError)
+
+    def test_bulk_create_reports_invalid_labels(self):
+        self.client.post.side_effect = lambda resource, json: MagicMock(json=MagicMock(return_value={"id": 1, **json}))
+        labels = [
+            {"example": 0, "start_offset": 0, "end_offset": 1, "label": 1},
+            {"example": 1, "start_offset": 2, "end_offset": 1, "label": 1},
+            {"example": 2, "start_offset": -1, "end_offset": 1, "label": 1},
+            self.spans[3],
+        ]
+        results = list(self.repository.bulk_create(0, labels, max_workers=4))
+        assert [result.ok for result in results] == [True, False, False, True]
+        assert all(isinstance(result.error, ValidationError) for result in results[1:3])
+        assert [result.item for result in results] == labels
+        assert self.client.post.call_count == 2
+
+    def test_list_trusted_skips_validation(self):
+        repository = SpanRepository(self.client, trusted=True)
+        labels = [{"id": 1, "example": 1, "start_offset": 3, "end_offset": 3, "label": 1, "user": 1, "extra": "x"}]
+        self.client.get.return_value.json.return_value = labels
+        spans = repository.list(0, 1)
+        assert isinstance(spans[0], Span)
+        assert spans[0].start_offset == spans[0].end_offset == 3
+        assert "extra" not in spans[0].dict()
+
+    def test_partial_update(self):
+        self.client.patch.return_value.json.return_value = {
+            "id": 3,
+            "example": 1,
+            "start_offset": 0,
+            "end_offset": 2,
+            "label": 1,
+        }
+        span = self.repository.partial_update(0, 1, 3, {"end_offset": "2"})
+        self.client.patch.assert_called_once_with("projects/0/examples/1/spans/3", json={"end_offset": 2})
+        assert span.end_offset == 2
+
+    def test_partial_update_validates_fields(self):
+        with pytest.raises(ValidationError):
+            self.repository.partial_update(0, 1, 3, {"start_offset": -1})
+        with pytest.raises(ValidationError):
+            self.repository.partial_update(0, 1, 3, {"start_offset": 2, "end_offset": 1})
+        self.client.patch.assert_not_called()
+
+    def test_delete_by_id(self):
+        self.repository.delete_by_id(0, 1, 3)
+        self.client.delete.assert_called_once_with("projects/0/examples/1/spans/3")
@@ -0,0 +1,70 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from doccano_client.models.label_type import LabelType
+from doccano_client.repositories.label_type import LabelTypeRepository
+
+
+class TestLabelTypeRepository:
+    def setup_method(self):
+        self.client = MagicMock()
+        self.client.get.return_value.json.return_value = [
+            {"id": 1, "text": "PER", "background_color": "#000000", "text_color": "#ffffff"},
+            {"id": 2, "text": "ORG", "background_color": "#000000", "text_color": "#ffffff"},
+        ]
+        self.client.post.return_value.json.return_value = {"id": 3, "text": "LOC"}
+        self.repository = LabelTypeRepository(self.client, resource_type="span-type")
+
+    def test_find_by_name_caches_label_types(self):
+        assert self.repository.find_by_name(0, "PER").id == 1
+        assert self.repository.find_by_name(0, "ORG").id == 2
+        self.client.get.assert_called_once_with("projects/0/span-types")
+
+    def test_find_by_name_caches_per_project(self):
+        self.repository.find_by_name(0, "PER")
+        self.repository.find_by_name(1, "PER")
+        assert self.client.get.call_count == 2
+
+    def test_find_by_name_raises_error_if_not_found(self):
+        with pytest.raises(ValueError):
+            self.repository.find_by_name(0, "LOC")
+
+    def test_find_by_name_refetches_on_cache_miss(self):
+        self.repository.find_by_name(0, "PER")
+        self.client.get.return_value.json.return_value.append({"id": 3, "text": "LOC"})
+        assert self.repository.find_by_name(0, "LOC").id == 3
+        assert self.repository.find_by_name(0, "LOC").id == 3
+        assert self.client.get.call_count == 2
+
+    def test_find_by_name_refetches_once_before_raising_error(self):
+        self.repository.find_by_name(0, "PER")
+        with pytest.raises(ValueError):
+            self.repository.find_by_name(0, "LOC")
+        assert self.client.get.call_count == 2
+
+    def test_create_invalidates_cache(self):
+        self.repository.find_by_name(0, "PER")
+        self.repository.create(0, LabelType(text="LOC"))
+        self.repository.find_by_name(0, "PER")
+        assert self.client.get.call_count == 2
+
+    def test_delete_invalidates_cache(self):
+        self.repository.find_by_name(0, "PER")
+        self.repository.bulk_delete(0, [1])
+        self.repository.find_by_name(0, "ORG")
+        assert self.client.get.call_count == 2
+
+    def test_cache_expires(self, monkeypatch):
+        now = 1000.0
+        monkeypatch.setattr("doccano_client.repositories.label_type.time.monotonic", lambda: now)
+        self.repository.find_by_name(0, "PER")
+        now += 61
+        self.repository.find_by_name(0, "PER")
+        assert self.client.get.call_count == 2
+
+    def test_cache_can_be_disabled(self):
+        repository = LabelTypeRepository(self.client, resource_type="span-type", cache_ttl=0)
+        repository.find_by_name(0, "PER")
+        repository.find_by_name(0, "PER")
+        assert self.client.get.call_count == 2
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from doccano_client.models.task_status import TaskStatus
+from doccano_client.repositories.task_status import TaskStatusRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("doccano_client.repositories.task_status.time.monotonic", clock.monotonic)
+    monkeypatch.setattr("doccano_client.repositories.task_status.time.sleep", clock.sleep)
+    return clock
+
+
+class TestTaskStatusRepository:
+    def setup_method(self):
+        self.repository = TaskStatusRepository(MagicMock())
+        self.repository.get = MagicMock()
+
+    def test_wait_backs_off(self, clock):
+        self.repository.get.side_effect = [TaskStatus(ready=False)] * 4 + [TaskStatus(ready=True, result=1)]
+        status = self.repository.wait("task", interval=1, backoff=2, max_interval=5)
+        assert status.result == 1
+        assert clock.sleeps == [1, 2, 4, 5]
+
+    def test_wait_times_out_by_wall_clock(self, clock):
+        self.repository.get.return_value = TaskStatus(ready=False)
+        with pytest.raises(TimeoutError):
+            self.repository.wait("task", timeout=10, interval=3, backoff=1, max_interval=3)
+        assert sum(clock.sleeps) == 10
+        assert clock.sleeps[-1] == 1
+
+    def test_wait_all(self, clock):
+        ready = {"a": iter([False, True]), "b": iter([False, False, True])}
+        self.repository.get.side_effect = lambda task_id: TaskStatus(ready=next(ready[task_id]), result=task_id)
+        statuses = self.repository.wait_all(["b", "a"], interval=1, backoff=1)
+        assert [status.result for status in statuses] == ["b", "a"]
+        assert self.repository.get.call_count == 5
+        assert clock.sleeps == [1, 1]
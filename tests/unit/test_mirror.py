@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from doccano_client.mirror import ProjectMirror
+from doccano_client.models.comment import Comment
+from doccano_client.models.example import Example
+from doccano_client.models.label import Span
+from doccano_client.models.label_type import LabelType
+from doccano_client.models.member import Member
+
+
+class TestProjectMirror:
+    def setup_method(self):
+        self.client = MagicMock()
+        self.examples = [Example(id=i, text=f"text {i}", is_confirmed=i % 2 == 0) for i in range(1, 5)]
+        self.examples[0].comment_count = 1
+        self.client.example.list.side_effect = lambda *args, **kwargs: iter(self.examples)
+        self.client.span.list.side_effect = lambda project_id, example_id: [
+            Span(id=example_id, example=example_id, start_offset=0, end_offset=4, label=1, user=1)
+        ]
+        self.client.comment.list.side_effect = lambda project_id, example_id: iter(
+            [Comment(id=1, example=example_id, text="check")]
+        )
+        self.client.list_label_types.return_value = [LabelType(id=1, text="PER")]
+        self.client.list_members.return_value = [Member(id=1, user=1, role=1, username="admin")]
+
+    @pytest.fixture(autouse=True)
+    def mirror(self, tmp_path):
+        self.mirror = ProjectMirror(self.client, 0, tmp_path / "mirror.sqlite3", ["span"])
+        yield
+        self.mirror.close()
+
+    def test_sync_and_read(self):
+        result = self.mirror.sync(max_workers=2)
+        assert (result.added, result.updated, result.deleted) == (4, 0, 0)
+        assert list(self.mirror.list_examples()) == self.examples
+        assert [example.id for example in self.mirror.list_examples(is_confirmed=True)] == [2, 4]
+        assert self.mirror.list_spans(3) == [Span(id=3, example=3, start_offset=0, end_offset=4, label=1, user=1)]
+        assert self.mirror.list_comments(1) == [Comment(id=1, example=1, text="check")]
+        assert self.mirror.list_members()[0].username == "admin"
+        assert self.mirror.get_progress().completed == 2
+        ((distribution),) = self.mirror.get_label_distribution("span")
+        assert distribution.username == "admin"
+        assert distribution.counts[0].label == "PER" and distribution.counts[0].count == 4
+
+    def test_sync_is_incremental(self):
+        self.mirror.sync()
+        self.client.span.list.reset_mock()
+        self.examples[0].is_confirmed = True
+        self.examples[2].text = "edited"
+        del self.examples[3]
+        result = self.mirror.sync()
+        assert (result.added, result.updated, result.deleted, result.unchanged) == (0, 1, 1, 2)
+        self.client.span.list.assert_called_once_with(0, 1)
+        assert self.mirror.find_example_by_id(3).text == "edited"
+        assert self.mirror.count_examples() == 3
+        assert self.mirror.list_spans(4) == []
+        with pytest.raises(KeyError):
+            self.mirror.find_example_by_id(4)
+
+    def test_only_confirmed_labels(self, tmp_path):
+        with ProjectMirror(self.client, 0, tmp_path / "other.sqlite3", only_confirmed_labels=True) as mirror:
+            mirror.sync()
+            assert [span.example for span in mirror.list_labels("span")] == [2, 4]
+
+    def test_unmirrored_type(self):
+        with pytest.raises(ValueError):
+            self.mirror.list_categories(1)
+
+    def test_sync_confirmed_fetches_new_confirmations_only(self):
+        self.mirror.sync()
+        self.client.span.list.reset_mock()
+        self.client.example.count.return_value = 4
+        self.client.example.find_latest.return_value = self.examples[-1]
+        self.examples[0].is_confirmed = True
+        self.examples[1].is_confirmed = False
+        self.client.example.list.side_effect = lambda project_id, is_confirmed, *args: iter(
+            [example for example in self.examples if example.is_confirmed]
+        )
+        result = self.mirror.sync_confirmed(max_workers=2)
+        assert (result.updated, result.unchanged) == (2, 2)
+        self.client.example.list.assert_called_with(0, True, 2, 1000)
+        self.client.span.list.assert_called_once_with(0, 1)
+        assert [example.id for example in self.mirror.list_examples(is_confirmed=True)] == [1, 4]
+        assert self.mirror.find_example_by_id(2).is_confirmed is False
+
+    def test_sync_confirmed_falls_back_to_sync(self):
+        self.mirror.sync()
+        self.examples.append(Example(id=5, text="text 5", is_confirmed=True))
+        self.client.example.count.return_value = 5
+        result = self.mirror.sync_confirmed()
+        assert (result.added, result.unchanged) == (1, 4)
+        assert self.mirror.count_examples() == 5
+
+    def test_sync_confirmed_detects_added_and_deleted_examples(self):
+        self.mirror.sync()
+        self.examples[1:2] = []
+        self.examples.append(Example(id=5, text="text 5", is_confirmed=True))
+        self.client.example.count.return_value = 4
+        self.client.example.find_latest.return_value = self.examples[-1]
+        result = self.mirror.sync_confirmed()
+        assert (result.added, result.deleted) == (1, 1)
+        assert [example.id for example in self.mirror.list_examples()] == [1, 3, 4, 5]
@@ -1,5 +1,9 @@
+import io
+import zipfile
 from unittest.mock import MagicMock
 
+import pytest
+
 from doccano_client.models.data_download import Option
 from doccano_client.usecase.data_download import DataDownloadUseCase
 
@@ -25,3 +29,30 @@ class TestDataDownloadUseCase:
         self.data_download_repository.schedule_download.assert_called_once_with(project_id, option, True)
         self.task_status_repository.wait.assert_called_once_with(task_id)
         self.data_download_repository.download.assert_called_once_with(project_id, task_id, ".")
+
+    def test_iter_export_from_zip(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("admin.jsonl", '{"id": 1, "text": "a", "label": [[0, 1, "PER"]], "Comments": []}\n')
+            archive.writestr("user.jsonl", '{"id": 2, "text": "b", "source": "web", "label": []}\n')
+        content = buffer.getvalue()
+        chunks = (content[i : i + 10] for i in range(0, len(content), 10))
+        self.data_download_repository.stream.return_value = ("export.zip", chunks)
+        records = list(self.usecase.iter_export(0, "JSONL", chunk_size=10))
+        self.data_download_repository.stream.assert_called_once()
+        assert [(example.id, example.text, example.meta) for example, _ in records] == [
+            (1, "a", {}),
+            (2, "b", {"source": "web"}),
+        ]
+        assert [labels for _, labels in records] == [{"label": [[0, 1, "PER"]]}, {"label": []}]
+
+    def test_iter_export_from_jsonl(self):
+        chunks = iter([b'{"id": 1, "text": "a", "entities": [], "relations": []}\n{"id": 2,', b' "text": "b"}'])
+        self.data_download_repository.stream.return_value = ("export.jsonl", chunks)
+        records = list(self.usecase.iter_export(0))
+        assert [example.id for example, _ in records] == [1, 2]
+        assert records[0][1] == {"entities": [], "relations": []}
+
+    def test_iter_export_rejects_non_jsonl_format(self):
+        with pytest.raises(ValueError):
+            next(self.usecase.iter_export(0, "CSV"))
@@ -1,6 +1,19 @@
+import json
 from unittest.mock import MagicMock
 
-from doccano_client.usecase.data_upload import DataUploadUseCase
+import pytest
+
+from doccano_client.exceptions import DoccanoAPIError
+from doccano_client.models.example import Example
+from doccano_client.usecase.data_upload import DataUploadUseCase, to_jsonl_chunks
+
+
+def test_to_jsonl_chunks():
+    examples = [Example(text="a", meta={"source": "x"}), {"text": "b", "label": [[0, 1, "PER"]]}, Example(text="c")]
+    chunks = list(to_jsonl_chunks(examples, chunk_size=2))
+    assert len(chunks) == 2
+    lines = [json.loads(line) for chunk in chunks for line in chunk.decode().splitlines()]
+    assert lines == [{"source": "x", "text": "a"}, {"text": "b", "label": [[0, 1, "PER"]]}, {"text": "c"}]
 
 
 class TestDataUploadUseCase:
@@ -29,3 +42,46 @@ class TestDataUploadUseCase:
         self.data_upload_repository.ingest.assert_called_once_with(
             project_id, ["upload_id"], "DocumentClassification", "JSONL", column_data="text", column_label="label"
         )
+
+    def test_upload_many_files(self):
+        project_id = 0
+        file_paths = [f"{i}.jsonl" for i in range(10)]
+        self.data_upload_repository.upload.side_effect = lambda file_path: f"upload_{file_path}"
+        progress = MagicMock()
+        self.usecase.upload(project_id, file_paths, "SequenceLabeling", "JSONL", max_workers=4, progress=progress)
+        self.data_upload_repository.ingest.assert_called_once_with(
+            project_id,
+            [f"upload_{file_path}" for file_path in file_paths],
+            "SequenceLabeling",
+            "JSONL",
+            column_data="text",
+            column_label="label",
+        )
+        assert sorted(c.args[1] for c in progress.call_args_list) == list(range(1, 11))
+        assert all(c.args[2] == 10 for c in progress.call_args_list)
+
+    def test_upload_reverts_on_failure(self):
+        def upload(file_path):
+            if file_path == "bad.jsonl":
+                raise DoccanoAPIError("400 Client Error", MagicMock(text="bad file"))
+            return f"upload_{file_path}"
+
+        self.data_upload_repository.upload.side_effect = upload
+        with pytest.raises(DoccanoAPIError):
+            self.usecase.upload(0, ["a.jsonl", "bad.jsonl", "b.jsonl"], "SequenceLabeling", "JSONL", max_workers=1)
+        reverted = {c.args[0] for c in self.data_upload_repository.delete.call_args_list}
+        assert reverted <= {"upload_a.jsonl", "upload_b.jsonl"}
+        assert "upload_a.jsonl" in reverted
+        self.data_upload_repository.ingest.assert_not_called()
+
+    def test_upload_examples(self):
+        project_id = 0
+        self.data_upload_repository.upload_content.side_effect = ["upload_1", "upload_2"]
+        self.data_upload_repository.ingest.side_effect = ["task_1", "task_2"]
+        examples = (Example(text=str(i)) for i in range(3))
+        self.usecase.upload_examples(project_id, examples, task="SequenceLabeling", chunk_size=2, max_workers=1)
+        assert self.data_upload_repository.upload_content.call_count == 2
+        self.data_upload_repository.ingest.assert_any_call(
+            project_id, ["upload_2"], "SequenceLabeling", "JSONL", column_data="text", column_label="label"
+        )
+        self.task_status_repository.wait_all.assert_called_once_with(["task_1", "task_2"])
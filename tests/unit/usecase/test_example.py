@@ -25,7 +25,7 @@ class TestExampleUseCase:
 
     def test_list(self):
         list(self.usecase.list(0))
-        self.repository.list.assert_called_once_with(0, None)
+        self.repository.list.assert_called_once_with(0, None, 1, None)
 
     def test_create(self, payload):
         project_id = 0
@@ -34,13 +34,15 @@ class TestExampleUseCase:
 
     def test_update(self, payload):
         project_id = 0
-        example = Example(id=1, text="Test text")
-        self.repository.find_by_id.return_value = example
-        self.usecase.update(project_id, example.id, **payload)
-        example.text = payload["text"]
-        self.repository.find_by_id.assert_called_once_with(project_id, example.id)
-        self.repository.update.assert_called_once_with(project_id, example)
+        self.usecase.update(project_id, 1, **payload)
+        self.repository.find_by_id.assert_not_called()
+        self.repository.partial_update.assert_called_once_with(project_id, 1, payload)
 
     def test_delete(self):
         self.usecase.delete(0, 1)
         self.repository.delete.assert_called_once_with(0, 1)
+
+    def test_bulk_update_scores_skips_unchanged(self):
+        list(self.usecase.bulk_update_scores(0, {1: 0.5, 2: 0.3, 3: 0.1}, current={1: 0.5, 2: 0.2}, max_workers=4))
+        updates = self.repository.bulk_partial_update.call_args.args[1]
+        assert list(updates) == [(2, {"score": 0.3}), (3, {"score": 0.1})]
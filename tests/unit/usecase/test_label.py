@@ -20,16 +20,19 @@ class TestLabelUseCase:
         self.label_repository.list.assert_called_once_with(0, 1)
 
     def test_delete(self):
-        label = Label(id=2, example=1)
-        self.label_repository.find_by_id.return_value = label
         self.usecase.delete(0, 1, 2)
-        self.label_repository.find_by_id.assert_called_once_with(0, 1, 2)
-        self.label_repository.delete.assert_called_once_with(0, label)
+        self.label_repository.find_by_id.assert_not_called()
+        self.label_repository.delete_by_id.assert_called_once_with(0, 1, 2)
 
     def test_delete_all(self):
         self.usecase.delete_all(0, 1)
         self.label_repository.delete_all.assert_called_once_with(0, 1)
 
+    def test_bulk_create(self):
+        labels = [Label(example=1), Label(example=2)]
+        list(self.usecase.bulk_create(0, labels, 4))
+        self.label_repository.bulk_create.assert_called_once_with(0, labels, 4)
+
 
 class TestCategoryUseCase:
     @classmethod
@@ -51,8 +54,15 @@ class TestCategoryUseCase:
         self.label_repository.create.assert_called_once_with(self.project_id, self.category)
 
     def test_update(self):
-        self.label_repository.find_by_id.return_value = self.category
-
         self.usecase.update(self.project_id, self.example_id, self.label_id, self.name)
         self.label_type_repository.find_by_name.assert_called_once_with(self.project_id, self.name)
-        self.label_repository.update.assert_called_once_with(self.project_id, self.category)
+        self.label_repository.find_by_id.assert_not_called()
+        self.label_repository.partial_update.assert_called_once_with(
+            self.project_id, self.example_id, self.label_id, {"label": self.label_type_id}
+        )
+
+    def test_update_sends_falsy_values(self):
+        self.usecase.update(self.project_id, self.example_id, self.label_id, human_annotated=False, confidence=0.0)
+        self.label_repository.partial_update.assert_called_once_with(
+            self.project_id, self.example_id, self.label_id, {"manual": False, "prob": 0.0}
+        )
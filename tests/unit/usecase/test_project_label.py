@@ -0,0 +1,126 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from doccano_client.models.example import Example
+from doccano_client.models.label import Category, Relation, Span
+from doccano_client.models.project import ProjectType
+from doccano_client.usecase.project_label import ProjectLabelUseCase
+
+
+class TestProjectLabelUseCase:
+    def setup_method(self):
+        self.example_repository = MagicMock()
+        self.span_repository = MagicMock()
+        self.category_repository = MagicMock()
+        self.label_type_repository = MagicMock()
+        self.project_repository = MagicMock()
+        self.data_download_usecase = MagicMock()
+        self.usecase = ProjectLabelUseCase(
+            self.example_repository,
+            {"span": self.span_repository, "category": self.category_repository, "text": MagicMock()},
+            {
+                "span": self.label_type_repository,
+                "relation": self.label_type_repository,
+                "category": self.label_type_repository,
+            },
+            self.project_repository,
+            self.data_download_usecase,
+        )
+        self.examples = [Example(id=i, text="text") for i in range(5)]
+        self.example_repository.list.return_value = iter(self.examples)
+        self.span_repository.list.side_effect = lambda project_id, example_id: [
+            Span(example=example_id, start_offset=0, end_offset=1, label=1)
+        ]
+
+    def test_iter_labels_fetches_per_example(self):
+        self.example_repository.count.return_value = 10
+        items = list(self.usecase.iter_labels(0, ["span"], max_workers=4))
+        assert [example for example, _ in items] == self.examples
+        assert [labels["span"][0].example for _, labels in items] == list(range(5))
+        self.data_download_usecase.iter_export.assert_not_called()
+
+    def test_iter_labels_skips_export_with_confirmed_filter(self):
+        list(self.usecase.iter_labels(0, ["span"], is_confirmed=True, export_threshold=0))
+        self.example_repository.list.assert_called_once_with(0, True, 8)
+        self.data_download_usecase.iter_export.assert_not_called()
+
+    def test_iter_labels_reads_export_of_large_collaborative_project(self):
+        self.example_repository.count.return_value = 5000
+        self.project_repository.find_by_id.return_value = MagicMock(
+            collaborative_annotation=True, project_type=ProjectType.SEQUENCE_LABELING
+        )
+        self.label_type_repository.find_by_name.side_effect = lambda project_id, name: MagicMock(id=len(name))
+        self.data_download_usecase.iter_export.return_value = iter(
+            [
+                (
+                    Example(id=1, text="foo bar"),
+                    {
+                        "entities": [
+                            {"id": 7, "label": "PER", "start_offset": 0, "end_offset": 3},
+                            {"id": 8, "label": "LOC", "start_offset": 4, "end_offset": 7},
+                        ],
+                        "relations": [{"id": 9, "from_id": 7, "to_id": 8, "type": "lives_in"}],
+                    },
+                )
+            ]
+        )
+        usecase = ProjectLabelUseCase(
+            self.example_repository,
+            {"span": self.span_repository, "relation": MagicMock()},
+            {"span": self.label_type_repository, "relation": self.label_type_repository},
+            self.project_repository,
+            self.data_download_usecase,
+        )
+        ((example, labels),) = list(usecase.iter_labels(0, ["span", "relation"]))
+        self.data_download_usecase.iter_export.assert_called_once_with(0, "JSONL(relation)")
+        assert labels["span"] == [
+            Span(id=7, example=1, start_offset=0, end_offset=3, label=3),
+            Span(id=8, example=1, start_offset=4, end_offset=7, label=3),
+        ]
+        assert labels["relation"] == [Relation(id=9, example=1, from_id=7, to_id=8, type=8)]
+        self.span_repository.list.assert_not_called()
+
+    def test_export_of_categories(self):
+        self.project_repository.find_by_id.return_value = MagicMock(project_type=ProjectType.DOCUMENT_CLASSIFICATION)
+        self.label_type_repository.find_by_name.return_value = MagicMock(id=2)
+        self.data_download_usecase.iter_export.return_value = iter([(Example(id=1), {"label": ["pos"]})])
+        usecase = ProjectLabelUseCase(
+            self.example_repository,
+            {"category": self.category_repository},
+            {"category": self.label_type_repository},
+            self.project_repository,
+            self.data_download_usecase,
+        )
+        ((_, labels),) = list(usecase.iter_labels(0, ["category"], use_export=True))
+        assert labels == {"category": [Category(example=1, label=2)]}
+
+    def test_export_picks_the_column_of_each_type(self):
+        self.project_repository.find_by_id.return_value = MagicMock(
+            project_type=ProjectType.INTENT_DETECTION_AND_SLOT_FILLING
+        )
+        self.label_type_repository.find_by_name.side_effect = lambda project_id, name: MagicMock(id=len(name))
+        self.data_download_usecase.iter_export.return_value = iter(
+            [(Example(id=1, text="foo bar"), {"cats": ["greeting"], "entities": [[0, 3, "PER"]]})]
+        )
+        ((_, labels),) = list(self.usecase.iter_labels(0, ["category", "span"], use_export=True))
+        self.data_download_usecase.iter_export.assert_called_once_with(0, "JSONL")
+        assert labels == {
+            "category": [Category(example=1, label=8)],
+            "span": [Span(example=1, start_offset=0, end_offset=3, label=3)],
+        }
+
+    def test_export_of_spans_ignores_categories_column(self):
+        self.project_repository.find_by_id.return_value = MagicMock(project_type=ProjectType.SEQUENCE_LABELING)
+        self.label_type_repository.find_by_name.side_effect = lambda project_id, name: MagicMock(id=len(name))
+        self.data_download_usecase.iter_export.return_value = iter([(Example(id=1), {"label": [[4, 7, "LOC"]]})])
+        ((_, labels),) = list(self.usecase.iter_labels(0, ["category", "span"], use_export=True))
+        assert labels == {"category": [], "span": [Span(example=1, start_offset=4, end_offset=7, label=3)]}
+
+    def test_export_rejects_unsupported_types(self):
+        with pytest.raises(ValueError):
+            list(self.usecase.iter_labels(0, ["text"], use_export=True))
+
+    def test_unknown_type(self):
+        with pytest.raises(ValueError):
+            list(self.usecase.iter_labels(0, ["keypoint"]))
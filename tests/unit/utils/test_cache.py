@@ -0,0 +1,94 @@
+import pathlib
+import time
+
+import pytest
+
+from doccano_client.utils.cache import CachedResponse, DiskCache, MemoryCache
+
+
+def make_response(url, **headers):
+    return CachedResponse(url, 200, headers, b'{"id": 1}')
+
+
+@pytest.fixture(params=["memory", "disk"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache(maxsize=10, ttl=60)
+    return DiskCache(tmp_path / "cache", ttl=60)
+
+
+def test_set_and_get(cache):
+    cache.set("http://localhost/v1/me", make_response("http://localhost/v1/me", ETag='"abc"'))
+    response = cache.get("http://localhost/v1/me")
+    assert response.content == b'{"id": 1}'
+    assert response.validators() == {"If-None-Match": '"abc"'}
+    assert cache.is_fresh(response)
+    assert cache.get("http://localhost/v1/roles") is None
+
+
+def test_invalidate_under_and_above_written_resource(cache):
+    urls = [
+        "http://localhost/v1/projects/1",
+        "http://localhost/v1/projects/1/examples?limit=10",
+        "http://localhost/v1/projects/1/examples/2",
+        "http://localhost/v1/projects/1/examples/2/spans",
+        "http://localhost/v1/projects/1/category-types",
+        "http://localhost/v1/projects/10/examples",
+    ]
+    for url in urls:
+        cache.set(url, make_response(url))
+    cache.invalidate("http://localhost/v1/projects/1/examples/2")
+    assert sorted(cache.keys()) == [
+        "http://localhost/v1/projects/1/category-types",
+        "http://localhost/v1/projects/10/examples",
+    ]
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", make_response("a"))
+    cache.set("b", make_response("b"))
+    cache.get("a")
+    cache.set("c", make_response("c"))
+    assert sorted(cache.keys()) == ["a", "c"]
+
+
+def test_stale_entry():
+    cache = MemoryCache(ttl=1)
+    response = CachedResponse("a", 200, {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}, b"{}", time.time() - 2)
+    assert not cache.is_fresh(response)
+    assert response.can_revalidate
+
+
+def test_only_allowlisted_resources_are_cacheable():
+    cache = MemoryCache()
+    assert cache.is_cacheable("projects/1/span-types")
+    assert cache.is_cacheable("me")
+    assert not cache.is_cacheable("tasks/status/3f1c9a2e-5d4b-4c8e-9a7f-1b2c3d4e5f60")
+    assert not cache.is_cacheable("projects/1/examples?limit=10&offset=10")
+    assert MemoryCache(resources=["tasks/status/{id}"]).is_cacheable("tasks/status/1")
+
+
+def test_invalidate_every_scope_and_clear_one(cache):
+    for user in ["alice", "bob"]:
+        for url in ["http://localhost/v1/projects/1", "http://localhost/v1/me"]:
+            cache.set(f"{url}#user={user}", make_response(url))
+    cache.invalidate("http://localhost/v1/projects/1/span-types")
+    assert sorted(cache.keys()) == ["http://localhost/v1/me#user=alice", "http://localhost/v1/me#user=bob"]
+    cache.clear("user=alice")
+    assert cache.keys() == ["http://localhost/v1/me#user=bob"]
+    cache.clear()
+    assert cache.keys() == []
+
+
+def test_disk_cache_invalidate_reads_only_affected_directories(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path / "cache")
+    for project_id in range(50):
+        url = f"http://localhost/v1/projects/{project_id}/span-types"
+        cache.set(url, make_response(url))
+    reads, unlinked = [], []
+    monkeypatch.setattr(cache, "_read", reads.append)
+    monkeypatch.setattr(pathlib.Path, "unlink", lambda path, missing_ok=False: unlinked.append(path))
+    cache.invalidate("http://localhost/v1/projects/3")
+    assert reads == []
+    assert [path.parent.parent.name for path in unlinked] == ["3"]
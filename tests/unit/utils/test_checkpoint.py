@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+
+from doccano_client.utils.checkpoint import Checkpoint
+
+
+def test_checkpoint_flushes_every_n_ids(tmp_path):
+    path = tmp_path / "run.ids"
+    checkpoint = Checkpoint(path, flush_every=3)
+    for item_id in [1, 2]:
+        checkpoint.add(item_id)
+    assert path.read_bytes() == b""
+    checkpoint.add(3)
+    assert path.read_bytes() == b"1\n2\n3\n"
+
+
+def test_checkpoint_resumes_after_an_interrupted_run(tmp_path):
+    path = tmp_path / "predict" / "1" / "run.ids"
+    checkpoint = Checkpoint(path, flush_every=2)
+    for item_id in range(5):
+        checkpoint.add(item_id)
+    # the process is killed in the middle of writing the next ids.
+    with path.open("ab") as f:
+        f.write(b"5\n6")
+
+    resumed = Checkpoint(path, flush_every=2)
+    assert len(resumed) == 5
+    assert 3 in resumed and 5 in resumed
+    assert 4 not in resumed and 6 not in resumed
+    resumed.add(4)
+    resumed.add(6)
+    assert path.read_bytes() == b"0\n1\n2\n3\n5\n4\n6\n"
+    assert len(Checkpoint(path)) == 7
+
+
+def test_checkpoint_starts_over_without_resume(tmp_path):
+    path = tmp_path / "run.ids"
+    with Checkpoint(path) as checkpoint:
+        checkpoint.add(1)
+    assert 1 in Checkpoint(path)
+    assert len(Checkpoint(path, resume=False)) == 0
+    assert path.read_bytes() == b""
+
+
+def test_checkpoint_add_is_thread_safe(tmp_path):
+    path = tmp_path / "run.ids"
+    checkpoint = Checkpoint(path, flush_every=7)
+
+    def add(start):
+        for item_id in range(start, start + 100):
+            checkpoint.add(item_id)
+
+    threads = [threading.Thread(target=add, args=(start,)) for start in range(0, 400, 100)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    checkpoint.flush()
+    assert sorted(int(line) for line in path.read_bytes().split()) == list(range(400))
+
+
+def test_checkpoint_rejects_invalid_flush_every(tmp_path):
+    with pytest.raises(ValueError):
+        Checkpoint(tmp_path / "run.ids", flush_every=0)
@@ -0,0 +1,48 @@
+import threading
+import time
+
+import pytest
+
+from doccano_client.utils.concurrency import ordered_map
+
+
+def test_ordered_map_keeps_input_order():
+    def slow_square(x):
+        time.sleep(0.01 * (5 - x))
+        return x * x
+
+    assert list(ordered_map(slow_square, range(5), max_workers=3)) == [0, 1, 4, 9, 16]
+
+
+def test_ordered_map_bounds_in_flight_calls():
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def track(x):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return x
+
+    assert list(ordered_map(track, range(20), max_workers=4)) == list(range(20))
+    assert peak <= 4
+
+
+def test_ordered_map_raises_error():
+    def fail(x):
+        if x == 2:
+            raise RuntimeError("boom")
+        return x
+
+    with pytest.raises(RuntimeError):
+        list(ordered_map(fail, range(5), max_workers=2))
+
+
+def test_ordered_map_rejects_invalid_workers():
+    with pytest.raises(ValueError):
+        list(ordered_map(str, range(5), max_workers=0))
@@ -0,0 +1,53 @@
+import pytest
+
+from doccano_client.utils.instrumentation import (
+    RequestEvent,
+    StatsCollector,
+    percentile,
+    resource_template,
+)
+
+
+@pytest.mark.parametrize(
+    "resource,expected",
+    [
+        ("projects/1/examples/23/spans", "projects/{id}/examples/{id}/spans"),
+        ("projects/1/examples?limit=10", "projects/{id}/examples"),
+        ("tasks/status/5f0c8c9e-6c4a-4c1b-9d0a-1a2b3c4d5e6f", "tasks/status/{id}"),
+        ("me", "me"),
+    ],
+)
+def test_resource_template(resource, expected):
+    assert resource_template(resource) == expected
+
+
+def test_percentile():
+    values = [float(i) for i in range(1, 101)]
+    assert [percentile(values, q) for q in (50, 95, 99)] == [50.0, 95.0, 99.0]
+    assert percentile([], 50) == 0.0
+
+
+def make_event(resource, elapsed, status=200, error=None):
+    event = RequestEvent("get", resource)
+    event.finish(status, 10, error)
+    event.elapsed = elapsed
+    return event
+
+
+def test_stats_collector():
+    collector = StatsCollector()
+    for i in range(1, 101):
+        collector.after_response(make_event(f"projects/1/examples/{i}", i / 1000))
+    collector.on_error(make_event("projects/1/examples/1", 0.5, 404, error=ValueError()))
+    collector.after_response(make_event("me", 0.001))
+    examples, me = collector.stats()
+    assert (examples.method, examples.template) == ("GET", "projects/{id}/examples/{id}")
+    assert examples.count == 101 and examples.errors == 1
+    assert examples.error_rate == pytest.approx(1 / 101)
+    assert examples.p50 == pytest.approx(0.051)
+    assert examples.p99 == pytest.approx(0.1)
+    assert examples.bytes == 1010
+    assert me.count == 1
+    assert "projects/{id}/examples/{id}" in collector.report()
+    collector.reset()
+    assert collector.stats() == []
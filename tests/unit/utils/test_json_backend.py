@@ -0,0 +1,33 @@
+import pytest
+
+from doccano_client.utils.json_backend import BACKENDS, get_json_backend
+
+
+def installed_backends():
+    names = []
+    for name in BACKENDS:
+        try:
+            get_json_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+@pytest.mark.parametrize("name", installed_backends())
+def test_round_trip(name):
+    backend = get_json_backend(name)
+    obj = {"text": "東京 café", "meta": {"score": 0.5, "tags": [1, None, True]}}
+    encoded = backend.dumps(obj)
+    assert isinstance(encoded, bytes)
+    assert backend.loads(encoded) == obj
+    assert backend.loads(encoded.decode("utf-8")) == obj
+
+
+def test_default_prefers_installed_fast_backend():
+    assert get_json_backend().name == installed_backends()[0]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_json_backend("simplejson")
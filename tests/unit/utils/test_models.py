@@ -0,0 +1,26 @@
+import pytest
+from pydantic import ValidationError
+
+from doccano_client.models.example import Example
+from doccano_client.models.label import Span
+from doccano_client.utils.models import construct, model_parser, validate_fields
+
+
+def test_construct_drops_unknown_keys_and_fills_defaults():
+    example = construct(Example, {"id": 1, "text": "foo", "url": "http://localhost/1"})
+    assert example == Example(id=1, text="foo")
+    assert example.dict() == Example(id=1, text="foo").dict()
+
+
+def test_model_parser():
+    data = {"example": 1, "start_offset": 1, "end_offset": 0, "label": 1}
+    with pytest.raises(ValidationError):
+        model_parser(Span)(data)
+    assert model_parser(Span, trusted=True)(data).end_offset == 0
+
+
+def test_validate_fields_runs_root_validators_of_given_fields():
+    assert validate_fields(Span, {"start_offset": "1", "end_offset": 2}) == {"start_offset": 1, "end_offset": 2}
+    assert validate_fields(Span, {"start_offset": 3}) == {"start_offset": 3}
+    with pytest.raises(ValidationError, match="start_offset must be less than end_offset"):
+        validate_fields(Span, {"start_offset": 3, "end_offset": 2})
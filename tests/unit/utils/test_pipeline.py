@@ -0,0 +1,131 @@
+import threading
+import time
+
+import pytest
+
+from doccano_client.utils.pipeline import Pipeline, Stage
+
+
+def test_pipeline_runs_items_through_stages():
+    results = []
+    lock = threading.Lock()
+
+    def collect(x):
+        with lock:
+            results.append(x)
+
+    pipeline = Pipeline([Stage("double", lambda x: x * 2, workers=3), Stage("collect", collect)])
+    stats = pipeline.run(range(10))
+    assert sorted(results) == [x * 2 for x in range(10)]
+    assert [(s.name, s.processed) for s in stats] == [("fetch", 10), ("double", 10), ("collect", 10)]
+
+
+def test_pipeline_stream_stage_receives_an_iterator():
+    results = []
+
+    def pairs(items):
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) == 2:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    pipeline = Pipeline([Stage("batch", pairs, stream=True), Stage("collect", results.append)])
+    stats = pipeline.run(range(5))
+    assert results == [[0, 1], [2, 3], [4]]
+    assert stats[1].processed == 5
+    assert stats[2].processed == 3
+
+
+def test_pipeline_drops_none_outputs():
+    results = []
+    pipeline = Pipeline([Stage("filter", lambda x: x if x % 2 else None), Stage("collect", results.append)])
+    pipeline.run(range(6))
+    assert results == [1, 3, 5]
+
+
+def test_pipeline_applies_backpressure():
+    fetched = 0
+
+    def produce():
+        nonlocal fetched
+        for i in range(100):
+            fetched += 1
+            yield i
+
+    release = threading.Event()
+    pipeline = Pipeline([Stage("slow", lambda x: release.wait())], queue_size=2)
+    thread = threading.Thread(target=pipeline.run, args=(produce(),))
+    thread.start()
+    time.sleep(0.2)
+    assert fetched <= 5
+    release.set()
+    thread.join()
+    assert fetched == 100
+
+
+@pytest.mark.parametrize("failing_stage", ["fetch", "work"])
+def test_pipeline_raises_first_error(failing_stage):
+    def produce():
+        yield 1
+        if failing_stage == "fetch":
+            raise RuntimeError("boom")
+        yield from range(1000)
+
+    def work(x):
+        if failing_stage == "work" and x == 5:
+            raise RuntimeError("boom")
+        return x
+
+    pipeline = Pipeline([Stage("work", work, workers=2), Stage("sink", lambda x: None)])
+    with pytest.raises(RuntimeError, match="boom"):
+        pipeline.run(produce())
+
+
+def test_stage_rejects_invalid_workers():
+    with pytest.raises(ValueError):
+        Stage("stage", lambda x: x, workers=0)
+    with pytest.raises(ValueError):
+        Stage("stage", lambda x: x, workers=2, stream=True)
+
+
+def test_pipeline_report_lists_every_stage():
+    pipeline = Pipeline([Stage("predict", lambda x: x)])
+    pipeline.run(range(3))
+    lines = pipeline.report().splitlines()
+    assert lines[0].startswith("fetch: 3 items")
+    assert lines[1].startswith("predict: 3 items")
+
+
+def test_pipeline_calls_on_stop_when_a_stage_fails():
+    release = threading.Event()
+
+    def wait(x):
+        if x > 0:
+            release.wait()
+        return x
+
+    def fail(x):
+        raise RuntimeError("boom")
+
+    pipeline = Pipeline([Stage("wait", wait, workers=2, on_stop=release.set), Stage("fail", fail)], queue_size=1)
+    with pytest.raises(RuntimeError, match="boom"):
+        pipeline.run(range(10))
+    assert release.is_set()
+
+
+def test_pipeline_runs_on_stop_once_when_stages_fail_together():
+    calls = []
+    barrier = threading.Barrier(4)
+
+    def fail(x):
+        barrier.wait()
+        raise RuntimeError("boom")
+
+    pipeline = Pipeline([Stage("fail", fail, workers=4, on_stop=lambda: calls.append(1))])
+    with pytest.raises(RuntimeError, match="boom"):
+        pipeline.run(range(4))
+    assert calls == [1]
@@ -0,0 +1,57 @@
+import time
+from email.utils import formatdate
+from unittest.mock import MagicMock
+
+import pytest
+
+from doccano_client.utils.retry import RetryPolicy, parse_retry_after
+
+
+def make_response(status_code=503, headers=None):
+    return MagicMock(status_code=status_code, headers=headers or {})
+
+
+@pytest.mark.parametrize(
+    "method,status_code,attempt,expected",
+    [
+        ("GET", 503, 1, True),
+        ("get", 429, 2, True),
+        ("GET", 503, 3, False),
+        ("GET", 500, 1, False),
+        ("POST", 503, 1, False),
+        ("DELETE", 502, 1, True),
+    ],
+)
+def test_should_retry(method, status_code, attempt, expected):
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry(method, make_response(status_code), attempt) is expected
+
+
+def test_should_retry_opted_in_method():
+    policy = RetryPolicy(methods=["GET", "POST"])
+    assert policy.should_retry("POST", make_response(), 1)
+
+
+def test_delay_backs_off_exponentially():
+    policy = RetryPolicy(backoff=1, backoff_factor=2, max_backoff=5, jitter=False)
+    assert [policy.delay(make_response(), attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_delay_with_jitter():
+    policy = RetryPolicy(backoff=1, backoff_factor=2)
+    assert all(0 <= policy.delay(make_response(), 2) <= 2 for _ in range(100))
+
+
+def test_delay_respects_retry_after():
+    policy = RetryPolicy(max_backoff=10)
+    assert policy.delay(make_response(headers={"Retry-After": "4"}), 1) == 4
+    assert policy.delay(make_response(headers={"Retry-After": "120"}), 1) == 10
+
+
+@pytest.mark.parametrize("value,expected", [(None, None), ("", None), ("3", 3.0), ("-1", 0.0), ("soon", None)])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert 0 < parse_retry_after(formatdate(usegmt=True, timeval=time.time() + 30)) <= 30
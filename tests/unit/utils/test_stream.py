@@ -0,0 +1,72 @@
+import io
+import zipfile
+
+import pytest
+
+from doccano_client.utils.stream import iter_lines, iter_zip_entries
+
+
+def split(content, size):
+    return (content[i : i + size] for i in range(0, len(content), size))
+
+
+class UnseekableWriter(io.RawIOBase):
+    def __init__(self):
+        self.content = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.content.extend(data)
+        return len(data)
+
+
+FILES = {
+    "a.jsonl": b"".join(b'{"text": "%d"}\n' % i for i in range(2000)),
+    "b.jsonl": b"x\ny\n",
+    "empty.jsonl": b"",
+}
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_iter_zip_entries(compression, chunk_size):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as archive:
+        for name, content in FILES.items():
+            archive.writestr(name, content)
+    entries = iter_zip_entries(split(buffer.getvalue(), chunk_size), chunk_size=100)
+    assert {name: b"".join(content) for name, content in entries} == FILES
+
+
+def test_iter_zip_entries_with_data_descriptor():
+    writer = UnseekableWriter()
+    with zipfile.ZipFile(writer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in FILES.items():
+            with archive.open(name, "w") as f:
+                f.write(content)
+    entries = iter_zip_entries(split(bytes(writer.content), 13))
+    assert {name: b"".join(content) for name, content in entries} == FILES
+
+
+def test_iter_zip_entries_skips_unread_entries():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in FILES.items():
+            archive.writestr(name, content)
+    names = [name for name, _ in iter_zip_entries(split(buffer.getvalue(), 50))]
+    assert names == list(FILES)
+
+
+def test_iter_zip_entries_raises_error_if_truncated():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("a.jsonl", FILES["a.jsonl"])
+    with pytest.raises(ValueError):
+        for _, content in iter_zip_entries([buffer.getvalue()[:200]]):
+            list(content)
+
+
+def test_iter_lines():
+    assert list(iter_lines([b"a\nb", b"c\r\n", b"\n", b"d"])) == [b"a", b"bc", b"d"]